@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Benchmark the medication extraction and integration stages
+
+Runs without the proprietary EML PDF: lines are sampled from the descriptions
+in extracted-medications.json and a small PDF is generated from them. Each stage
+runs in a fresh process so its peak RSS can be reported on its own. Results are
+compared against benchmark-baseline.json and a throughput regression beyond the
+threshold fails the run.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+from script_loader import SCRIPTS_DIR, load_script
+
+PROJECT_ROOT = SCRIPTS_DIR.parent
+CORPUS_SOURCE = PROJECT_ROOT / 'extracted-medications.json'
+BASELINE_PATH = SCRIPTS_DIR / 'benchmark-baseline.json'
+
+LINES_PER_PAGE = 40
+
+def build_corpus(line_count, seed):
+    """Sample a deterministic synthetic corpus of lines from extracted descriptions"""
+    with open(CORPUS_SOURCE, 'r', encoding='utf-8') as f:
+        descriptions = [med['description'] for med in json.load(f) if med.get('description')]
+    rng = random.Random(seed)
+    return [rng.choice(descriptions) for _ in range(line_count)]
+
+def build_pdf(lines, pdf_path):
+    """Write the corpus lines into a simple multi-page PDF"""
+    import fitz
+    doc = fitz.open()
+    for start in range(0, len(lines), LINES_PER_PAGE):
+        page = doc.new_page()
+        y = 40
+        for line in lines[start:start + LINES_PER_PAGE]:
+            page.insert_text((30, y), line[:110], fontsize=7)
+            y += 18
+    doc.save(pdf_path)
+    doc.close()
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, if it can be measured"""
+    if HAS_RESOURCE:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    if HAS_PSUTIL:
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+    return None
+
+def stage_parse_medication_line(work):
+    module = load_script('extract-formulary-medications.py')
+    start = time.perf_counter()
+    for line in work['lines']:
+        module.parse_medication_line(line)
+    return len(work['lines']), time.perf_counter() - start
+
+def stage_try_parse_medication_line(work):
+    module = load_script('extract-medications-from-pdf.py')
+    start = time.perf_counter()
+    for line in work['lines']:
+        module.try_parse_medication_line(line)
+    return len(work['lines']), time.perf_counter() - start
+
+def stage_determine_category(work):
+    module = load_script('extract-formulary-medications.py')
+    start = time.perf_counter()
+    for line in work['lines']:
+        module.determine_category(line)
+    return len(work['lines']), time.perf_counter() - start
+
+def stage_dedup(work):
+    module = load_script('extract-formulary-medications.py')
+    records = [med for med in map(module.parse_medication_line, work['lines']) if med]
+    start = time.perf_counter()
+    for _ in module.iter_unique_medications(records):
+        pass
+    return len(records), time.perf_counter() - start
+
+def stage_pdf_extraction(work):
+    module = load_script('extract-formulary-medications.py')
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in module.extract_medications_from_pdf(work['pdf_path']):
+            pass
+    return work['page_count'], time.perf_counter() - start
+
+def stage_integrate(work):
+    module = load_script('integrate-medications.py')
+    module_path = Path(work['tmp_dir']) / 'saFormulary2024.generated.ts'
+    module_path.unlink(missing_ok=True)
+    start = time.perf_counter()
+    stats, _ = module.integrate_medications(module.iter_medication_records(work['records_path']), module_path)
+    return stats['found'], time.perf_counter() - start
+
+# name -> (function, throughput unit)
+STAGES = {
+    'parse_medication_line': (stage_parse_medication_line, 'lines/sec'),
+    'try_parse_medication_line': (stage_try_parse_medication_line, 'lines/sec'),
+    'determine_category': (stage_determine_category, 'lines/sec'),
+    'dedup': (stage_dedup, 'records/sec'),
+    'pdf_extraction': (stage_pdf_extraction, 'pages/sec'),
+    'integrate': (stage_integrate, 'records/sec'),
+}
+
+def _run_stage(name, work):
+    """Child process entry point: run one stage and report throughput and peak RSS"""
+    function, _ = STAGES[name]
+    units, seconds = function(work)
+    return units, seconds, peak_rss_mb()
+
+def run_stage(name, work, repeat):
+    """Run a stage `repeat` times in fresh processes and keep the fastest run"""
+    best = None
+    for _ in range(repeat):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            units, seconds, rss = executor.submit(_run_stage, name, work).result()
+        throughput = units / seconds if seconds > 0 else float('inf')
+        if best is None or throughput > best['throughput']:
+            best = {'throughput': round(throughput, 1), 'unit': STAGES[name][1],
+                    'units': units, 'seconds': round(seconds, 4), 'peak_rss_mb': rss}
+    return best
+
+def compare_to_baseline(results, baseline, threshold):
+    """Return the stages whose throughput dropped more than threshold below baseline"""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get('stages', {}).get(name, {}).get('throughput')
+        if expected and result['throughput'] < expected * (1 - threshold):
+            regressions.append((name, expected, result['throughput']))
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark medication extraction and integration stages')
+    parser.add_argument('--lines', type=int, default=20000, help='Synthetic corpus size (default: 20000)')
+    parser.add_argument('--pages', type=int, default=50, help='Pages in the generated PDF (default: 50)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per stage, fastest is kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=2024, help='Corpus sampling seed')
+    parser.add_argument('--stages', nargs='+', choices=sorted(STAGES), help='Only run these stages')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed throughput drop vs baseline before failing (default: 0.25)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='Baseline file to compare against')
+    parser.add_argument('--update-baseline', action='store_true', help='Write these results as the new baseline')
+    parser.add_argument('--output', type=Path, help='Also write the results as JSON to this path')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    stage_names = args.stages or list(STAGES)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lines = build_corpus(args.lines, args.seed)
+        work = {'lines': lines, 'tmp_dir': tmp_dir}
+
+        if 'pdf_extraction' in stage_names:
+            pdf_lines = build_corpus(args.pages * LINES_PER_PAGE, args.seed + 1)
+            work['pdf_path'] = str(Path(tmp_dir) / 'synthetic.pdf')
+            work['page_count'] = args.pages
+            build_pdf(pdf_lines, work['pdf_path'])
+
+        if 'integrate' in stage_names:
+            with open(CORPUS_SOURCE, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            work['records_path'] = str(Path(tmp_dir) / 'records.jsonl')
+            with open(work['records_path'], 'w', encoding='utf-8') as f:
+                for med in records:
+                    f.write(json.dumps(med, ensure_ascii=False) + '\n')
+
+        print(f"Benchmarking {len(stage_names)} stages ({args.lines} lines, {args.pages} pages, best of {args.repeat})")
+        results = {}
+        for name in stage_names:
+            results[name] = run_stage(name, work, args.repeat)
+            result = results[name]
+            rss = f"{result['peak_rss_mb']} MB" if result['peak_rss_mb'] is not None else 'n/a'
+            print(f"  {name:28} {result['throughput']:>12,.1f} {result['unit']:12} peak RSS {rss}")
+
+    report = {'settings': {'lines': args.lines, 'pages': args.pages, 'seed': args.seed},
+              'stages': results}
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\nBaseline updated: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}, run with --update-baseline to create one")
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    if baseline.get('settings') != report['settings']:
+        print(f"\nWarning: baseline was recorded with different settings {baseline.get('settings')}")
+
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressions beyond {args.threshold:.0%} of baseline:")
+        for name, expected, actual in regressions:
+            print(f"  - {name}: {actual:,.1f} vs baseline {expected:,.1f} {results[name]['unit']}")
+        sys.exit(1)
+
+    print(f"\nNo regressions beyond {args.threshold:.0%} of baseline")
+
+if __name__ == '__main__':
+    main()
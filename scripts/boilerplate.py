@@ -0,0 +1,79 @@
+"""
+Cross-page boilerplate detection
+
+Running headers, footers and credit lines (the health.gov.za URL, page
+numbers, sponsor and copyright notices) repeat on a large share of a
+document's pages. One pass over a sample of pages counts, for every
+normalised line, how many pages it appears on; lines found on at least
+DEFAULT_SHARE of the sampled pages are that document's boilerplate. Lines
+with a dose ("Amoxicillin, oral, 10–20 mg/kg") are never learnt, however
+often a regimen repeats. While
+parsing, each line is normalised without regexes and dropped with a set
+lookup before any parsing rule sees it.
+"""
+
+import re
+
+# Digits become '#', so "Page 12" and "Page 13" share one fingerprint
+_DIGITS = str.maketrans('0123456789', '##########')
+
+# Share of sampled pages a line must appear on to count as boilerplate
+DEFAULT_SHARE = 0.25
+
+# Too few pages to tell a running header from a repeated sentence
+MIN_PAGES = 3
+
+# Pages read by the learning pass, evenly spaced through the document
+SAMPLE_PAGES = 100
+
+# Shorter lines ("mg", "20 mg/kg") may be pieces of wrapped doses
+MIN_LENGTH = 10
+
+# A number followed by a unit, as the extractor's page prefilter looks for,
+# on a normalised line (digits already replaced by '#')
+DOSE = re.compile(r'#\s*(?:mg|mcg|micrograms?|g|ml|mmol|%|units?|iu)\b')
+
+def normalize_line(line):
+    return ' '.join(line.lower().translate(_DIGITS).split())
+
+def sample_pages(page_count, limit=SAMPLE_PAGES):
+    """Evenly spaced page numbers, all of them for short documents"""
+    if page_count <= limit:
+        return list(range(page_count))
+    return sorted({page_count * i // limit for i in range(limit)})
+
+def learn_boilerplate(page_texts, share=DEFAULT_SHARE):
+    """Frozen set of normalised lines repeated on at least `share` of the pages"""
+    counts = {}
+    pages = 0
+    for text in page_texts:
+        pages += 1
+        for line in {normalize_line(line) for line in text.split('\n')}:
+            if len(line) >= MIN_LENGTH:
+                counts[line] = counts.get(line, 0) + 1
+
+    if pages < MIN_PAGES or share <= 0:
+        return frozenset()
+    threshold = max(MIN_PAGES, share * pages)
+    return frozenset(line for line, count in counts.items()
+                     if count >= threshold and not DOSE.search(line))
+
+def iter_content_lines(lines, boilerplate, stats=None):
+    """Lines that are not boilerplate, counting the dropped ones in stats['boilerplate']"""
+    if not boilerplate:
+        yield from lines
+        return
+    for line in lines:
+        if normalize_line(line) in boilerplate:
+            if stats is not None:
+                stats['boilerplate'] += 1
+            continue
+        yield line
+
+def strip_boilerplate(text, boilerplate):
+    """(page text without its boilerplate lines, number of lines dropped)"""
+    if not boilerplate:
+        return text, 0
+    lines = text.split('\n')
+    kept = [line for line in lines if normalize_line(line) not in boilerplate]
+    return '\n'.join(kept), len(lines) - len(kept)
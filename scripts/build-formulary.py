@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Build the formulary in one process: extract -> clean -> integrate
+
+Runs the same stages as extract-formulary-medications.py followed by
+integrate-medications.py, but records are handed from stage to stage in
+memory instead of through a JSON file, and the extractor and integrator are
+imported once. Only the outputs the stages exist for are written (the
+generated TypeScript module, search index, shards and merge report), plus
+per-stage JSON Lines dumps when --dump-dir is given for debugging.
+
+Stages:
+- extract: PDF pages -> filtered, deduplicated records (optionally with
+  canonical names)
+- clean: drop records that are not valid formulary entries, optionally merge
+  near-duplicates
+- integrate: merge against the curated entries and emit TypeScript/JSON
+
+Skipped stages are bridged through files: without extract, records are read
+from --input; without integrate, the last stage's records go to --output.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from boilerplate import DEFAULT_SHARE
+from formulary_merge import FormularyIndex
+from formulary_shards import SHARDS_DIR
+from formulary_ts import FORMULARY_PATH, load_formulary
+from medication_io import iter_medication_records, write_medications
+from medication_record import as_dict
+from name_canonicalizer import NameCanonicalizer
+from near_dedup import DEFAULT_THRESHOLD, merge_near_duplicates, write_cluster_report
+from page_cache import DEFAULT_MAX_BYTES
+from pdf_batch import load_batch
+from script_loader import SCRIPTS_DIR, load_script
+
+PROJECT_ROOT = SCRIPTS_DIR.parent
+EXTRACTED_PATH = PROJECT_ROOT / 'extracted-medications-2024.jsonl'
+MODULE_PATH = PROJECT_ROOT / 'src' / 'services' / 'saFormulary2024.generated.ts'
+
+STAGES = ('extract', 'clean', 'integrate')
+
+def iter_dumped(medications, dump_path):
+    """Pass records through, writing each one to a JSON Lines dump"""
+    with open(dump_path, 'w', encoding='utf-8') as f:
+        for med in medications:
+            f.write(json.dumps(as_dict(med), ensure_ascii=False) + '\n')
+            yield med
+
+def iter_counted(medications, counts, stage):
+    for med in medications:
+        counts[stage] += 1
+        yield med
+
+def run_extract(extractor, args):
+    """Records of the PDF (or batch), as the extractor would write them"""
+    extractor.require_pymupdf()
+    cache_options = None
+    if not args.no_cache:
+        cache_options = {
+            'path': str(extractor.CACHE_PATH),
+            'rules_version': extractor.RULES_VERSION,
+            'max_bytes': args.cache_size_mb * 1024 * 1024,
+        }
+    canonicalizer = None
+    if args.canonicalize:
+        canonicalizer = NameCanonicalizer(extractor.canonical_vocabulary(args.vocabulary))
+        print(f"Canonicalising names against {len(canonicalizer)} reference names")
+
+    workers = args.workers or os.cpu_count() or 1
+    if args.batch:
+        documents = load_batch(args.batch)
+        print(f"Extracting medications from {len(documents)} PDFs...")
+        medications = extractor.extract_medications_from_batch(
+            documents, workers=workers, cache_options=cache_options, prefilter=args.prefilter,
+            boilerplate_share=args.boilerplate_share, canonicalizer=canonicalizer,
+            chapters=args.chapters, chapter_categories=not args.no_chapter_categories)
+    else:
+        print(f"Extracting medications from {args.pdf.name}...")
+        medications = extractor.extract_medications_from_pdf(
+            args.pdf, workers=workers, cache_options=cache_options, prefilter=args.prefilter,
+            boilerplate_share=args.boilerplate_share, canonicalizer=canonicalizer,
+            chapters=args.chapters, chapter_categories=not args.no_chapter_categories)
+    return medications, canonicalizer
+
+def run_clean(integrator, medications, args, stats):
+    """Valid formulary records only, optionally with near-duplicates merged"""
+    medications = integrator.iter_valid_medications(medications, stats)
+    if args.near_dedup:
+        # Clustering needs every record, so the pipeline stops streaming here
+        medications, clusters = merge_near_duplicates(list(medications), args.similarity)
+        report_path = write_cluster_report(clusters, args.input)
+        print(f"Merged near-duplicates into {len(medications)} records, {len(clusters)} clusters reported in {report_path}")
+    return medications
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Extract, clean and integrate the formulary in one process')
+    parser.add_argument('pdf', nargs='?', type=Path,
+                        help='PDF to extract (defaults to the 2024 EML in the project root)')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES),
+                        help='Stages to run, in pipeline order (default: all)')
+    parser.add_argument('--input', type=Path, default=EXTRACTED_PATH,
+                        help='Records to start from when extract is skipped; also names the merge and cluster '
+                             'reports (default: extracted-medications-2024.jsonl in the project root)')
+    parser.add_argument('--output', type=Path, default=EXTRACTED_PATH,
+                        help='Where the records go when integrate is skipped (default: as --input, which is '
+                             'then replaced once every record is written)')
+    parser.add_argument('--dump-dir', type=Path,
+                        help='Also write every stage\'s records to <stage>.jsonl in this directory (debugging)')
+    parser.add_argument('--batch', type=Path,
+                        help='Extract every PDF in this directory or manifest instead of one PDF')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for extraction (0 = one per CPU, default: 1)')
+    parser.add_argument('--no-cache', action='store_true', help='Parse every page, bypassing the page cache')
+    parser.add_argument('--cache-size-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help='Page cache size limit in MB')
+    parser.add_argument('--boilerplate-share', type=float, default=DEFAULT_SHARE, metavar='FRACTION',
+                        help=f'Share of sampled pages a line must repeat on to be dropped (default: {DEFAULT_SHARE})')
+    parser.add_argument('--prefilter', choices=['on', 'measure'],
+                        help='Skip pages without a dose before parsing their lines')
+    parser.add_argument('--chapters', nargs='+', metavar='CHAPTER',
+                        help='Only extract these chapters of the PDF outline, by number or part of the title')
+    parser.add_argument('--no-chapter-categories', action='store_true',
+                        help='Categorise every line by its keywords, not by the outline chapter it is in')
+    parser.add_argument('--canonicalize', action='store_true',
+                        help='Map generic names to the closest curated or known name during extraction')
+    parser.add_argument('--vocabulary', type=Path, metavar='PATH',
+                        help='Extra reference names for --canonicalize, one per line')
+    parser.add_argument('--near-dedup', action='store_true',
+                        help='Merge near-duplicate names/strengths while cleaning')
+    parser.add_argument('--similarity', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Name similarity needed to merge in --near-dedup mode (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--format', choices=['ts', 'shards', 'both'], default='ts',
+                        help='What integrate writes, as for integrate-medications.py (default: ts)')
+    parser.add_argument('--shard-by', choices=['category', 'letter'], default='category',
+                        help='Split shards per category or per first letter of the generic name')
+    parser.add_argument('--shards-dir', type=Path, default=SHARDS_DIR,
+                        help='Where to write shards and manifest.json (default: public/formulary)')
+    parser.add_argument('--no-merge', action='store_true',
+                        help='Integrate every record without checking it against the curated SA_MEDICATIONS')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    stages = [stage for stage in STAGES if stage in args.stages]
+    started = time.perf_counter()
+
+    extractor = None
+    if 'extract' in stages:
+        extractor = load_script('extract-formulary-medications.py')
+        if args.batch:
+            if not args.batch.exists():
+                print(f"Error: batch directory or manifest not found: {args.batch}")
+                sys.exit(1)
+        else:
+            args.pdf = args.pdf or extractor.find_default_pdf(PROJECT_ROOT)
+            if not args.pdf or not args.pdf.exists():
+                print("Error: PDF file not found. Pass its path or place the 2024 EML in the project root")
+                sys.exit(1)
+        if args.chapters:
+            extractor.require_pymupdf()
+            extractor.check_chapter_selection(
+                [document['path'] for document in load_batch(args.batch)] if args.batch else [args.pdf], args.chapters)
+        if args.vocabulary and not args.vocabulary.exists():
+            print(f"Error: vocabulary file not found: {args.vocabulary}")
+            sys.exit(1)
+    elif not args.input.exists():
+        print(f"Error: input records not found: {args.input}")
+        print("Run the extract stage or pass --input")
+        sys.exit(1)
+
+    integrator = load_script('integrate-medications.py')
+    if args.dump_dir:
+        args.dump_dir.mkdir(parents=True, exist_ok=True)
+
+    canonicalizer = None
+    counts = dict.fromkeys(stages, 0)
+    if extractor is not None:
+        medications, canonicalizer = run_extract(extractor, args)
+    else:
+        medications = iter_medication_records(args.input)
+
+    clean_stats = {'found': 0, 'valid': 0}
+    for stage in stages:
+        if stage == 'clean':
+            medications = run_clean(integrator, medications, args, clean_stats)
+        if stage == 'integrate':
+            break
+        medications = iter_counted(medications, counts, stage)
+        if args.dump_dir:
+            medications = iter_dumped(medications, args.dump_dir / f'{stage}.jsonl')
+
+    if 'integrate' in stages:
+        if integrator.remove_legacy_block(FORMULARY_PATH):
+            print("Removed legacy inline 2024 block from southAfricanFormulary.ts")
+        curated = load_formulary(FORMULARY_PATH, generated_path=None)
+        index = None if args.no_merge else FormularyIndex(curated)
+        integrator.run_integration(medications, curated, MODULE_PATH, index, args.input, args.format,
+                                   args.shard_by, args.shards_dir)
+    else:
+        # --output may be the --input still being read: write_medications only
+        # replaces it once the last record is through
+        count = write_medications(medications, args.output)
+        print(f"Saved {count} records to {args.output}")
+
+    if 'extract' in counts:
+        print(f"Extracted {counts['extract']} unique medications")
+    if 'clean' in counts:
+        print(f"Cleaned to {counts['clean']} records ({clean_stats['found'] - clean_stats['valid']} invalid dropped)")
+    if canonicalizer is not None:
+        canonicalizer.report()
+    if args.dump_dir:
+        print(f"Stage dumps in {args.dump_dir}")
+    print(f"Pipeline ({', '.join(stages)}) finished in {time.perf_counter() - started:.1f}s")
+
+if __name__ == '__main__':
+    main()
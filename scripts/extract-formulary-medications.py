@@ -6,10 +6,30 @@ Improved version that filters out junk and extracts actual medications
 """
 
 import re
-import json
+import os
 import sys
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 
+from boilerplate import DEFAULT_SHARE, learn_boilerplate, sample_pages, strip_boilerplate
+from extraction_checkpoint import DEFAULT_INTERVAL, ExtractionCheckpoint, source_fingerprint
+from extraction_profile import ExtractionProfile, profile_report_path, write_profile_report
+from keyword_classifier import KeywordClassifier
+from line_features import first_span_text, join_wrapped_lines, tokenize_line
+from medication_io import iter_medications, write_medications
+from medication_record import MedicationRecord
+from name_canonicalizer import NameCanonicalizer, iter_canonicalized, reference_names, vocabulary_files
+from near_dedup import DEFAULT_THRESHOLD, merge_near_duplicates, write_cluster_report
+from page_cache import DEFAULT_MAX_BYTES, PageCache, fingerprint_files
+from pdf_batch import load_batch
+from pdf_chapters import read_chapter_index
+from preview_sample import PreviewSample, full_run_shares, page_strata, report_preview, stratified_sample
+from strength import strength_key
+from strength_index import StrengthIndexBuilder, iter_indexed, write_strength_index
+
 try:
     import fitz  # PyMuPDF
     HAS_PYMUPDF = True
@@ -35,96 +55,168 @@ KNOWN_MEDICATIONS = {
     'morphine', 'codeine', 'tramadol', 'oxycodone'
 }
 
-def is_likely_medication(text):
+# Lines matching any of these are obviously not medications
+SKIP_RULES = [
+    r'^https?://',
+    r'^www\.',
+    r'^page \d+',
+    r'^table of contents',
+    r'^chapter \d+',
+    r'^section \d+',
+    r'health\.gov\.za',
+    r'right to care',
+    r'usaid',
+    r'universal health',
+    r'primary healthcare',
+    r'standard treatment',
+    r'essential medicines',
+    r'not for profit',
+    r'free of charge',
+    r'^[A-Z]{2,5}$',  # Acronyms like USAID, EML
+]
+SKIP_PATTERN = re.compile('|'.join(SKIP_RULES))
+
+# Must contain medication indicators
+MED_INDICATORS = ['mg', 'g', 'ml', 'mcg', '%', 'tablet', 'capsule', 'syrup',
+                  'injection', 'cream', 'drops', 'inhaler', 'patch', 'suspension',
+                  'oral', 'topical', 'iv', 'im']
+
+# Must have some structure (not just random text)
+STRUCTURE_PATTERN = re.compile(r'\d+\s*(?:mg|g|ml|mcg|%)', re.IGNORECASE)
+
+FORMS = {
+    'tablet': ['tablet', 'tab', 'tabs'],
+    'capsule': ['capsule', 'cap', 'caps'],
+    'syrup': ['syrup', 'suspension', 'oral liquid'],
+    'injection': ['injection', 'injectable', 'iv', 'im', 'sc'],
+    'cream': ['cream', 'ointment', 'gel', 'topical'],
+    'drops': ['drops', 'eye drops', 'ear drops'],
+    'inhaler': ['inhaler', 'inhalation', 'puff'],
+    'patch': ['patch', 'transdermal'],
+}
+
+CATEGORIES = {
+    'Analgesics': ['paracetamol', 'acetaminophen', 'aspirin', 'ibuprofen', 'naproxen', 
+                  'diclofenac', 'codeine', 'morphine', 'tramadol', 'oxycodone'],
+    'Antibiotics': ['amoxicillin', 'penicillin', 'azithromycin', 'erythromycin', 
+                   'doxycycline', 'ciprofloxacin', 'metronidazole', 'trimethoprim',
+                   'sulfamethoxazole', 'cephalexin', 'clindamycin'],
+    'Cardiovascular': ['enalapril', 'captopril', 'losartan', 'atenolol', 'propranolol',
+                      'amlodipine', 'nifedipine', 'furosemide', 'hydrochlorothiazide',
+                      'spironolactone', 'digoxin'],
+    'Diabetes': ['metformin', 'glibenclamide', 'gliclazide', 'glimepiride', 'insulin',
+                'pioglitazone'],
+    'Respiratory': ['salbutamol', 'beclomethasone', 'fluticasone', 'budesonide',
+                   'ipratropium', 'theophylline'],
+    'Gastrointestinal': ['omeprazole', 'lansoprazole', 'ranitidine', 'loperamide',
+                        'metoclopramide', 'domperidone'],
+    'Mental Health': ['fluoxetine', 'sertraline', 'citalopram', 'amitriptyline',
+                     'diazepam', 'lorazepam', 'clobazam'],
+    'Allergy': ['loratadine', 'cetirizine', 'chlorpheniramine', 'fexofenadine'],
+    'Dermatology': ['betamethasone', 'mometasone', 'hydrocortisone', 'clotrimazole'],
+    'Vitamins': ['ferrous', 'folic acid', 'calcium', 'vitamin', 'thiamine', 'cyanocobalamin'],
+}
+
+# Chapter and section titles of the outline -> category of every record in
+# them, in priority order (see pdf_chapters.py)
+CHAPTER_CATEGORIES = [
+    ('Cardiovascular', ['cardiovascular', 'heart', 'hypertension']),
+    ('Respiratory', ['respiratory', 'asthma', 'lung']),
+    ('Diabetes', ['diabetes', 'endocrine']),
+    ('Gastrointestinal', ['gastro', 'alimentary', 'digestive']),
+    ('Mental Health', ['mental health', 'psychiatric', 'mental disorders']),
+    ('Dermatology', ['skin', 'dermatolog']),
+    ('Allergy', ['allerg']),
+    ('Vitamins', ['nutrition', 'anaemia', 'vitamin']),
+    ('Antibiotics', ['infection', 'infectious', 'sexually transmitted', 'tuberculosis', 'antibiotic']),
+    ('Analgesics', ['pain', 'analgesi']),
+]
+
+# Schedule rules in priority order: direct schedule mentions first, then
+# schedule based on medication type
+SCHEDULES = [(f'Schedule {i}', [f'schedule {i}']) for i in range(7)] + [
+    ('Schedule 5', ['controlled substances', 'diazepam']),
+    ('Schedule 4', ['prescription only', 'hypertension', 'diabetes', 'metformin']),
+    ('Schedule 3', ['antibiotics', 'amoxicillin', 'penicillin']),
+    ('Schedule 2', ['ibuprofen', 'codeine combinations']),
+    ('Schedule 1', ['simple analgesics']),
+    ('Schedule 0', ['paracetamol', 'ibuprofen', 'aspirin']),  # When at low doses
+]
+
+CLASSIFIER = KeywordClassifier({
+    'indicator': [('indicator', MED_INDICATORS)],
+    'known': [('known', KNOWN_MEDICATIONS)],
+    'form': list(FORMS.items()),
+    'category': list(CATEGORIES.items()),
+    'schedule': SCHEDULES,
+})
+
+CHAPTER_CLASSIFIER = KeywordClassifier({'category': CHAPTER_CATEGORIES})
+
+def is_likely_medication(text, hits=None, lowered=None):
     """Check if text is likely a medication entry"""
-    text_lower = text.lower()
+    if lowered is None:
+        lowered = text.lower()
     
     # Skip obvious non-medications
-    skip_patterns = [
-        r'^https?://',
-        r'^www\.',
-        r'^page \d+',
-        r'^table of contents',
-        r'^chapter \d+',
-        r'^section \d+',
-        r'health\.gov\.za',
-        r'right to care',
-        r'usaid',
-        r'universal health',
-        r'primary healthcare',
-        r'standard treatment',
-        r'essential medicines',
-        r'not for profit',
-        r'free of charge',
-        r'^[A-Z]{2,5}$',  # Acronyms like USAID, EML
-    ]
-    
-    for pattern in skip_patterns:
-        if re.search(pattern, text_lower):
-            return False
-    
-    # Must contain medication indicators
-    med_indicators = ['mg', 'g', 'ml', 'mcg', '%', 'tablet', 'capsule', 'syrup', 
-                     'injection', 'cream', 'drops', 'inhaler', 'patch', 'suspension',
-                     'oral', 'topical', 'iv', 'im']
-    
-    has_indicator = any(ind in text_lower for ind in med_indicators)
+    if SKIP_PATTERN.search(lowered):
+        return False
     
-    # Or contains known medication name
-    has_known_med = any(med in text_lower for med in KNOWN_MEDICATIONS)
+    if hits is None:
+        hits = CLASSIFIER.scan_lowered(lowered)
     
-    # Must have some structure (not just random text)
-    has_structure = bool(re.search(r'\d+\s*(?:mg|g|ml|mcg|%)', text, re.IGNORECASE))
+    has_indicator = CLASSIFIER.matches('indicator', hits)
     
-    return has_indicator or (has_known_med and has_structure)
+    # Or contains known medication name
+    has_known_med = CLASSIFIER.matches('known', hits)
+    
+    return has_indicator or (has_known_med and bool(STRUCTURE_PATTERN.search(text)))
 
-def parse_medication_line(line):
-    """Parse a line that likely contains medication information"""
-    if not is_likely_medication(line):
+def parse_medication_line(line, category=None):
+    """Parse a line that likely contains medication information
+
+    category is the category of the line's chapter; without one it is
+    determined from the line's keywords.
+    """
+    # One lowercase copy and one keyword scan serve the filter, form, category
+    # and schedule rules
+    lowered = line.lower()
+    hits = CLASSIFIER.scan_lowered(lowered)
+    
+    if not is_likely_medication(line, hits, lowered):
         return None
     
     line = line.strip()
     if len(line) < 10:  # Too short
         return None
     
-    # Extract strength
-    strength_match = re.search(r'(\d+(?:\.\d+)?)\s*(mg|g|ml|mcg|%|units?)\b', line, re.IGNORECASE)
-    strength = strength_match.group(0) if strength_match else None
+    fields = parse_fields(line, hits)
+    if fields is None:
+        return None
+    
+    # Determine category and schedule
+    return medication_record(*fields, category or determine_category(line, hits), determine_schedule(line, hits))
+
+def parse_fields(line, hits):
+    """Extract (generic name, brand name, strength, form) from a stripped line, or None without a name"""
+    # All fields are read from one tokenizer pass over the line
+    features = tokenize_line(line)
+    
+    # Extract strength (a whole range such as "10–20 mg/kg" counts as one dose)
+    strength = first_span_text(features, features.doses)
     
     if not strength:
-        # Try to find any number
-        num_match = re.search(r'\d+', line)
-        if num_match:
-            strength = num_match.group(0) + 'mg'  # Default to mg
-        else:
-            strength = 'N/A'
+        # A bare number is kept without a unit rather than assumed to be mg
+        strength = first_span_text(features, features.numbers) or 'N/A'
     
     # Extract form
-    forms = {
-        'tablet': ['tablet', 'tab', 'tabs'],
-        'capsule': ['capsule', 'cap', 'caps'],
-        'syrup': ['syrup', 'suspension', 'oral liquid'],
-        'injection': ['injection', 'injectable', 'iv', 'im', 'sc'],
-        'cream': ['cream', 'ointment', 'gel', 'topical'],
-        'drops': ['drops', 'eye drops', 'ear drops'],
-        'inhaler': ['inhaler', 'inhalation', 'puff'],
-        'patch': ['patch', 'transdermal'],
-    }
-    
-    form = 'tablet'  # default
-    for f, keywords in forms.items():
-        if any(kw in line.lower() for kw in keywords):
-            form = f
-            break
+    form = CLASSIFIER.first_match('form', hits, default='tablet')
     
     # Extract generic name (first capitalized word/phrase)
-    # Look for common medication name patterns
-    generic_match = re.search(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', line)
-    generic_name = generic_match.group(1) if generic_match else None
+    generic_name = first_span_text(features, features.caps)
     
     # Try to find brand name in parentheses
-    brand_match = re.search(r'\(([^)]+)\)', line)
-    brand_name = brand_match.group(1) if brand_match else generic_name or 'Generic'
+    brand_name = first_span_text(features, features.parens) or generic_name or 'Generic'
     
     if not generic_name:
         # Try to extract from beginning of line
@@ -136,166 +228,844 @@ def parse_medication_line(line):
     if not generic_name or len(generic_name) < 3:
         return None
     
-    # Determine category
-    category = determine_category(line)
-    
-    # Determine schedule
-    schedule = determine_schedule(line)
-    
-    return {
-        'genericName': generic_name,
-        'brandName': brand_name[:50],
-        'strength': strength,
-        'form': form,
-        'category': category,
-        'schedule': schedule,
-        'description': f'{generic_name} {strength} {form}',
-        'commonDosage': strength,
-        'commonFrequency': 'As prescribed'
-    }
-
-def determine_category(text):
+    return generic_name, brand_name, strength, form
+
+def medication_record(generic_name, brand_name, strength, form, category, schedule):
+    # Default description and dosage, which MedicationRecord stores as derived
+    return MedicationRecord(generic_name, brand_name[:50], strength, form, category, schedule,
+                            description=f'{generic_name} {strength} {form}', common_dosage=strength)
+
+def rejection_reason(line, hits):
+    """Rule that makes parse_medication_line reject a line before field parsing, or None"""
+    lowered = line.lower()
+    if SKIP_PATTERN.search(lowered):
+        return 'skip ' + next(rule for rule in SKIP_RULES if re.search(rule, lowered))
+    
+    if not CLASSIFIER.matches('indicator', hits):
+        if not CLASSIFIER.matches('known', hits):
+            return 'no indicator or known name'
+        if not STRUCTURE_PATTERN.search(line):
+            return 'known name without strength'
+    
+    if len(line.strip()) < 10:
+        return 'too short'
+    return None
+
+def profile_medication_line(line, profile, category=None):
+    """parse_medication_line with each step timed and the deciding rule counted"""
+    with profile.stage('classification'):
+        hits = CLASSIFIER.scan(line)
+    
+    with profile.stage('line filtering'):
+        reason = rejection_reason(line, hits)
+    if reason:
+        profile.reject(reason)
+        return None
+    
+    line = line.strip()
+    with profile.stage('field parsing'):
+        fields = parse_fields(line, hits)
+    if fields is None:
+        profile.reject('no generic name')
+        return None
+    
+    with profile.stage('classification'):
+        category = category or determine_category(line, hits)
+        schedule = determine_schedule(line, hits)
+    
+    indicators = [f'indicator {keyword}' for keyword in MED_INDICATORS if keyword in hits]
+    profile.accept(indicators or ['known name with strength'])
+    return medication_record(*fields, category, schedule)
+
+def determine_category(text, hits=None):
     """Determine medication category"""
-    text_lower = text.lower()
-    
-    categories = {
-        'Analgesics': ['paracetamol', 'acetaminophen', 'aspirin', 'ibuprofen', 'naproxen', 
-                      'diclofenac', 'codeine', 'morphine', 'tramadol', 'oxycodone'],
-        'Antibiotics': ['amoxicillin', 'penicillin', 'azithromycin', 'erythromycin', 
-                       'doxycycline', 'ciprofloxacin', 'metronidazole', 'trimethoprim',
-                       'sulfamethoxazole', 'cephalexin', 'clindamycin'],
-        'Cardiovascular': ['enalapril', 'captopril', 'losartan', 'atenolol', 'propranolol',
-                          'amlodipine', 'nifedipine', 'furosemide', 'hydrochlorothiazide',
-                          'spironolactone', 'digoxin'],
-        'Diabetes': ['metformin', 'glibenclamide', 'gliclazide', 'glimepiride', 'insulin',
-                    'pioglitazone'],
-        'Respiratory': ['salbutamol', 'beclomethasone', 'fluticasone', 'budesonide',
-                       'ipratropium', 'theophylline'],
-        'Gastrointestinal': ['omeprazole', 'lansoprazole', 'ranitidine', 'loperamide',
-                            'metoclopramide', 'domperidone'],
-        'Mental Health': ['fluoxetine', 'sertraline', 'citalopram', 'amitriptyline',
-                         'diazepam', 'lorazepam', 'clobazam'],
-        'Allergy': ['loratadine', 'cetirizine', 'chlorpheniramine', 'fexofenadine'],
-        'Dermatology': ['betamethasone', 'mometasone', 'hydrocortisone', 'clotrimazole'],
-        'Vitamins': ['ferrous', 'folic acid', 'calcium', 'vitamin', 'thiamine', 'cyanocobalamin'],
-    }
-    
-    for category, keywords in categories.items():
-        if any(keyword in text_lower for keyword in keywords):
-            return category
-    
-    return 'Other'
-
-def determine_schedule(text):
+    if hits is None:
+        hits = CLASSIFIER.scan(text)
+    return CLASSIFIER.first_match('category', hits, default='Other')
+
+def chapter_category(title):
+    """Category of every record in a chapter or section with this title, or None to classify per line"""
+    return CHAPTER_CLASSIFIER.first_match('category', CHAPTER_CLASSIFIER.scan(title))
+
+def determine_schedule(text, hits=None):
     """Determine South African schedule"""
-    text_lower = text.lower()
-    
-    # Direct schedule mentions
-    for i in range(7):
-        if f'schedule {i}' in text_lower:
-            return f'Schedule {i}'
-    
-    # Schedule based on medication type
-    unscheduled = ['paracetamol', 'ibuprofen', 'aspirin']  # When at low doses
-    schedule_1 = ['simple analgesics']
-    schedule_2 = ['ibuprofen', 'codeine combinations']
-    schedule_3 = ['antibiotics', 'amoxicillin', 'penicillin']
-    schedule_4 = ['prescription only', 'hypertension', 'diabetes', 'metformin']
-    schedule_5 = ['controlled substances', 'diazepam']
-    
-    if any(med in text_lower for med in schedule_5):
-        return 'Schedule 5'
-    elif any(med in text_lower for med in schedule_4):
-        return 'Schedule 4'
-    elif any(med in text_lower for med in schedule_3):
-        return 'Schedule 3'
-    elif any(med in text_lower for med in schedule_2):
-        return 'Schedule 2'
-    elif any(med in text_lower for med in schedule_1):
-        return 'Schedule 1'
-    elif any(med in text_lower for med in unscheduled):
-        return 'Schedule 0'
-    
-    return 'Schedule 2'  # Default
-
-def extract_medications_from_pdf(pdf_path):
-    """Extract medications from PDF"""
+    if hits is None:
+        hits = CLASSIFIER.scan(text)
+    return CLASSIFIER.first_match('schedule', hits, default='Schedule 2')
+
+# Parsed records per page, keyed by page text and a fingerprint of the parsing
+# rules (this script, the boilerplate filter, the keyword classifier, the
+# line tokenizer, the record layout the cached rows are read back with and the
+# strength parser), so any rule edit invalidates it; watch mode polls and
+# reloads the same files
+CACHE_PATH = Path(__file__).parent.parent / '.cache' / 'formulary-pages.sqlite'
+RULE_FILES = [Path(__file__)] + [Path(__file__).with_name(name)
+                                 for name in ('boilerplate.py', 'keyword_classifier.py', 'line_features.py',
+                                              'medication_record.py', 'strength.py')]
+RULES_VERSION = fingerprint_files(RULE_FILES)
+
+# Pages parsed per chapter by --preview
+DEFAULT_PREVIEW_PAGES = 3
+
+# Upper bound on pages per worker task, so in-flight results stay small
+MAX_RANGE_PAGES = 25
+
+# Progress is printed about once per this many pages
+PROGRESS_PAGES = 50
+
+# Page prefilter: medication entries come with a dose, so a page without a
+# single number followed by a unit is skipped without parsing its lines
+PAGE_SIGNAL = re.compile(r'\d\s*(?:mg|mcg|micrograms?|g|ml|mmol|%|units?|iu)\b', re.IGNORECASE)
+
+def page_may_contain_medications(text):
+    """Cheap page-level check run before any line is parsed"""
+    return PAGE_SIGNAL.search(text) is not None
+
+def new_extraction_stats():
+    """Page cache, boilerplate and prefilter counters, merged across worker processes"""
+    return {'hits': 0, 'misses': 0, 'pages': 0, 'skipped': 0, 'boilerplate': 0, 'lost': []}
+
+def merge_extraction_stats(stats, other):
+    for key, value in other.items():
+        stats[key] += value
+
+def iter_page_texts(pdf_path, start, stop, progress_total=None, profile=None, checkpoint=None, texts=None):
+    """Yield the text of each non-empty page in [start, stop), taking those already read from texts
+
+    With progress_total (the document's page count), progress is printed every PROGRESS_PAGES pages.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in range(start, stop):
+            if checkpoint is not None:
+                # Resumed here, the records of every earlier page were consumed
+                checkpoint.page_done(page_num)
+            
+            if progress_total and (page_num + 1) % PROGRESS_PAGES == 0:
+                print(f"  Processed {page_num + 1}/{progress_total} pages...")
+            
+            if texts and page_num in texts:
+                text = texts.pop(page_num)
+            elif profile is None:
+                text = doc[page_num].get_text()
+            else:
+                with profile.stage('text extraction'):
+                    text = doc[page_num].get_text()
+            if text:
+                yield text
+    finally:
+        doc.close()
+
+def iter_page_medications(page_texts, cache=None, profile=None, prefilter=None, stats=None, boilerplate=None,
+                          category=None):
+    """Parse each page's lines, reusing cached records for pages seen before
+
+    Lines in the boilerplate set (see boilerplate.py) are dropped first, so
+    the cache is keyed by the remaining text (and the pages' chapter category,
+    given to every record when set).
+    prefilter is None, 'on' (skip pages failing page_may_contain_medications)
+    or 'measure' (also parse skipped pages, recording their dedup keys in
+    stats['lost'] to measure recall, without emitting their records).
+    """
+    for text in page_texts:
+        if boilerplate:
+            if profile is None:
+                text, dropped = strip_boilerplate(text, boilerplate)
+            else:
+                with profile.stage('boilerplate filter'):
+                    text, dropped = strip_boilerplate(text, boilerplate)
+                profile.reject('boilerplate', dropped)
+            if stats is not None:
+                stats['boilerplate'] += dropped
+        
+        if prefilter:
+            if profile is None:
+                skip = not page_may_contain_medications(text)
+            else:
+                with profile.stage('page prefilter'):
+                    skip = not page_may_contain_medications(text)
+            stats['pages'] += 1
+            if skip:
+                stats['skipped'] += 1
+                if prefilter == 'measure':
+                    lost = iter_parsed_medications(join_wrapped_lines(text.split('\n')))
+                    stats['lost'].extend(dedup_key(med) for med in lost if len(med.generic_name) > 3)
+                continue
+        
+        if cache is not None:
+            cached = cache.get(text, category)
+            if cached is not None:
+                yield from map(MedicationRecord.from_row, cached)
+                continue
+        
+        records = list(iter_parsed_medications(join_wrapped_lines(text.split('\n')), profile, category))
+        if cache is not None:
+            cache.put(text, [med.to_row() for med in records], category)
+        yield from records
+
+def iter_parsed_medications(lines, profile=None, category=None):
+    """Parse lines, yielding only those that look like medications"""
+    for line in lines:
+        if profile is None:
+            med = parse_medication_line(line, category)
+        else:
+            med = profile_medication_line(line, profile, category)
+        if med:
+            yield med
+
+def dedup_key(med):
+    # Unit-normalised, so "500 mg", "0.5 g" and "500mg" are one strength
+    return (med.generic_name.lower().strip(), strength_key(med.strength))
+
+def unique_key(med):
+    """dedup_key of a record the output can keep, None for names too short to be a medication"""
+    return dedup_key(med) if len(med.generic_name) > 3 else None
+
+def iter_unique_medications(medications, seen=None):
+    """Drop duplicates based on generic name + strength, keeping the first occurrence
+
+    seen holds the keys of records already emitted, e.g. before a resumed checkpoint.
+    """
+    seen = set() if seen is None else seen
+    for med in medications:
+        key = unique_key(med)
+        if key is not None and key not in seen:
+            seen.add(key)
+            yield med
+
+def extract_page_range(pdf_path, start, stop, cache=None, progress_total=None, profile=None,
+                       prefilter=None, stats=None, boilerplate=None, category=None):
+    """Parse pages [start, stop) of the PDF and return medications in page order"""
+    page_texts = iter_page_texts(pdf_path, start, stop, progress_total, profile)
+    return list(iter_page_medications(page_texts, cache, profile, prefilter, stats, boilerplate, category))
+
+def split_page_ranges(page_count, workers):
+    """Split pages into contiguous ranges, several per worker to balance uneven pages"""
+    chunk_count = min(page_count, max(workers * 4, -(-page_count // MAX_RANGE_PAGES)))
+    if chunk_count == 0:
+        return []
+    size, extra = divmod(page_count, chunk_count)
+    ranges = []
+    start = 0
+    for i in range(chunk_count):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def split_page_segments(segments, workers):
+    """split_page_ranges over the pages of (start, stop, category) segments, cut at segment ends"""
+    ranges = split_page_ranges(sum(stop - start for start, stop, _ in segments), workers)
+    pieces = []
+    offset = 0
+    for start, stop, category in segments:
+        # Ranges are over the segments' pages laid end to end
+        for first, last in ranges:
+            first, last = max(first - offset, 0), min(last - offset, stop - start)
+            if first < last:
+                pieces.append((start + first, start + last, category))
+        offset += stop - start
+    return pieces
+
+def _extract_page_range_task(args):
+    """Process pool entry point (workers each open their own fitz document and cache connection)"""
+    pdf_path, start, stop, boilerplate, category, cache_options, profiling, prefilter = args
+    stats = new_extraction_stats()
+    if profiling:
+        # Profiled runs never use the cache, so every line is counted
+        profile = ExtractionProfile()
+        profile.start()
+        records = extract_page_range(pdf_path, start, stop, profile=profile, prefilter=prefilter, stats=stats,
+                                     boilerplate=boilerplate, category=category)
+        profile.stop()
+        return records, stats, profile.to_dict()
+    
+    if not cache_options:
+        return extract_page_range(pdf_path, start, stop, prefilter=prefilter, stats=stats,
+                                  boilerplate=boilerplate, category=category), stats, None
+    
+    cache = PageCache(**cache_options)
+    try:
+        records = extract_page_range(pdf_path, start, stop, cache, prefilter=prefilter, stats=stats,
+                                     boilerplate=boilerplate, category=category)
+        stats['hits'] = cache.hits
+        stats['misses'] = cache.misses
+        return records, stats, None
+    finally:
+        cache.close()
+
+def iter_range_records(tasks, workers, cache_options=None, stats=None, profile=None, prefilter=None, on_done=None):
+    """Parse (pdf_path, start, stop, boilerplate, category) page ranges in a process pool, yielding (task index, records) in task order
+
+    on_done(index) is called once the records of a range have been consumed.
+    """
+    total_pages = sum(stop - start for _, start, stop, _, _ in tasks)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded window of ranges in flight and consume them in
+        # submission order, so results merge in page order and the dedup keeps
+        # the same record as a serial run would
+        pending = deque()
+        next_task = 0
+        done = 0
+        while next_task < len(tasks) or pending:
+            while next_task < len(tasks) and len(pending) < workers * 2:
+                pdf_path, start, stop, boilerplate, category = tasks[next_task]
+                task = (str(pdf_path), start, stop, boilerplate, category, cache_options, profile is not None,
+                        prefilter)
+                pending.append((next_task, executor.submit(_extract_page_range_task, task)))
+                next_task += 1
+            
+            index, future = pending.popleft()
+            if profile is None:
+                records, range_stats, _ = future.result()
+            else:
+                with profile.stage('waiting for workers'):
+                    records, range_stats, worker_profile = future.result()
+                profile.merge(worker_profile)
+            if stats is not None:
+                merge_extraction_stats(stats, range_stats)
+            yield index, records
+            if on_done is not None:
+                on_done(index)
+            _, start, stop, _, _ = tasks[index]
+            previous, done = done, done + stop - start
+            if done // PROGRESS_PAGES > previous // PROGRESS_PAGES or done == total_pages:
+                print(f"  Processed {done}/{total_pages} pages...")
+
+def iter_parallel_medications(pdf_path, segments, workers, cache_options=None, stats=None, profile=None,
+                              prefilter=None, checkpoint=None, boilerplate=None):
+    """Parse the (start, stop, category) page segments in a process pool, yielding medications in page order"""
+    first_page = checkpoint.pages_done if checkpoint is not None else 0
+    ranges = split_page_segments(remaining_segments(segments, first_page), workers)
+    print(f"  Using {workers} workers over {len(ranges)} page ranges")
+    
+    tasks = [(pdf_path, start, stop, boilerplate, category) for start, stop, category in ranges]
+    on_done = (lambda index: checkpoint.page_done(tasks[index][2])) if checkpoint is not None else None
+    for _, records in iter_range_records(tasks, workers, cache_options, stats, profile, prefilter, on_done):
+        yield from records
+
+def iter_batch_medications(documents, workers, cache_options=None, stats=None, profile=None, prefilter=None,
+                           checkpoint=None):
+    """Parse several PDFs on one process pool, tagging medications with their source document and edition"""
+    # Ranges of every document go into one queue, so workers move on to the
+    # next document instead of idling while the tail of the previous one finishes.
+    # Checkpoints count pages across all documents in order.
+    pages_done = checkpoint.pages_done if checkpoint is not None else 0
+    tasks = []
+    owners = []
+    positions = []
+    offset = 0
+    for document in documents:
+        segments = remaining_segments(document['segments'], pages_done - offset)
+        for start, stop, category in split_page_segments(segments, workers):
+            tasks.append((document['path'], start, stop, document['boilerplate'], category))
+            owners.append(document)
+            positions.append(offset + stop)
+        offset += document['pageCount']
+    print(f"  Using {workers} workers over {len(tasks)} page ranges from {len(documents)} documents")
+    
+    on_done = (lambda index: checkpoint.page_done(positions[index])) if checkpoint is not None else None
+    for index, records in iter_range_records(tasks, workers, cache_options, stats, profile, prefilter, on_done):
+        document = owners[index]
+        for med in records:
+            med.set_source(document['document'], document['edition'])
+            yield med
+
+def remaining_segments(segments, first_page):
+    """Segments clipped to the pages from first_page on (a resumed checkpoint)"""
+    return [(max(start, first_page), stop, category) for start, stop, category in segments if stop > first_page]
+
+def iter_segment_medications(pdf_path, segments, cache=None, profile=None, prefilter=None, stats=None,
+                             checkpoint=None, boilerplate=None, texts=None, page_count=None):
+    """Serial parse of the (start, stop, category) page segments, lazily and in page order
+
+    texts holds page texts already read, by page number (see learn_document_boilerplate).
+    page_count is the document's page count, which progress is reported against.
+    """
+    first_page = checkpoint.pages_done if checkpoint is not None else 0
+    for start, stop, category in remaining_segments(segments, first_page):
+        pages = iter_page_texts(pdf_path, start, stop, page_count, profile, checkpoint, texts)
+        yield from iter_page_medications(pages, cache, profile, prefilter, stats, boilerplate, category)
+
+def iter_deduplicated(medications, profile=None, seen=None):
+    """iter_unique_medications, charged to the dedup stage when profiling"""
+    if profile is None:
+        return iter_unique_medications(medications, seen)
+    medications = profile.timed('pipeline overhead', medications)
+    return profile.timed('dedup', iter_unique_medications(medications, seen))
+
+def canonical_vocabulary(vocabulary_path=None):
+    """Reference names for --canonicalize: curated names, then this script's lists and the user's"""
+    names = sorted(KNOWN_MEDICATIONS) + [name for names in CATEGORIES.values() for name in names]
+    return reference_names(names, vocabulary_path)
+
+def iter_canonical(medications, canonicalizer=None, profile=None):
+    """Canonicalise generic names ahead of dedup, charged to its own stage when profiling"""
+    if canonicalizer is None:
+        return medications
+    if profile is None:
+        return iter_canonicalized(medications, canonicalizer)
+    medications = profile.timed('pipeline overhead', medications)
+    return profile.timed('canonicalisation', iter_canonicalized(medications, canonicalizer))
+
+def iter_kept_keys(medications, kept):
+    """Pass medications through, collecting their dedup keys (prefilter recall measurement)"""
+    for med in medications:
+        kept.add(dedup_key(med))
+        yield med
+
+def report_extraction_stats(stats, cache_options, evicted, prefilter, kept):
+    """Print page cache, boilerplate and prefilter figures at the end of a run"""
+    if cache_options:
+        print(f"  Page cache: {stats['hits']} hits, {stats['misses']} misses, {evicted} evicted")
+    if stats['boilerplate']:
+        print(f"  Boilerplate: dropped {stats['boilerplate']} lines before parsing")
+    if not prefilter:
+        return
+    
+    rate = stats['skipped'] / stats['pages'] if stats['pages'] else 0
+    print(f"  Prefilter: skipped {stats['skipped']}/{stats['pages']} pages ({rate:.1%})")
+    if prefilter == 'measure':
+        # Records only found on skipped pages are the ones the prefilter loses
+        lost = set(stats['lost']) - kept
+        recall = len(kept) / (len(kept) + len(lost)) if kept or lost else 1.0
+        print(f"  Prefilter recall: {recall:.2%} ({len(lost)} unique medications only on skipped pages)")
+
+def report_strength_index(builder, output_path):
+    index = builder.build()
+    index_path = write_strength_index(index, output_path)
+    print(f"Strength index: {len(index)} records ({builder.skipped} without a unit) in {index_path}")
+
+def learn_document_boilerplate(doc, share, profile=None, texts=None):
+    """Boilerplate lines of an open document, learnt from a sample of its pages
+
+    If texts is a dict, the sampled page texts are kept in it by page number,
+    so a serial pass can reuse them instead of extracting them again.
+    """
+    if share <= 0:
+        return frozenset()
+    page_numbers = sample_pages(len(doc))
+    
+    def read(page_num):
+        text = doc[page_num].get_text()
+        if texts is not None:
+            texts[page_num] = text
+        return text
+    
+    sampled = (read(page_num) for page_num in page_numbers)
+    if profile is None:
+        boilerplate = learn_boilerplate(sampled, share)
+    else:
+        with profile.stage('boilerplate learning'):
+            boilerplate = learn_boilerplate(sampled, share)
+    print(f"  Learnt {len(boilerplate)} boilerplate lines from {len(page_numbers)} pages of {Path(doc.name).name}")
+    return boilerplate
+
+def document_segments(doc, chapters=None, chapter_categories=True):
+    """(start, stop, category) page segments of an open document, only of the selected chapters if given
+
+    Raises ValueError if a chapter selector matches nothing (see ChapterIndex.select).
+    """
+    index = read_chapter_index(doc)
+    segments = index.segments(chapter_category if chapter_categories else lambda title: None, chapters)
+    if index:
+        pages = sum(stop - start for start, stop, _ in segments)
+        categorised = sum(stop - start for start, stop, category in segments if category)
+        print(f"  Outline of {Path(doc.name).name}: {len(index.chapters)} chapters, {len(index.sections)} sections, "
+              f"{categorised}/{pages} pages categorised by chapter")
+    return segments
+
+def check_chapter_selection(pdf_paths, chapters):
+    """Exit with an error unless every selector matches a chapter in each PDF's outline"""
+    for pdf_path in pdf_paths:
+        with fitz.open(pdf_path) as doc:
+            index = read_chapter_index(doc)
+        try:
+            index.segments(lambda title: None, chapters)
+        except ValueError as e:
+            print(f"Error: {Path(pdf_path).name}: {e}")
+            if index:
+                print("Chapters: " + ', '.join(f"{number} {title}" for number, title, _, _ in index.chapter_ranges()))
+            sys.exit(1)
+
+def require_pymupdf():
     if not HAS_PYMUPDF:
         print("Error: PyMuPDF not found. Install with: pip install PyMuPDF")
         sys.exit(1)
+
+def extract_medications_from_pdf(pdf_path, workers=1, cache_options=None, profile=None, prefilter=None,
+                                 checkpoint=None, seen=None, boilerplate_share=DEFAULT_SHARE, canonicalizer=None,
+                                 chapters=None, chapter_categories=True):
+    """Yield unique medications from the PDF as pages are parsed, optionally across worker processes
+
+    cache_options are PageCache keyword arguments, or None to parse every page.
+    With an ExtractionProfile, stages are timed and line decisions counted.
+    prefilter is None, 'on' or 'measure' (see iter_page_medications).
+    With an ExtractionCheckpoint, parsing starts after its completed pages and
+    reports progress to it; seen holds the dedup keys of records already written.
+    Lines repeated on boilerplate_share of the sampled pages are dropped (0 keeps them).
+    With a NameCanonicalizer, generic names are mapped to its vocabulary before dedup.
+    chapters are chapter numbers or title parts from the PDF outline to extract
+    alone; with chapter_categories, records in a chapter whose title names a
+    category get that category (see document_segments).
+    """
+    require_pymupdf()
     
-    medications = []
-    doc = fitz.open(pdf_path)
+    # A serial pass reuses the texts of the pages sampled for boilerplate
+    # instead of extracting them twice; workers read their own pages
+    texts = {} if workers <= 1 else None
+    with fitz.open(pdf_path) as doc:
+        boilerplate = learn_document_boilerplate(doc, boilerplate_share, profile, texts)
+        segments = document_segments(doc, chapters, chapter_categories)
+        page_count = len(doc)
     
-    print(f"Processing {len(doc)} pages...")
+    print(f"Processing {sum(stop - start for start, stop, _ in segments)} pages...")
     
-    for page_num in range(len(doc)):
-        if (page_num + 1) % 50 == 0:
-            print(f"  Processed {page_num + 1}/{len(doc)} pages...")
-        
-        page = doc[page_num]
-        text = page.get_text()
+    cache = PageCache(**cache_options) if cache_options else None
+    stats = new_extraction_stats()
+    kept = set()
+    try:
+        if workers <= 1:
+            # pages -> lines -> parsed records, all lazily
+            medications = iter_segment_medications(pdf_path, segments, cache, profile, prefilter, stats, checkpoint,
+                                                   boilerplate, texts, page_count)
+        else:
+            medications = iter_parallel_medications(pdf_path, segments, workers, cache_options, stats, profile,
+                                                    prefilter, checkpoint, boilerplate)
         
-        if not text:
-            continue
+        medications = iter_canonical(medications, canonicalizer, profile)
+        unique = iter_deduplicated(medications, profile, seen)
+        yield from iter_kept_keys(unique, kept) if prefilter == 'measure' else unique
         
-        # Split into lines and process each
-        lines = text.split('\n')
-        for line in lines:
-            med = parse_medication_line(line)
-            if med:
-                medications.append(med)
-    
-    doc.close()
-    
-    # Remove duplicates based on generic name + strength
-    seen = set()
-    unique_medications = []
-    for med in medications:
-        key = (med['genericName'].lower().strip(), med['strength'].lower())
-        if key not in seen and len(med['genericName']) > 3:
-            seen.add(key)
-            unique_medications.append(med)
+        evicted = 0
+        if cache is not None:
+            stats['hits'] += cache.hits
+            stats['misses'] += cache.misses
+            evicted = cache.evict()
+        report_extraction_stats(stats, cache_options, evicted, prefilter, kept)
+    finally:
+        if cache is not None:
+            cache.close()
+
+def extract_medications_from_batch(documents, workers=1, cache_options=None, profile=None, prefilter=None,
+                                   checkpoint=None, seen=None, boilerplate_share=DEFAULT_SHARE,
+                                   canonicalizer=None, chapters=None, chapter_categories=True):
+    """Yield unique medications across all documents; on duplicates the earliest document wins
+
+    documents are pdf_batch.load_batch() entries, in priority order. The other
+    arguments are as for extract_medications_from_pdf. Boilerplate and the
+    outline are read per document, since each has its own running headers
+    and chapters.
+    """
+    require_pymupdf()
+    
+    for document in documents:
+        with fitz.open(document['path']) as doc:
+            document['pageCount'] = len(doc)
+            document['boilerplate'] = learn_document_boilerplate(doc, boilerplate_share, profile)
+            document['segments'] = document_segments(doc, chapters, chapter_categories)
+        print(f"  {document['document']} ({document['edition'] or 'no edition'}): {document['pageCount']} pages")
+    
+    pages = sum(stop - start for document in documents for start, stop, _ in document['segments'])
+    print(f"Processing {pages} pages...")
+    
+    stats = new_extraction_stats()
+    kept = set()
+    medications = iter_batch_medications(documents, workers, cache_options, stats, profile, prefilter, checkpoint)
+    medications = iter_canonical(medications, canonicalizer, profile)
+    unique = iter_deduplicated(medications, profile, seen)
+    yield from iter_kept_keys(unique, kept) if prefilter == 'measure' else unique
     
-    return unique_medications
+    evicted = 0
+    if cache_options:
+        cache = PageCache(**cache_options)
+        evicted = cache.evict()
+        cache.close()
+    report_extraction_stats(stats, cache_options, evicted, prefilter, kept)
 
-def main():
-    # Try to find the PDF file
-    project_root = Path(__file__).parent.parent
-    pdf_path = None
+def preview_medications(pdf_path, per_stratum, seed, cache_options=None, prefilter=None,
+                        boilerplate_share=DEFAULT_SHARE, canonicalizer=None, chapters=None, chapter_categories=True):
+    """Parse a stratified sample of per_stratum pages per (selected) chapter, returning its PreviewSample"""
+    require_pymupdf()
     
+    cache = PageCache(**cache_options) if cache_options else None
+    stats = new_extraction_stats()
+    try:
+        with fitz.open(pdf_path) as doc:
+            boilerplate = learn_document_boilerplate(doc, boilerplate_share)
+            segments = document_segments(doc, chapters, chapter_categories)
+            index = read_chapter_index(doc)
+            strata = page_strata(index, index.select(chapters) if chapters else None)
+            sample = PreviewSample(strata, stratified_sample(strata, per_stratum, seed))
+            for stratum, page_numbers in enumerate(sample.samples):
+                for page_num in page_numbers:
+                    category = next(category for start, stop, category in segments if start <= page_num < stop)
+                    records = iter_page_medications([doc[page_num].get_text()], cache, None, prefilter, stats,
+                                                    boilerplate, category)
+                    records = list(iter_canonical(records, canonicalizer))
+                    sample.add_page(stratum, records, [unique_key(med) for med in records])
+    finally:
+        if cache is not None:
+            cache.close()
+    return sample
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Extract medications from the 2024 EML formulary PDF')
+    parser.add_argument('pdf', nargs='?', type=Path,
+                        help='PDF to process (defaults to the 2024 EML in the project root)')
+    parser.add_argument('--batch', type=Path,
+                        help='Directory of PDFs or JSON manifest (see pdf_batch.py) to extract in one run; '
+                             'records are tagged with sourceDocument and edition')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes (0 = one per CPU, default: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Parse every page without reading or writing the page cache')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Empty the page cache before extracting')
+    parser.add_argument('--cache-size-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help='Page cache size cap in MB, least recently used pages are evicted first')
+    parser.add_argument('--boilerplate-share', type=float, default=DEFAULT_SHARE, metavar='FRACTION',
+                        help='Drop lines repeated on at least this share of sampled pages (running headers, '
+                             f'footers, credits) before parsing (default: {DEFAULT_SHARE}, 0 = keep them)')
+    parser.add_argument('--prefilter', choices=['on', 'measure'],
+                        help='Skip pages without any dose/unit token before parsing their lines; '
+                             'measure also parses the skipped pages to report the recall lost')
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_INTERVAL, metavar='PAGES',
+                        help=f'Save a checkpoint every N pages (default: {DEFAULT_INTERVAL}, 0 = no checkpoints)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted run from its last checkpoint')
+    parser.add_argument('--canonicalize', action='store_true',
+                        help='Map generic names to the closest curated or known name (up to 2 typos) before dedup')
+    parser.add_argument('--vocabulary', type=Path, metavar='PATH',
+                        help='Extra reference names for --canonicalize, one per line')
+    parser.add_argument('--chapters', nargs='+', metavar='CHAPTER',
+                        help='Only extract these chapters of the PDF outline, by number (0 = front matter) '
+                             'or part of the title, e.g. --chapters 2 Pain')
+    parser.add_argument('--no-chapter-categories', action='store_true',
+                        help='Categorise every line by its keywords, not by the outline chapter it is in')
+    parser.add_argument('--preview', nargs='?', type=int, const=DEFAULT_PREVIEW_PAGES, default=None, metavar='PAGES',
+                        help=f'Only parse PAGES random pages per chapter (default: {DEFAULT_PREVIEW_PAGES}) and report '
+                             'the extrapolated yield and category/schedule shares against the previous full run '
+                             'in --output, without writing anything')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Page sampling seed for --preview (default: 0)')
+    parser.add_argument('--near-dedup', action='store_true',
+                        help='Also merge near-duplicate names/strengths and write a .clusters.json report')
+    parser.add_argument('--similarity', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Name similarity needed to merge in --near-dedup mode (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--output', type=Path,
+                        help='Output path, .jsonl or .json (default: extracted-medications-2024.jsonl in the project root)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running, re-parse the pages affected whenever a PDF or rule file changes and '
+                             're-write the output and the integration diff (serial; no cache, checkpoints or profile)')
+    parser.add_argument('--profile', nargs='?', type=Path, const=True, default=None, metavar='REPORT',
+                        help='Time each stage, count the rule deciding each line and track peak memory, '
+                             'writing a JSON report (default: <output>.profile.json). Disables the page cache')
+    return parser.parse_args()
+
+def find_default_pdf(project_root):
+    """Locate the 2024 EML PDF in the project root"""
     # Try exact name first
     exact_path = project_root / 'Primary-Healthcare-Standard-Treatment-Guidelines-and-Essential-Medicines-List-8th-Edition-2024.pdf'
     if exact_path.exists():
-        pdf_path = exact_path
+        return exact_path
+    
+    # Search for PDF files containing "formulary" or "2024" or "Primary Healthcare"
+    for pdf_file in project_root.glob('*.pdf'):
+        if any(word in pdf_file.name.lower() for word in ['formulary', '2024', 'primary', 'healthcare', 'essential']):
+            return pdf_file
+    
+    return None
+
+def main():
+    args = parse_args()
+    workers = args.workers or os.cpu_count() or 1
+    
+    project_root = Path(__file__).parent.parent
+    documents = None
+    if args.batch:
+        if not args.batch.exists():
+            print(f"Error: batch directory or manifest not found: {args.batch}")
+            sys.exit(1)
+        documents = load_batch(args.batch)
+        missing = [str(document['path']) for document in documents if not document['path'].exists()]
+        if missing or not documents:
+            print(f"Error: no PDFs to process in {args.batch}" if not documents else f"Error: PDF file not found: {missing[0]}")
+            sys.exit(1)
+        pdf_path = args.batch
     else:
-        # Search for PDF files containing "formulary" or "2024" or "Primary Healthcare"
-        for pdf_file in project_root.glob('*.pdf'):
-            if any(word in pdf_file.name.lower() for word in ['formulary', '2024', 'primary', 'healthcare', 'essential']):
-                pdf_path = pdf_file
-                break
-    
-    if not pdf_path or not pdf_path.exists():
-        print(f"Error: PDF file not found.")
-        print(f"Looking for: Primary-Healthcare-Standard-Treatment-Guidelines-and-Essential-Medicines-List-8th-Edition-2024.pdf")
-        print(f"Please ensure the PDF file is in: {project_root}")
+        # Try to find the PDF file
+        pdf_path = args.pdf or find_default_pdf(project_root)
+        
+        if not pdf_path or not pdf_path.exists():
+            print(f"Error: PDF file not found.")
+            print(f"Looking for: Primary-Healthcare-Standard-Treatment-Guidelines-and-Essential-Medicines-List-8th-Edition-2024.pdf")
+            print(f"Please ensure the PDF file is in: {project_root}")
+            sys.exit(1)
+    
+    cache_options = None
+    if not args.no_cache and not args.profile:
+        cache_options = {
+            'path': str(CACHE_PATH),
+            'rules_version': RULES_VERSION,
+            'max_bytes': args.cache_size_mb * 1024 * 1024,
+        }
+    if args.clear_cache:
+        cache = PageCache(CACHE_PATH, RULES_VERSION)
+        cache.clear()
+        cache.close()
+        print(f"Cleared page cache: {CACHE_PATH}")
+    
+    if args.vocabulary and not args.vocabulary.exists():
+        print(f"Error: vocabulary file not found: {args.vocabulary}")
+        sys.exit(1)
+    
+    if args.chapters:
+        require_pymupdf()
+        check_chapter_selection([document['path'] for document in documents] if documents else [pdf_path],
+                                args.chapters)
+    chapter_categories = not args.no_chapter_categories
+    
+    if documents:
+        print(f"Extracting medications from {len(documents)} PDFs...")
+    else:
+        print("Extracting medications from 2024 Formulary PDF...")
+    output_path = args.output or project_root / 'extracted-medications-2024.jsonl'
+    
+    if args.preview is not None:
+        if documents or args.watch:
+            print("Error: --preview works on a single PDF and cannot be combined with --watch")
+            sys.exit(1)
+        if args.preview < 1:
+            print("Error: --preview needs at least 1 page per chapter")
+            sys.exit(1)
+        canonicalizer = NameCanonicalizer(canonical_vocabulary(args.vocabulary)) if args.canonicalize else None
+        sample = preview_medications(pdf_path, args.preview, args.seed, cache_options, args.prefilter,
+                                     args.boilerplate_share, canonicalizer, args.chapters, chapter_categories)
+        full = None
+        if output_path.exists():
+            records, categories = full_run_shares(iter_medications(output_path), 'category')
+            _, schedules = full_run_shares(iter_medications(output_path), 'schedule')
+            full = {'records': records, 'category': categories, 'schedule': schedules}
+            print(f"Comparing with the previous full run in {output_path}")
+        report_preview(sample, full)
+        return
+    
+    if args.watch:
+        if args.profile or args.resume:
+            print("Error: --watch cannot be combined with --profile or --resume")
+            sys.exit(1)
+        require_pymupdf()
+        from formulary_watch import FormularyWatcher, WatchedDocument
+        watched = ([WatchedDocument(document['path'], document['document'], document['edition'])
+                    for document in documents] if documents else [WatchedDocument(pdf_path)])
+        watcher = FormularyWatcher(__file__, watched, output_path, args.prefilter, args.near_dedup,
+                                   args.similarity, batch=bool(documents),
+                                   boilerplate_share=args.boilerplate_share,
+                                   canonicalize=args.canonicalize, vocabulary=args.vocabulary,
+                                   chapters=args.chapters, chapter_categories=chapter_categories)
+        watcher.run()
+        return
+    
+    checkpoint = None
+    seen = None
+    if args.checkpoint_every > 0:
+        # A checkpoint only applies to the same inputs, rules and page filter
+        signature = {
+            'rulesVersion': RULES_VERSION,
+            'sources': source_fingerprint([document['path'] for document in documents] if documents else [pdf_path]),
+            'documents': [[document['document'], document['edition']] for document in documents or []],
+            'prefilter': args.prefilter,
+            'boilerplateShare': args.boilerplate_share,
+            'vocabulary': source_fingerprint(vocabulary_files(args.vocabulary)) if args.canonicalize else None,
+            'chapters': args.chapters,
+            'chapterCategories': chapter_categories,
+        }
+        checkpoint = ExtractionCheckpoint(output_path, signature, args.checkpoint_every)
+        if args.resume:
+            try:
+                resumed = checkpoint.resume()
+            except ValueError as e:
+                print(f"Error: {e}")
+                print("Run without --resume to start over")
+                sys.exit(1)
+            if resumed:
+                seen = {dedup_key(med) for med in checkpoint.iter_previous()}
+                print(f"Resuming after page {checkpoint.pages_done} with {checkpoint.records} records")
+            else:
+                print("No checkpoint found, starting from the first page")
+    elif args.resume:
+        print("Error: --resume needs checkpoints (--checkpoint-every > 0)")
         sys.exit(1)
     
-    print("Extracting medications from 2024 Formulary PDF...")
-    medications = extract_medications_from_pdf(pdf_path)
+    profile = None
+    if args.profile:
+        profile = ExtractionProfile()
+        profile.start()
     
-    print(f"\nExtracted {len(medications)} unique medications")
+    canonicalizer = None
+    if args.canonicalize:
+        canonicalizer = NameCanonicalizer(canonical_vocabulary(args.vocabulary))
+        print(f"Canonicalising names against {len(canonicalizer)} reference names")
+    
+    # Records are written as they are parsed, nothing is held in memory
+    if documents:
+        medications = extract_medications_from_batch(documents, workers=workers, cache_options=cache_options,
+                                                     profile=profile, prefilter=args.prefilter,
+                                                     checkpoint=checkpoint, seen=seen,
+                                                     boilerplate_share=args.boilerplate_share,
+                                                     canonicalizer=canonicalizer, chapters=args.chapters,
+                                                     chapter_categories=chapter_categories)
+    else:
+        medications = extract_medications_from_pdf(pdf_path, workers=workers, cache_options=cache_options,
+                                                   profile=profile, prefilter=args.prefilter,
+                                                   checkpoint=checkpoint, seen=seen,
+                                                   boilerplate_share=args.boilerplate_share,
+                                                   canonicalizer=canonicalizer, chapters=args.chapters,
+                                                   chapter_categories=chapter_categories)
+    
+    if checkpoint is not None:
+        # Records from before the checkpoint come first, then new ones, which
+        # are also appended to the partial file for the next checkpoint
+        medications = chain(checkpoint.iter_previous(), checkpoint.tee(medications))
+    
+    if args.near_dedup:
+        # Clustering needs every record, so this mode gives up streaming output
+        if profile is not None:
+            medications = list(medications)
+            with profile.stage('near dedup'):
+                medications, clusters = merge_near_duplicates(medications, args.similarity)
+        else:
+            medications, clusters = merge_near_duplicates(list(medications), args.similarity)
+        report_path = write_cluster_report(clusters, output_path)
+        print(f"Merged near-duplicates into {len(medications)} records, {len(clusters)} clusters reported in {report_path}")
+    
+    strengths = StrengthIndexBuilder()
+    medications = iter_indexed(medications, strengths)
+    
+    if profile is None:
+        count = write_medications(medications, output_path)
+    else:
+        with profile.stage('serialisation'):
+            count = write_medications(medications, output_path)
+        profile.stop()
+        report_path = profile_report_path(output_path) if args.profile is True else args.profile
+        report = profile.report(script=Path(__file__).name, pdf=str(pdf_path), workers=workers, records=count)
+        write_profile_report(report, report_path)
     
-    # Save to JSON
-    output_path = Path(__file__).parent.parent / 'extracted-medications-2024.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(medications, f, indent=2, ensure_ascii=False)
+    if checkpoint is not None:
+        checkpoint.finish()
     
+    print(f"\nExtracted {count} unique medications")
     print(f"Saved to: {output_path}")
+    report_strength_index(strengths, output_path)
+    if canonicalizer is not None:
+        canonicalizer.report()
     
     # Show sample
     print("\nSample medications:")
-    for med in medications[:10]:
+    for med in islice(iter_medications(output_path), 10):
         print(f"  - {med['genericName']} ({med['brandName']}) - {med['strength']} - {med['form']} - {med['category']}")
 
 if __name__ == '__main__':
@@ -5,226 +5,245 @@ and Essential Medicines List 8th Edition 2024 PDF
 """
 
 import re
-import json
 import sys
+import argparse
+from itertools import groupby, islice
 from pathlib import Path
 
-# Try importing PDF libraries
-try:
-    import fitz  # PyMuPDF
-    HAS_PYMUPDF = True
-except ImportError:
-    HAS_PYMUPDF = False
+from boilerplate import DEFAULT_SHARE, iter_content_lines, learn_boilerplate, sample_pages
+from extraction_profile import ExtractionProfile, profile_report_path, write_profile_report
+from keyword_classifier import KeywordClassifier
+from line_features import join_wrapped_lines, name_parts, tokenize_line
+from medication_io import iter_medications, write_medications
+from medication_record import MedicationRecord
+from name_canonicalizer import NameCanonicalizer, iter_canonicalized, reference_names
+from near_dedup import DEFAULT_THRESHOLD, merge_near_duplicates, write_cluster_report
+from pdf_backends import BACKENDS, available_backends, iter_text_lines, page_count, probe_fastest_backend
+from strength import strength_key
+from strength_index import StrengthIndexBuilder, iter_indexed, write_strength_index
 
-try:
-    import PyPDF2
-    HAS_PYPDF2 = True
-except ImportError:
-    HAS_PYPDF2 = False
-
-try:
-    import pdfplumber
-    HAS_PDFPLUMBER = True
-except ImportError:
-    HAS_PDFPLUMBER = False
-
-def extract_with_pymupdf(pdf_path):
-    """Extract text using PyMuPDF (best quality)"""
-    medications = []
-    doc = fitz.open(pdf_path)
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        text = page.get_text()
-        if text:
-            medications.extend(parse_medication_text(text))
-    doc.close()
-    return medications
-
-def extract_with_pypdf2(pdf_path):
-    """Extract text using PyPDF2"""
-    medications = []
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
-        for page_num, page in enumerate(pdf_reader.pages):
-            text = page.extract_text()
-            # Process text to find medications
-            # This is a simplified parser - you may need to adjust based on PDF structure
-            medications.extend(parse_medication_text(text))
-    return medications
-
-def extract_with_pdfplumber(pdf_path):
-    """Extract text using pdfplumber (better for structured data)"""
-    medications = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                medications.extend(parse_medication_text(text))
-    return medications
-
-def parse_medication_text(text):
-    """Parse medication information from extracted text"""
-    medications = []
-    
-    # Common patterns for medication entries
-    # Adjust these regex patterns based on the actual PDF structure
-    patterns = [
-        # Pattern: Generic Name (Brand Name) - Strength - Form
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\(([^)]+)\)\s*-\s*(\d+\s*(?:mg|g|ml|mcg|%|units)?)\s*-\s*([a-z]+)',
-        # Pattern: Generic Name - Strength mg - Form
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*-\s*(\d+\s*(?:mg|g|ml|mcg|%|units)?)\s*-\s*([a-z]+)',
-    ]
-    
-    lines = text.split('\n')
-    for line in lines:
+def parse_text_lines(text_lines, profile=None, boilerplate=None, stats=None):
+    """Parse medication information from pre-segmented backend lines"""
+    lines = iter_content_lines((text_line.text for text_line in text_lines), boilerplate, stats)
+    # Dose ranges and lists wrapped onto the next line are parsed as one line
+    for line in join_wrapped_lines(lines):
         line = line.strip()
         if not line or len(line) < 5:
+            if profile is not None:
+                profile.reject('too short')
             continue
             
         # Look for medication-like patterns
-        med = try_parse_medication_line(line)
+        if profile is None:
+            med = try_parse_medication_line(line)
+        else:
+            med = profile_medication_line(line, profile)
         if med:
-            medications.append(med)
-    
-    return medications
+            yield med
+
+def learn_pdf_boilerplate(pdf_path, backend, share=DEFAULT_SHARE):
+    """Boilerplate lines learnt from a sample of pages (see boilerplate.py)"""
+    if share <= 0:
+        return frozenset()
+    pages = sample_pages(page_count(pdf_path, backend))
+    lines = iter_text_lines(pdf_path, backend, pages)
+    page_texts = ('\n'.join(line.text for line in page_lines)
+                  for _, page_lines in groupby(lines, key=lambda line: line.page))
+    return learn_boilerplate(page_texts, share)
+
+def extract_medications(pdf_path, backend, profile=None, boilerplate=None, stats=None):
+    """Extract medications from every page using the given PDF backend, dropping boilerplate lines"""
+    text_lines = iter_text_lines(pdf_path, backend)
+    if profile is not None:
+        text_lines = profile.timed('text extraction', text_lines)
+    return parse_text_lines(text_lines, profile, boilerplate, stats)
+
+def iter_unique_medications(medications):
+    """Drop duplicates based on generic name + strength, keeping the first occurrence"""
+    seen = set()
+    for med in medications:
+        key = (med.generic_name.lower(), strength_key(med.strength))
+        if key not in seen:
+            seen.add(key)
+            yield med
+
+# Skip headers and non-medication lines
+SKIP_RULES = [
+    r'Page\s+\d+',
+    r'Table of Contents',
+    r'Chapter',
+    r'Section',
+    r'\d+\.\s+',
+]
+SKIP_PATTERN = re.compile('|'.join(SKIP_RULES), re.IGNORECASE)
+
+# Look for common medication indicators
+MED_INDICATORS = ['mg', 'g', 'ml', 'mcg', 'tablet', 'capsule', 'syrup', 'injection', 'cream']
+
+FORMS = ['tablet', 'capsule', 'syrup', 'injection', 'cream', 'drops', 'inhaler', 'patch', 'suspension']
+
+CATEGORIES = {
+    'Analgesics': ['paracetamol', 'aspirin', 'ibuprofen', 'codeine', 'morphine', 'tramadol'],
+    'Antibiotics': ['amoxicillin', 'penicillin', 'azithromycin', 'ciprofloxacin', 'doxycycline', 'metronidazole'],
+    'Cardiovascular': ['enalapril', 'losartan', 'atenolol', 'amlodipine', 'furosemide', 'hydrochlorothiazide'],
+    'Diabetes': ['metformin', 'glibenclamide', 'insulin', 'gliclazide'],
+    'Respiratory': ['salbutamol', 'beclomethasone', 'fluticasone', 'ipratropium'],
+    'Gastrointestinal': ['omeprazole', 'ranitidine', 'loperamide', 'metoclopramide'],
+    'Mental Health': ['fluoxetine', 'sertraline', 'amitriptyline', 'diazepam'],
+    'Antihistamines': ['loratadine', 'cetirizine', 'chlorpheniramine'],
+}
+
+# Schedule indicators first, then defaults based on medication type
+SCHEDULES = [
+    ('Schedule 0', ['schedule 0', 'unscheduled']),
+    ('Schedule 1', ['schedule 1']),
+    ('Schedule 2', ['schedule 2']),
+    ('Schedule 3', ['schedule 3']),
+    ('Schedule 4', ['schedule 4']),
+    ('Schedule 5', ['schedule 5']),
+    ('Schedule 6', ['schedule 6']),
+    ('Schedule 0', ['paracetamol', 'ibuprofen']),
+    ('Schedule 3', ['antibiotic', 'amoxicillin']),
+    ('Schedule 4', ['hypertension', 'diabetes']),
+]
+
+CLASSIFIER = KeywordClassifier({
+    'indicator': [('indicator', MED_INDICATORS)],
+    'form': [(form, [form]) for form in FORMS],
+    'category': list(CATEGORIES.items()),
+    'schedule': SCHEDULES,
+})
 
 def try_parse_medication_line(line):
     """Try to parse a single line as a medication"""
-    # Skip headers and non-medication lines
-    skip_patterns = [
-        r'^Page\s+\d+',
-        r'^Table of Contents',
-        r'^Chapter',
-        r'^Section',
-        r'^\d+\.\s+',
-    ]
-    
-    for pattern in skip_patterns:
-        if re.match(pattern, line, re.IGNORECASE):
-            return None
+    if SKIP_PATTERN.match(line):
+        return None
     
-    # Look for common medication indicators
-    med_indicators = ['mg', 'g', 'ml', 'mcg', 'tablet', 'capsule', 'syrup', 'injection', 'cream']
-    has_indicator = any(ind in line.lower() for ind in med_indicators)
+    # One keyword scan serves the indicator, form, category and schedule rules
+    hits = CLASSIFIER.scan(line)
     
-    if not has_indicator:
+    if not CLASSIFIER.matches('indicator', hits):
         return None
     
-    # Try to extract medication name
-    # This is a simplified extraction - adjust based on actual PDF format
-    parts = re.split(r'[–\-\(\)]', line)
-    if len(parts) < 2:
+    fields = parse_fields(line, hits)
+    if fields is None:
         return None
     
-    generic_name = parts[0].strip()
-    brand_name = parts[1].strip() if len(parts) > 1 else generic_name
-    
-    # Extract strength
-    strength_match = re.search(r'(\d+(?:\s*\.\d+)?\s*(?:mg|g|ml|mcg|%|units)?)', line, re.IGNORECASE)
-    strength = strength_match.group(1) if strength_match else 'N/A'
+    # Determine category and schedule (simplified - you may need to adjust)
+    return medication_record(line, *fields, determine_category(line, hits), determine_schedule(line, hits))
+
+def parse_fields(line, hits):
+    """Extract (generic name, brand name, strength, form) from a line, or None without a name"""
+    # All fields are read from one tokenizer pass over the line
+    features = tokenize_line(line)
     
-    # Extract form
-    forms = ['tablet', 'capsule', 'syrup', 'injection', 'cream', 'drops', 'inhaler', 'patch', 'suspension']
-    form = 'tablet'  # default
-    for f in forms:
-        if f in line.lower():
-            form = f
-            break
+    # Medication name: the text before the first bracket, dash, route comma
+    # or dose; a bracketed or dashed part after it is the brand
+    # This is a simplified extraction - adjust based on actual PDF format
+    generic_name, brand_name = name_parts(features)
+    generic_name = generic_name.strip()
+    brand_name = (brand_name or '').strip() or generic_name
     
-    # Determine category (simplified - you may need to adjust)
-    category = determine_category(line)
+    # Extract strength: the first dose, or the first bare number before it
+    amount = features.first_amount()
+    strength = line[amount[0]:amount[1]] if amount else 'N/A'
     
-    # Determine schedule (simplified)
-    schedule = determine_schedule(line)
+    # Extract form
+    form = CLASSIFIER.first_match('form', hits, default='tablet')
     
     if not generic_name or len(generic_name) < 3:
         return None
     
-    return {
-        'genericName': generic_name,
-        'brandName': brand_name[:50],  # Limit length
-        'strength': strength,
-        'form': form,
-        'category': category,
-        'schedule': schedule,
-        'description': line[:200],  # Use line as description
-        'commonDosage': strength,
-        'commonFrequency': 'As prescribed'
-    }
+    return generic_name, brand_name, strength, form
 
-def determine_category(text):
-    """Determine medication category from text"""
-    text_lower = text.lower()
-    
-    categories = {
-        'Analgesics': ['paracetamol', 'aspirin', 'ibuprofen', 'codeine', 'morphine', 'tramadol'],
-        'Antibiotics': ['amoxicillin', 'penicillin', 'azithromycin', 'ciprofloxacin', 'doxycycline', 'metronidazole'],
-        'Cardiovascular': ['enalapril', 'losartan', 'atenolol', 'amlodipine', 'furosemide', 'hydrochlorothiazide'],
-        'Diabetes': ['metformin', 'glibenclamide', 'insulin', 'gliclazide'],
-        'Respiratory': ['salbutamol', 'beclomethasone', 'fluticasone', 'ipratropium'],
-        'Gastrointestinal': ['omeprazole', 'ranitidine', 'loperamide', 'metoclopramide'],
-        'Mental Health': ['fluoxetine', 'sertraline', 'amitriptyline', 'diazepam'],
-        'Antihistamines': ['loratadine', 'cetirizine', 'chlorpheniramine'],
-    }
+def medication_record(line, generic_name, brand_name, strength, form, category, schedule):
+    # Limit brand length and use the line as description
+    return MedicationRecord(generic_name, brand_name[:50], strength, form, category, schedule, description=line[:200],
+                            common_dosage=strength)
+
+def profile_medication_line(line, profile):
+    """try_parse_medication_line with each step timed and the deciding rule counted"""
+    with profile.stage('line filtering'):
+        skipped = SKIP_PATTERN.match(line)
+    if skipped:
+        profile.reject('skip ' + next(rule for rule in SKIP_RULES if re.match(rule, line, re.IGNORECASE)))
+        return None
     
-    for category, keywords in categories.items():
-        if any(keyword in text_lower for keyword in keywords):
-            return category
+    with profile.stage('classification'):
+        hits = CLASSIFIER.scan(line)
     
-    return 'Other'
-
-def determine_schedule(text):
-    """Determine South African schedule from text"""
-    text_lower = text.lower()
+    with profile.stage('line filtering'):
+        has_indicator = CLASSIFIER.matches('indicator', hits)
+    if not has_indicator:
+        profile.reject('no indicator')
+        return None
     
-    # Schedule indicators
-    if 'schedule 0' in text_lower or 'unscheduled' in text_lower:
-        return 'Schedule 0'
-    elif 'schedule 1' in text_lower:
-        return 'Schedule 1'
-    elif 'schedule 2' in text_lower:
-        return 'Schedule 2'
-    elif 'schedule 3' in text_lower:
-        return 'Schedule 3'
-    elif 'schedule 4' in text_lower:
-        return 'Schedule 4'
-    elif 'schedule 5' in text_lower:
-        return 'Schedule 5'
-    elif 'schedule 6' in text_lower:
-        return 'Schedule 6'
+    with profile.stage('field parsing'):
+        fields = parse_fields(line, hits)
+    if fields is None:
+        profile.reject('no name separator or short name')
+        return None
     
-    # Default based on medication type
-    if any(word in text_lower for word in ['paracetamol', 'ibuprofen']):
-        return 'Schedule 0'
-    elif any(word in text_lower for word in ['antibiotic', 'amoxicillin']):
-        return 'Schedule 3'
-    elif any(word in text_lower for word in ['hypertension', 'diabetes']):
-        return 'Schedule 4'
+    with profile.stage('classification'):
+        category = determine_category(line, hits)
+        schedule = determine_schedule(line, hits)
     
-    return 'Schedule 2'  # Default
+    profile.accept([f'indicator {keyword}' for keyword in MED_INDICATORS if keyword in hits])
+    return medication_record(line, *fields, category, schedule)
+
+def determine_category(text, hits=None):
+    """Determine medication category from text"""
+    if hits is None:
+        hits = CLASSIFIER.scan(text)
+    return CLASSIFIER.first_match('category', hits, default='Other')
+
+def determine_schedule(text, hits=None):
+    """Determine South African schedule from text"""
+    if hits is None:
+        hits = CLASSIFIER.scan(text)
+    return CLASSIFIER.first_match('schedule', hits, default='Schedule 2')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Extract medications from the 2024 EML PDF')
+    parser.add_argument('pdf', nargs='?', type=Path,
+                        default=Path(__file__).parent.parent / 'Primary-Healthcare-Standard-Treatment-Guidelines-and-Essential-Medicines-List-8th-Edition-2024.pdf',
+                        help='PDF to process (defaults to the 2024 EML in the project root)')
+    parser.add_argument('--backend', choices=['auto'] + list(BACKENDS), default='auto',
+                        help='PDF library to use; auto probes a few pages and picks the fastest installed one')
+    parser.add_argument('--boilerplate-share', type=float, default=DEFAULT_SHARE, metavar='FRACTION',
+                        help='Drop lines repeated on at least this share of sampled pages before parsing '
+                             f'(default: {DEFAULT_SHARE}, 0 = keep them)')
+    parser.add_argument('--canonicalize', action='store_true',
+                        help='Map generic names to the closest curated or known name (up to 2 typos) before dedup')
+    parser.add_argument('--vocabulary', type=Path, metavar='PATH',
+                        help='Extra reference names for --canonicalize, one per line')
+    parser.add_argument('--near-dedup', action='store_true',
+                        help='Also merge near-duplicate names/strengths and write a .clusters.json report')
+    parser.add_argument('--similarity', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Name similarity needed to merge in --near-dedup mode (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--output', type=Path, default=Path(__file__).parent.parent / 'extracted-medications.jsonl',
+                        help='Output path, .jsonl or .json (default: extracted-medications.jsonl in the project root)')
+    parser.add_argument('--profile', nargs='?', type=Path, const=True, default=None, metavar='REPORT',
+                        help='Time each stage, count the rule deciding each line and track peak memory, '
+                             'writing a JSON report (default: <output>.profile.json)')
+    return parser.parse_args()
 
 def main():
-    pdf_path = Path(__file__).parent.parent / 'Primary-Healthcare-Standard-Treatment-Guidelines-and-Essential-Medicines-List-8th-Edition-2024.pdf'
+    args = parse_args()
+    pdf_path = args.pdf
     
     if not pdf_path.exists():
         print(f"Error: PDF file not found at {pdf_path}")
         print("Please ensure the PDF file is in the project root directory")
         sys.exit(1)
     
-    print(f"Extracting medications from: {pdf_path}")
+    if args.vocabulary and not args.vocabulary.exists():
+        print(f"Error: vocabulary file not found: {args.vocabulary}")
+        sys.exit(1)
     
-    medications = []
+    print(f"Extracting medications from: {pdf_path}")
     
-    if HAS_PYMUPDF:
-        print("Using PyMuPDF (fitz) for extraction...")
-        medications = extract_with_pymupdf(pdf_path)
-    elif HAS_PDFPLUMBER:
-        print("Using pdfplumber for extraction...")
-        medications = extract_with_pdfplumber(pdf_path)
-    elif HAS_PYPDF2:
-        print("Using PyPDF2 for extraction...")
-        medications = extract_with_pypdf2(pdf_path)
-    else:
+    if not available_backends():
         print("Error: No PDF library found. Please install one:")
         print("  pip install PyMuPDF  # Recommended")
         print("  OR")
@@ -233,27 +252,85 @@ def main():
         print("  pip install PyPDF2")
         sys.exit(1)
     
-    # Remove duplicates
-    seen = set()
-    unique_medications = []
-    for med in medications:
-        key = (med['genericName'].lower(), med['strength'])
-        if key not in seen:
-            seen.add(key)
-            unique_medications.append(med)
+    backend = args.backend
+    if backend == 'auto':
+        backend, timings = probe_fastest_backend(pdf_path)
+        for name, seconds in timings.items():
+            print(f"  Probe: {name} took {seconds:.3f}s")
+    elif backend not in available_backends():
+        print(f"Error: {backend} is not installed")
+        sys.exit(1)
+    
+    print(f"Using {backend} for extraction...")
+    output_path = args.output
     
-    print(f"Extracted {len(unique_medications)} unique medications")
+    profile = None
+    if args.profile:
+        profile = ExtractionProfile()
+        profile.start()
+    
+    if profile is None:
+        boilerplate = learn_pdf_boilerplate(pdf_path, backend, args.boilerplate_share)
+    else:
+        with profile.stage('boilerplate learning'):
+            boilerplate = learn_pdf_boilerplate(pdf_path, backend, args.boilerplate_share)
+    print(f"Learnt {len(boilerplate)} boilerplate lines")
+    stats = {'boilerplate': 0}
     
-    # Save to JSON
-    output_path = Path(__file__).parent.parent / 'extracted-medications.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(unique_medications, f, indent=2, ensure_ascii=False)
+    canonicalizer = None
+    if args.canonicalize:
+        names = [name for names in CATEGORIES.values() for name in names]
+        canonicalizer = NameCanonicalizer(reference_names(names, args.vocabulary))
+        print(f"Canonicalising names against {len(canonicalizer)} reference names")
     
+    # Canonicalise names, then remove duplicates as records stream through
+    medications = extract_medications(pdf_path, backend, profile, boilerplate, stats)
+    if profile is None:
+        if canonicalizer is not None:
+            medications = iter_canonicalized(medications, canonicalizer)
+        medications = iter_unique_medications(medications)
+    else:
+        medications = profile.timed('pipeline overhead', medications)
+        if canonicalizer is not None:
+            medications = profile.timed('canonicalisation', iter_canonicalized(medications, canonicalizer))
+        medications = profile.timed('dedup', iter_unique_medications(medications))
+    
+    if args.near_dedup:
+        # Clustering needs every record, so this mode gives up streaming output
+        if profile is not None:
+            medications = list(medications)
+            with profile.stage('near dedup'):
+                medications, clusters = merge_near_duplicates(medications, args.similarity)
+        else:
+            medications, clusters = merge_near_duplicates(list(medications), args.similarity)
+        report_path = write_cluster_report(clusters, output_path)
+        print(f"Merged near-duplicates into {len(medications)} records, {len(clusters)} clusters reported in {report_path}")
+    
+    strengths = StrengthIndexBuilder()
+    medications = iter_indexed(medications, strengths)
+    
+    # Save as JSON Lines, one record at a time
+    if profile is None:
+        count = write_medications(medications, output_path)
+    else:
+        with profile.stage('serialisation'):
+            count = write_medications(medications, output_path)
+        profile.stop()
+        report_path = profile_report_path(output_path) if args.profile is True else args.profile
+        report = profile.report(script=Path(__file__).name, pdf=str(pdf_path), backend=backend, records=count)
+        write_profile_report(report, report_path)
+    
+    if stats['boilerplate']:
+        print(f"Dropped {stats['boilerplate']} boilerplate lines before parsing")
+    print(f"Extracted {count} unique medications")
     print(f"Saved to: {output_path}")
+    index = strengths.build()
+    print(f"Strength index: {len(index)} records in {write_strength_index(index, output_path)}")
+    if canonicalizer is not None:
+        canonicalizer.report()
     print(f"\nFirst 5 medications:")
-    for med in unique_medications[:5]:
+    for med in islice(iter_medications(output_path), 5):
         print(f"  - {med['genericName']} ({med['brandName']}) - {med['strength']} - {med['form']}")
 
 if __name__ == '__main__':
     main()
-
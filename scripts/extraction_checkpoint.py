@@ -0,0 +1,101 @@
+"""
+Checkpoints for long extraction runs (`--resume`)
+
+While an extraction runs, every unique record is also appended to
+`<output>.partial.jsonl`, and every few pages `<output>.checkpoint.json`
+records how many pages are complete and how many bytes of the partial file
+belong to them. A resumed run truncates the partial file to that point,
+rebuilds the dedup state from it, replays its records and continues from the
+next page, so the final output is identical to an uninterrupted run.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from medication_record import MedicationRecord
+
+# Pages between checkpoints
+DEFAULT_INTERVAL = 25
+
+def source_fingerprint(paths):
+    """Size and mtime of each input, so a resume never mixes two versions of a PDF"""
+    return [[str(path), os.stat(path).st_size, os.stat(path).st_mtime_ns] for path in paths]
+
+class ExtractionCheckpoint:
+    """Checkpoint state of one run; `signature` must match for a run to be resumed"""
+
+    def __init__(self, output_path, signature, interval=DEFAULT_INTERVAL):
+        output_path = Path(output_path)
+        stem = output_path.name.split('.')[0]
+        self.path = output_path.with_name(stem + '.checkpoint.json')
+        self.partial_path = output_path.with_name(stem + '.partial.jsonl')
+        self.signature = signature
+        self.interval = interval
+        self.pages_done = 0
+        self.records = 0
+        self._saved_at = 0
+        self._file = None
+
+    def resume(self):
+        """Load the last checkpoint; False if there is none, ValueError if it is from different inputs"""
+        if not self.path.exists() or not self.partial_path.exists():
+            return False
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state['signature'] != self.signature:
+            raise ValueError(f"{self.path} was written for different inputs, rules or options")
+
+        # Records written after the last checkpoint are discarded and re-parsed
+        with open(self.partial_path, 'r+b') as f:
+            f.truncate(state['partialBytes'])
+        self.pages_done = self._saved_at = state['pagesDone']
+        self.records = state['records']
+        return True
+
+    def iter_previous(self):
+        """Records written before the checkpoint, in output order"""
+        if not self.records:
+            return
+        with open(self.partial_path, 'rb') as f:
+            for line in f:
+                yield MedicationRecord.from_dict(json.loads(line))
+
+    def tee(self, medications):
+        """Append each record to the partial file as it passes through"""
+        # Binary mode, so tell() is a byte offset that resume() can truncate to
+        self._file = open(self.partial_path, 'ab' if self.records else 'wb')
+        try:
+            for med in medications:
+                self._file.write((json.dumps(med.to_dict(), ensure_ascii=False) + '\n').encode('utf-8'))
+                self.records += 1
+                yield med
+        finally:
+            self._file.close()
+            self._file = None
+
+    def page_done(self, pages_done):
+        """Called once every record of the first `pages_done` pages has gone through tee()"""
+        self.pages_done = pages_done
+        if self._file is None or pages_done - self._saved_at < self.interval:
+            return
+
+        self._file.flush()
+        state = {
+            'signature': self.signature,
+            'pagesDone': pages_done,
+            'records': self.records,
+            'partialBytes': self._file.tell(),
+        }
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_path, self.path)
+        self._saved_at = pages_done
+
+    def finish(self):
+        """Remove the checkpoint files once the output is complete"""
+        for path in (self.path, self.partial_path):
+            if path.exists():
+                path.unlink()
@@ -0,0 +1,145 @@
+"""
+Per-stage profiling for the medication extractor scripts (`--profile`)
+
+Stages are timed exclusively: while a nested stage runs (e.g. text extraction
+pulled through the dedup generator), its time is charged to that stage and not
+to the one around it. Generator hand-offs between stages and the profiler's own
+bookkeeping land in a "pipeline overhead" stage. Each line's fate is counted
+by the rule that decided it, so the slowest stages and the least selective
+rules stand out in the report.
+"""
+
+import json
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+class _Stage:
+    __slots__ = ('profile', 'name', 'started', 'nested')
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.nested = 0.0
+        self.profile._stack.append(self)
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started
+        stack = self.profile._stack
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+        entry = self.profile.stages.setdefault(self.name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed - self.nested
+
+class ExtractionProfile:
+    """Wall time and call counts per stage, plus rejection/acceptance counts per rule"""
+
+    def __init__(self):
+        self.stages = {}
+        self.rejected = Counter()
+        self.accepted = Counter()
+        self.lines = 0
+        self.worker_peak_bytes = 0
+        self._stack = []
+        self._started = None
+        self._wall = 0.0
+        self._peak_bytes = 0
+
+    def start(self):
+        """Start the wall clock and tracemalloc"""
+        tracemalloc.start()
+        self._started = time.perf_counter()
+
+    def stop(self):
+        self._wall = time.perf_counter() - self._started
+        self._peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def stage(self, name):
+        """Context manager charging the time spent inside it to a stage"""
+        return _Stage(self, name)
+
+    def timed(self, name, iterable):
+        """Yield from iterable, charging the time spent producing each item to a stage"""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def reject(self, reason, count=1):
+        self.lines += count
+        self.rejected[reason] += count
+
+    def accept(self, reasons):
+        self.lines += 1
+        self.accepted.update(reasons)
+
+    def to_dict(self):
+        """Raw counters, as returned from worker processes"""
+        return {
+            'stages': self.stages,
+            'rejected': dict(self.rejected),
+            'accepted': dict(self.accepted),
+            'lines': self.lines,
+            'peakBytes': tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else self._peak_bytes,
+        }
+
+    def merge(self, data):
+        """Add the counters of a worker's to_dict()"""
+        for name, (calls, seconds) in data['stages'].items():
+            entry = self.stages.setdefault(name, [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+        self.rejected.update(data['rejected'])
+        self.accepted.update(data['accepted'])
+        self.lines += data['lines']
+        self.worker_peak_bytes = max(self.worker_peak_bytes, data['peakBytes'])
+
+    def report(self, **context):
+        """Machine-readable report; context (script, pdf, workers, ...) is included as-is"""
+        stage_total = sum(seconds for _, seconds in self.stages.values()) or 1.0
+        accepted_lines = self.lines - sum(self.rejected.values())
+        return {
+            **context,
+            'wallSeconds': round(self._wall, 4),
+            'tracemallocPeakMb': round(self._peak_bytes / (1024 * 1024), 2),
+            'workerTracemallocPeakMb': round(self.worker_peak_bytes / (1024 * 1024), 2) or None,
+            'stages': {
+                name: {'calls': calls, 'seconds': round(seconds, 4), 'share': round(seconds / stage_total, 4)}
+                for name, (calls, seconds) in sorted(self.stages.items(), key=lambda item: -item[1][1])
+            },
+            'lines': {'total': self.lines, 'accepted': accepted_lines, 'rejected': self.lines - accepted_lines},
+            'rejectedBy': dict(self.rejected.most_common()),
+            'acceptedBy': dict(self.accepted.most_common()),
+        }
+
+def profile_report_path(output_path):
+    """<output>.profile.json next to the extractor output"""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name.split('.')[0] + '.profile.json')
+
+def write_profile_report(report, report_path):
+    """Write the report and print the hottest stages and most frequent rejections"""
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"\nProfile ({report['wallSeconds']:.2f}s wall, tracemalloc peak {report['tracemallocPeakMb']} MB):")
+    for name, stage in report['stages'].items():
+        print(f"  {name:<20} {stage['seconds']:>8.3f}s {stage['share']:>6.1%} {stage['calls']:>10} calls")
+    lines = report['lines']
+    print(f"  {lines['total']} lines: {lines['accepted']} accepted, {lines['rejected']} rejected")
+    for reason, count in list(report['rejectedBy'].items())[:5]:
+        print(f"    rejected {count:>8}  {reason}")
+    for reason, count in list(report['acceptedBy'].items())[:5]:
+        print(f"    accepted {count:>8}  {reason}")
+    print(f"Profile report: {report_path}")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Local formulary lookup service
+
+Loads the extraction output (and optionally the curated SA_MEDICATIONS) once
+into the in-memory indexes of formulary_lookup.py and answers lookups over
+localhost HTTP or line-by-line on stdio, so other tools (the Azure Functions
+under api/, data-quality scripts) need not re-parse the TypeScript or JSON.
+
+    GET /complete?q=amox&limit=10&category=Antibiotics   autocomplete
+    GET /search?q=amoxicillin 500&limit=50               every word, last one as a prefix
+    GET /medications/<id>                                exact lookup by ID
+    GET /nappi/<code>                                    exact lookup by NAPPI code
+    GET /categories                                      category names
+    GET /categories/<name>?limit=100                     entries of one category
+    GET /stats                                           index sizes and load time
+
+In --stdio mode each input line is one such path and each output line its
+JSON response. The source files are polled and the indexes rebuilt and
+swapped in when they change. --load-test replays generated queries against
+a running server (or in-process) and reports latency percentiles.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlsplit
+
+from formulary_lookup import FormularyLookup
+from formulary_ts import FORMULARY_PATH, load_formulary
+from medication_io import iter_medication_records
+from script_loader import SCRIPTS_DIR, load_script
+
+PROJECT_ROOT = SCRIPTS_DIR.parent
+EXTRACTED_PATH = PROJECT_ROOT / 'extracted-medications-2024.jsonl'
+
+DEFAULT_PORT = 8765
+POLL_INTERVAL = 1.0
+
+def file_state(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+class LookupService:
+    """Current FormularyLookup plus the request handling shared by HTTP and stdio"""
+
+    def __init__(self, extracted_path, curated=False):
+        self.extracted_path = Path(extracted_path)
+        self.curated = curated
+        self.integrator = load_script('integrate-medications.py')
+        self.sources = [FORMULARY_PATH, self.extracted_path] if curated else [self.extracted_path]
+        self.states = None
+        self.lookup = None
+        self.loaded_seconds = None
+        self.reload()
+
+    def load_entries(self):
+        """Curated entries first (if enabled), then the extraction with the IDs integration gives it"""
+        entries = load_formulary(FORMULARY_PATH, generated_path=None) if self.curated else []
+        stats = self.integrator.new_stats()
+        extracted = self.integrator.collect_formulary_entries(iter_medication_records(self.extracted_path), stats)
+        return entries + list(extracted.values())
+
+    def reload(self):
+        started = time.perf_counter()
+        states = [file_state(path) for path in self.sources]
+        lookup = FormularyLookup(self.load_entries())
+        # One assignment, so in-flight requests finish on the old indexes
+        self.lookup = lookup
+        self.states = states
+        self.loaded_seconds = time.perf_counter() - started
+        print(f"Loaded {len(lookup)} entries in {self.loaded_seconds * 1000:.0f} ms", file=sys.stderr)
+
+    def reload_if_changed(self):
+        if [file_state(path) for path in self.sources] == self.states:
+            return False
+        try:
+            self.reload()
+        except Exception as e:
+            # Usually an output file that is still being written; retried on the next poll
+            print(f"Reload failed, still serving the previous data: {type(e).__name__}: {e}", file=sys.stderr)
+            return False
+        return True
+
+    def watch(self, interval=POLL_INTERVAL):
+        """Poll the sources in a daemon thread"""
+        def poll():
+            while True:
+                time.sleep(interval)
+                self.reload_if_changed()
+        threading.Thread(target=poll, name='formulary-reload', daemon=True).start()
+
+    def handle(self, target):
+        """(HTTP status, JSON-ready payload) for a request path with its query string"""
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [unquote(part) for part in url.path.strip('/').split('/') if part]
+        lookup = self.lookup
+        try:
+            limit = int(params['limit']) if 'limit' in params else None
+        except ValueError:
+            return 400, {'error': 'limit must be an integer'}
+
+        if parts == ['complete']:
+            return 200, lookup.complete(params.get('q', ''), limit or 10, params.get('category'))
+        if parts == ['search']:
+            return 200, lookup.search(params.get('q', ''), limit or 50, params.get('category'))
+        if len(parts) == 2 and parts[0] in ('medications', 'nappi'):
+            entry = lookup.get(parts[1]) if parts[0] == 'medications' else lookup.get_by_nappi(parts[1])
+            return (200, entry) if entry is not None else (404, {'error': f'{parts[1]} not found'})
+        if parts == ['categories']:
+            return 200, lookup.categories()
+        if len(parts) == 2 and parts[0] == 'categories':
+            return 200, lookup.in_category(parts[1], limit or 100)
+        if parts == ['stats']:
+            return 200, dict(lookup.stats(), loadMs=round(self.loaded_seconds * 1000, 1))
+        return 404, {'error': f'unknown path {url.path}'}
+
+class LookupHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as two writes; with Nagle each response would
+    # wait for the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+    service = None
+
+    def do_GET(self):
+        status, payload = self.service.handle(self.path)
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def serve_http(service, port):
+    LookupHandler.service = service
+    server = ThreadingHTTPServer(('127.0.0.1', port), LookupHandler)
+    print(f"Serving {len(service.lookup)} entries on http://127.0.0.1:{port} (Ctrl-C to stop)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def serve_stdio(service):
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        status, payload = service.handle(line)
+        print(json.dumps({'status': status, 'body': payload}, ensure_ascii=False), flush=True)
+
+def load_test_queries(lookup, count, seed):
+    """Mixed request paths drawn from the loaded entries: mostly autocomplete, some exact and category lookups"""
+    rng = random.Random(seed)
+    entries = [entry for entry in lookup.entries if entry.get('genericName')]
+    categories = lookup.categories()
+    queries = []
+    for _ in range(count):
+        entry = rng.choice(entries)
+        kind = rng.random()
+        name = entry['genericName']
+        if kind < 0.6:
+            queries.append('/complete?' + urlencode({'q': name[:rng.randint(2, 6)]}))
+        elif kind < 0.75:
+            queries.append('/search?' + urlencode({'q': name.split()[0]}))
+        elif kind < 0.9 and entry.get('id'):
+            queries.append(f"/medications/{quote(entry['id'])}")
+        elif entry.get('nappiCode'):
+            queries.append(f"/nappi/{quote(str(entry['nappiCode']))}")
+        else:
+            queries.append('/complete?' + urlencode({'q': name[:3], 'category': rng.choice(categories)}))
+    return queries
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def report_latencies(label, latencies, seconds):
+    latencies = sorted(latencies)
+    print(f"{label}: {len(latencies)} requests in {seconds:.2f}s ({len(latencies) / seconds:,.0f}/s), "
+          f"p50 {percentile(latencies, 0.5) * 1000:.3f} ms, p99 {percentile(latencies, 0.99) * 1000:.3f} ms, "
+          f"max {latencies[-1] * 1000:.3f} ms")
+
+def run_load_test(service, queries, url=None, concurrency=1):
+    """Replay queries in-process (handler latency) or against a running server (HTTP round trips)"""
+    if url is None:
+        latencies = []
+        started = time.perf_counter()
+        for target in queries:
+            start = time.perf_counter()
+            service.handle(target)
+            latencies.append(time.perf_counter() - start)
+        report_latencies('In-process', latencies, time.perf_counter() - started)
+        return
+
+    address = urlsplit(url)
+    chunks = [queries[i::concurrency] for i in range(concurrency)]
+
+    def replay(chunk):
+        # One keep-alive connection per client thread
+        connection = http.client.HTTPConnection(address.hostname, address.port or 80, timeout=10)
+        latencies = []
+        errors = 0
+        for target in chunk:
+            start = time.perf_counter()
+            connection.request('GET', target)
+            response = connection.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            errors += response.status >= 500
+        connection.close()
+        return latencies, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(replay, chunks))
+    seconds = time.perf_counter() - started
+    report_latencies(f'HTTP ({concurrency} clients)', [latency for latencies, _ in results for latency in latencies],
+                     seconds)
+    errors = sum(errors for _, errors in results)
+    if errors:
+        print(f"  {errors} server errors")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Serve formulary lookups from the extraction output')
+    parser.add_argument('input', nargs='?', type=Path, default=EXTRACTED_PATH,
+                        help='Extraction output, .jsonl or .json (default: extracted-medications-2024.jsonl)')
+    parser.add_argument('--curated', action='store_true',
+                        help='Also serve the curated SA_MEDICATIONS entries (with their NAPPI codes)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'Localhost port to serve on (default: {DEFAULT_PORT})')
+    parser.add_argument('--stdio', action='store_true',
+                        help='Answer one request path per stdin line instead of serving HTTP')
+    parser.add_argument('--load-test', action='store_true',
+                        help='Replay generated queries and report p50/p99 latency, then exit')
+    parser.add_argument('--url',
+                        help='Load-test this running server (e.g. http://127.0.0.1:8765) instead of in-process')
+    parser.add_argument('--requests', type=int, default=10000, help='Load-test requests (default: 10000)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Load-test client threads (default: 4)')
+    parser.add_argument('--seed', type=int, default=2024, help='Load-test query seed')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if not args.input.exists() and args.input.with_suffix('.json').exists():
+        args.input = args.input.with_suffix('.json')
+    if not args.input.exists():
+        print(f"Error: extraction output not found: {args.input}")
+        print("Please run extract-formulary-medications.py first")
+        sys.exit(1)
+
+    service = LookupService(args.input, args.curated)
+
+    if args.load_test:
+        queries = load_test_queries(service.lookup, args.requests, args.seed)
+        run_load_test(service, queries, args.url, max(1, args.concurrency))
+        return
+
+    service.watch()
+    if args.stdio:
+        serve_stdio(service)
+    else:
+        serve_http(service, args.port)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+In-memory formulary lookups for the local lookup service
+
+Entries are SAMedication-shaped dicts (id, genericName, brandName, category,
+strength, form, ..., optionally nappiCode). FormularyLookup indexes them once:
+
+- a prefix trie over the words of each generic and brand name, whose nodes
+  keep the best COMPLETION_LIMIT entries below them, so autocomplete is one
+  walk down the prefix with no scan of the subtree
+- an inverted index word -> ascending entry positions for multi-word queries
+- hash maps for ID, NAPPI code and category
+
+Queries never modify the indexes, so a rebuilt FormularyLookup can replace
+the one in use while requests are being served.
+"""
+
+import re
+from bisect import bisect_left, insort
+
+# Entries kept per trie node, and the most a completion returns
+COMPLETION_LIMIT = 20
+
+WORD = re.compile(r'\d+(?:\.\d+)?|[a-z]+')
+
+# Fields returned for completions (the full entry is served by ID)
+SUMMARY_FIELDS = ('id', 'genericName', 'brandName', 'strength', 'form', 'category')
+
+def words(text):
+    return WORD.findall(str(text or '').lower())
+
+def summary(entry):
+    return {field: entry.get(field) for field in SUMMARY_FIELDS}
+
+class PrefixTrie:
+    """Character trie; each node holds its children and the top-ranked (rank, position) pairs below it"""
+
+    def __init__(self):
+        self.root = ({}, [])
+
+    def insert(self, word, rank, position):
+        node = self.root
+        self._offer(node[1], rank, position)
+        for char in word:
+            children = node[0]
+            if char not in children:
+                children[char] = ({}, [])
+            node = children[char]
+            self._offer(node[1], rank, position)
+
+    @staticmethod
+    def _offer(top, rank, position):
+        item = (rank, position)
+        if item in top or (len(top) >= COMPLETION_LIMIT and item >= top[-1]):
+            return
+        insort(top, item)
+        if len(top) > COMPLETION_LIMIT:
+            top.pop()
+
+    def top(self, prefix):
+        """(ranked positions of entries with a word starting with prefix, True if more were dropped)"""
+        node = self.root
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return [], False
+        # An entry can sit there twice, under a generic and a brand word
+        return list(dict.fromkeys(position for _, position in node[1])), len(node[1]) >= COMPLETION_LIMIT
+
+class FormularyLookup:
+    """Read-only indexes over a list of entries"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.trie = PrefixTrie()
+        self.postings = {}
+        self.by_id = {}
+        self.by_nappi = {}
+        self.by_category = {}
+
+        for position, entry in enumerate(entries):
+            if entry.get('id'):
+                self.by_id.setdefault(entry['id'], position)
+            if entry.get('nappiCode'):
+                self.by_nappi.setdefault(str(entry['nappiCode']), position)
+            self.by_category.setdefault(str(entry.get('category', '')).lower(), []).append(position)
+
+            generic = words(entry.get('genericName'))
+            brand = words(entry.get('brandName'))
+            name_length = len(str(entry.get('genericName') or ''))
+            for field, field_words in enumerate((generic, brand)):
+                for offset, word in enumerate(field_words):
+                    # Leading generic-name words first, then shorter names, then file order
+                    self.trie.insert(word, (field, offset > 0, name_length, position), position)
+            for word in set(generic) | set(brand) | set(words(entry.get('strength'))):
+                self.postings.setdefault(word, []).append(position)
+        self.vocabulary = sorted(self.postings)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, med_id):
+        position = self.by_id.get(med_id)
+        return self.entries[position] if position is not None else None
+
+    def get_by_nappi(self, code):
+        position = self.by_nappi.get(str(code).strip())
+        return self.entries[position] if position is not None else None
+
+    def categories(self):
+        return sorted({entry.get('category') for entry in self.entries if entry.get('category')})
+
+    def in_category(self, category, limit=None):
+        positions = self.by_category.get(str(category).lower(), [])
+        return [self.entries[position] for position in positions[:limit]]
+
+    def complete(self, prefix, limit=10, category=None):
+        """Entries with a name word starting with the last word of prefix (and every earlier word)"""
+        query = words(prefix)
+        if not query:
+            return []
+        candidates, truncated = self.trie.top(query[-1])
+        allowed = self._matching(query[:-1], category)
+        if allowed is not None:
+            filtered = [position for position in candidates if position in allowed]
+            if len(filtered) < limit and truncated:
+                # The trie only keeps the top entries per prefix; under a filter
+                # the remaining matches come from the inverted index
+                extra = sorted((allowed & self._prefix_positions(query[-1])) - set(filtered))
+                filtered.extend(extra[:limit - len(filtered)])
+            candidates = filtered
+        return [summary(self.entries[position]) for position in candidates[:limit]]
+
+    def search(self, text, limit=50, category=None):
+        """Entries containing every word of text (the last one as a prefix), in file order"""
+        query = words(text)
+        if not query:
+            return []
+        matches = self._prefix_positions(query[-1])
+        allowed = self._matching(query[:-1], category)
+        if allowed is not None:
+            matches &= allowed
+        return [self.entries[position] for position in sorted(matches)[:limit]]
+
+    def _prefix_positions(self, prefix):
+        """Positions of entries with an indexed word starting with prefix"""
+        positions = set()
+        for i in range(bisect_left(self.vocabulary, prefix), len(self.vocabulary)):
+            word = self.vocabulary[i]
+            if not word.startswith(prefix):
+                break
+            positions.update(self.postings[word])
+        return positions
+
+    def _matching(self, full_words, category=None):
+        """Positions containing all full_words and in category, or None when nothing restricts them"""
+        sets = [self.postings.get(word, ()) for word in full_words]
+        if category:
+            sets.append(self.by_category.get(str(category).lower(), ()))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        result = set(sets[0])
+        for other in sets[1:]:
+            result.intersection_update(other)
+        return result
+
+    def stats(self):
+        return {'entries': len(self.entries), 'ids': len(self.by_id), 'nappiCodes': len(self.by_nappi),
+                'categories': len(self.by_category), 'words': len(self.postings)}
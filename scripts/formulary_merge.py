@@ -0,0 +1,91 @@
+"""
+Merge stage between extraction and integration
+
+The curated SA_MEDICATIONS entries are parsed once into hash indexes on a
+normalised (generic name, strength, form) identity and on NAPPI code. Each
+extracted record is then classified with O(1) lookups:
+
+- new: no curated entry has its identity or NAPPI code
+- duplicate: a curated entry has the same identity and agrees on category
+  and schedule, so the record adds nothing
+- conflicting: a curated entry has the same identity but a different
+  category or schedule, or the same NAPPI code but a different identity
+
+Only new records are integrated; curated entries always win.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from strength import strength_key
+
+# Classification fields compared on an identity match; 'Other' is the
+# extractors' "unknown" category and never conflicts
+COMPARED_FIELDS = ('category', 'schedule')
+UNKNOWN_VALUES = {'category': 'Other'}
+
+def normalize_generic(name):
+    """Lowercase name with punctuation and repeated spaces removed"""
+    return ' '.join(re.findall(r'[a-z0-9]+', str(name or '').lower()))
+
+def identity_key(med):
+    return (
+        normalize_generic(med.get('genericName')),
+        strength_key(med.get('strength')),
+        str(med.get('form') or '').lower(),
+    )
+
+class FormularyIndex:
+    """Hash indexes over the curated formulary"""
+
+    def __init__(self, medications):
+        self.by_identity = {}
+        self.by_nappi = {}
+        for med in medications:
+            self.by_identity.setdefault(identity_key(med), med)
+            if med.get('nappiCode'):
+                self.by_nappi.setdefault(str(med['nappiCode']), med)
+
+    def classify(self, med):
+        """('new' | 'duplicate' | 'conflicting', matching curated entry, {field: [extracted, curated]})"""
+        key = identity_key(med)
+        curated = self.by_identity.get(key)
+        if curated is None:
+            by_nappi = self.by_nappi.get(str(med.get('nappiCode') or ''))
+            if by_nappi is None:
+                return 'new', None, {}
+            return 'conflicting', by_nappi, {'identity': [list(key), list(identity_key(by_nappi))]}
+
+        differences = {}
+        for field in COMPARED_FIELDS:
+            value = med.get(field)
+            if value and value != UNKNOWN_VALUES.get(field) and value != curated.get(field):
+                differences[field] = [value, curated.get(field)]
+        return ('conflicting' if differences else 'duplicate'), curated, differences
+
+def new_merge_report():
+    return {'duplicates': [], 'conflicts': []}
+
+def add_to_merge_report(report, status, med, curated, differences):
+    if status == 'new':
+        return
+    entry = {
+        'genericName': med.get('genericName'),
+        'strength': med.get('strength'),
+        'form': med.get('form'),
+        'curatedId': curated.get('id'),
+    }
+    if status == 'duplicate':
+        report['duplicates'].append(entry)
+    else:
+        entry['differences'] = differences
+        report['conflicts'].append(entry)
+
+def write_merge_report(report, extracted_path):
+    """Write the report next to the extraction, returning its path"""
+    extracted_path = Path(extracted_path)
+    report_path = extracted_path.with_name(extracted_path.name.split('.')[0] + '.merge.json')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return report_path
@@ -0,0 +1,122 @@
+"""
+Sharded, precompressed JSON artifacts for lazy loading of the formulary
+
+Medications are split per category (or per first letter of the generic name)
+into compact JSON shards with content-hashed file names, plus a small
+manifest.json the UI reads first. Every shard also gets .gz and .br copies for
+hosts that serve precompressed files. Unchanged shards are not rewritten.
+
+Shards hold the generated 2024 entries; the curated entries stay in the
+bundle. Given those, a search index over the curated entries followed by the
+shards in manifest order (the order the app appends them in) is written as
+one more hashed file, so the bundle need not carry it either.
+"""
+
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from search_index import build_search_index
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+SHARDS_DIR = Path(__file__).parent.parent / 'public' / 'formulary'
+
+MANIFEST_NAME = 'manifest.json'
+
+SEARCH_INDEX_KEY = 'search-index'
+
+SHARD_FILE = re.compile(r'^[a-z0-9-]+\.[0-9a-f]{10}\.json(\.gz|\.br)?$')
+
+def shard_key(med, shard_by):
+    """Shard a medication belongs to: a category slug or a lowercase initial"""
+    if shard_by == 'letter':
+        initial = str(med.get('genericName') or '')[:1].lower()
+        return initial if initial.isascii() and initial.isalpha() else 'other'
+    slug = re.sub(r'[^a-z0-9]+', '-', str(med.get('category') or 'Other').lower()).strip('-')
+    return slug or 'other'
+
+def compact_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _write_if_changed(path, data):
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+def _write_hashed(shards_dir, key, data, keep):
+    """Write <key>.<hash>.json and its compressed copies: (file info for the manifest, files written)"""
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    filename = f'{key}.{digest}.json'
+
+    # mtime=0 keeps the gzip bytes identical across runs
+    variants = {filename: data, filename + '.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if HAS_BROTLI:
+        variants[filename + '.br'] = brotli.compress(data, quality=11)
+
+    written = 0
+    for name, content in variants.items():
+        written += _write_if_changed(shards_dir / name, content)
+        keep.add(name)
+
+    info = {
+        'file': filename,
+        'bytes': len(data),
+        'gzipBytes': len(variants[filename + '.gz']),
+        'brotliBytes': len(variants[filename + '.br']) if HAS_BROTLI else None,
+    }
+    return info, written
+
+def write_shards(medications, shards_dir=SHARDS_DIR, shard_by='category', curated=None):
+    """Write shards, compressed copies and the manifest; return the manifest and files written
+
+    With curated (the bundled SA_MEDICATIONS entries), the search index is
+    written alongside and listed in the manifest.
+    """
+    shards_dir = Path(shards_dir)
+    shards_dir.mkdir(parents=True, exist_ok=True)
+
+    groups = {}
+    for med in medications:
+        # Optional fields are omitted when empty to keep shards small
+        compact = {field: value for field, value in med.items() if value not in (None, '')}
+        groups.setdefault(shard_key(med, shard_by), []).append(compact)
+
+    shards = []
+    keep = {MANIFEST_NAME}
+    written = 0
+    for key in sorted(groups):
+        info, count = _write_hashed(shards_dir, key, compact_json(groups[key]), keep)
+        written += count
+        shards.append({'key': key, 'count': len(groups[key]), **info})
+
+    search_index = None
+    if curated is not None:
+        ordered = list(curated) + [med for key in sorted(groups) for med in groups[key]]
+        search_index, count = _write_hashed(shards_dir, SEARCH_INDEX_KEY, compact_json(build_search_index(ordered)),
+                                            keep)
+        written += count
+
+    files = [shard['file'] for shard in shards] + ([search_index['file']] if search_index else [])
+    manifest = {
+        'version': hashlib.sha256(''.join(files).encode('utf-8')).hexdigest()[:10],
+        'shardBy': shard_by,
+        'total': sum(shard['count'] for shard in shards),
+        'shards': shards,
+        'searchIndex': search_index,
+    }
+    written += _write_if_changed(shards_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode('utf-8') + b'\n')
+
+    # Shards from earlier runs are no longer referenced by the manifest
+    for path in shards_dir.iterdir():
+        if path.name not in keep and SHARD_FILE.match(path.name):
+            path.unlink()
+
+    return manifest, written
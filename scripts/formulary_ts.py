@@ -0,0 +1,68 @@
+"""
+Read medication entries back out of the TypeScript formulary sources
+
+Parses the object literals of SA_MEDICATIONS in southAfricanFormulary.ts and of
+SA_MEDICATIONS_2024 in the generated module, returning plain dicts in the same
+order the app sees them.
+"""
+
+import json
+import re
+from pathlib import Path
+
+SERVICES_DIR = Path(__file__).parent.parent / 'src' / 'services'
+FORMULARY_PATH = SERVICES_DIR / 'southAfricanFormulary.ts'
+GENERATED_PATH = SERVICES_DIR / 'saFormulary2024.generated.ts'
+
+ENTRY_START = re.compile(r'^\s*\{\s*$')
+ENTRY_END = re.compile(r'^\s*\},?\s*$')
+FIELD = re.compile(r'^\s*(\w+):\s*(.+?),?\s*$')
+
+_JS_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+
+def _js_string(literal):
+    """Decode a single- or double-quoted JS string literal"""
+    if literal.startswith('"'):
+        return json.loads(literal)
+    body = literal[1:-1]
+    return re.sub(r'\\(.)', lambda m: _JS_ESCAPES.get(m.group(1), m.group(1)), body)
+
+def parse_medication_entries(source, array_name):
+    """Yield entry dicts from the `export const <array_name>` array literal in source"""
+    lines = source.split('\n')
+    declaration = re.compile(rf'export const {array_name}\b')
+    start = next((i for i, line in enumerate(lines) if declaration.search(line)), None)
+    if start is None:
+        return
+
+    entry = None
+    for line in lines[start + 1:]:
+        if entry is None:
+            if line.startswith('];'):
+                return
+            if ENTRY_START.match(line):
+                entry = {}
+        elif ENTRY_END.match(line):
+            yield entry
+            entry = None
+        else:
+            match = FIELD.match(line)
+            if match and match.group(2)[:1] in ('"', "'"):
+                entry[match.group(1)] = _js_string(match.group(2))
+
+def load_generated(generated_path=GENERATED_PATH):
+    """Entries of the generated 2024 module, in file order (none if it does not exist)"""
+    if not Path(generated_path).exists():
+        return []
+    with open(generated_path, 'r', encoding='utf-8') as f:
+        return list(parse_medication_entries(f.read(), 'SA_MEDICATIONS_2024'))
+
+def load_formulary(formulary_path=FORMULARY_PATH, generated_path=GENERATED_PATH):
+    """All SA_MEDICATIONS entries in app order: curated first, then the generated 2024 block"""
+    with open(formulary_path, 'r', encoding='utf-8') as f:
+        medications = list(parse_medication_entries(f.read(), 'SA_MEDICATIONS'))
+
+    if generated_path:
+        medications.extend(load_generated(generated_path))
+
+    return medications
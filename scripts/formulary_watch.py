@@ -0,0 +1,258 @@
+"""
+Watch mode for the formulary extractor (`--watch`)
+
+One long-running process polls the source PDFs and the extractor's
+RULE_FILES (the extractor itself and the helper modules it parses with).
+Page texts and the
+records parsed from them stay in memory, keyed by page text (and the
+category of the outline chapter the page is in):
+
+- a changed PDF is re-read, and only pages whose text is new are parsed
+- a changed rule file reloads the rules and re-parses the pages in memory,
+  without opening the PDFs again
+
+After each change the output file is rewritten and the diff that
+integrate-medications.py would apply to the generated module is printed.
+PDFs are not held open between changes, so they can be replaced in place.
+"""
+
+import importlib
+import os
+import sys
+import time
+from pathlib import Path
+
+import fitz
+
+from formulary_merge import FormularyIndex
+from formulary_ts import load_formulary
+from medication_io import iter_medication_records, write_medications
+from name_canonicalizer import NameCanonicalizer, iter_canonicalized
+from near_dedup import merge_near_duplicates, write_cluster_report
+from pdf_chapters import ChapterIndex
+from script_loader import load_script
+from strength_index import StrengthIndexBuilder, iter_indexed, write_strength_index
+
+POLL_INTERVAL = 1.0
+
+# Added, changed and removed entries listed per rebuild
+DIFF_SAMPLE = 5
+
+def file_state(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def load_rules(script_path, rule_files=()):
+    """Fresh copy of the extractor, after reloading the imported modules among its rule files"""
+    for path in rule_files:
+        module = sys.modules.get(Path(path).stem)
+        if module is not None:
+            importlib.reload(module)
+    return load_script(script_path.resolve(), 'formulary_rules')
+
+class WatchedDocument:
+    """Page texts and outline of one PDF, re-read only when its size or mtime changes"""
+
+    def __init__(self, path, document=None, edition=None):
+        self.path = Path(path)
+        self.document = document
+        self.edition = edition
+        self.state = None
+        self.texts = []
+        self.toc = []
+        self.boilerplate = frozenset()
+        # (page number, chapter category) of the pages being extracted
+        self.pages = []
+
+    def refresh(self):
+        """Re-read the page texts if the file changed; True if it did"""
+        state = file_state(self.path)
+        if state is None or state == self.state:
+            return False
+        try:
+            with fitz.open(self.path) as doc:
+                texts = [page.get_text() for page in doc]
+                toc = doc.get_toc()
+        except Exception as e:
+            # Usually a PDF that is still being written; retried on the next poll
+            print(f"  Could not read {self.path}: {e}")
+            return False
+        self.state = state
+        self.texts = texts
+        self.toc = toc
+        return True
+
+class FormularyWatcher:
+    """Warm extraction state: loaded rules, page texts and records per page text"""
+
+    def __init__(self, script_path, documents, output_path, prefilter=None, near_dedup=False,
+                 similarity=None, batch=False, boilerplate_share=None, canonicalize=False, vocabulary=None,
+                 chapters=None, chapter_categories=True):
+        self.script_path = Path(script_path)
+        self.documents = documents
+        self.output_path = Path(output_path)
+        self.prefilter = prefilter
+        self.near_dedup = near_dedup
+        self.similarity = similarity
+        self.batch = batch
+        self.boilerplate_share = boilerplate_share
+        self.canonicalize = canonicalize
+        self.vocabulary = vocabulary
+        self.chapters = chapters
+        self.chapter_categories = chapter_categories
+        self.rules = None
+        self.rule_states = None
+        self.records = {}
+
+        project_root = self.script_path.parent.parent
+        services_dir = project_root / 'src' / 'services'
+        self.module_path = services_dir / 'saFormulary2024.generated.ts'
+        self.integrator = load_script(self.script_path.resolve().with_name('integrate-medications.py'), 'formulary_integrator')
+        self.index = FormularyIndex(load_formulary(services_dir / 'southAfricanFormulary.ts', generated_path=None))
+
+    def refresh_rules(self):
+        """Reload the rules if a rule file changed; True if the parsing rules differ"""
+        rule_files = self.rules.RULE_FILES if self.rules is not None else [self.script_path]
+        states = [file_state(path) for path in rule_files]
+        if states == self.rule_states:
+            return False
+        self.rule_states = states
+
+        try:
+            rules = load_rules(self.script_path, rule_files)
+        except Exception as e:
+            # A half-saved edit; the previous rules stay in use
+            print(f"  Could not load rules: {type(e).__name__}: {e}")
+            return False
+        self.rule_states = [file_state(path) for path in rules.RULE_FILES]
+        if self.rules is not None and rules.RULES_VERSION == self.rules.RULES_VERSION:
+            return False
+        self.rules = rules
+        self.records = {}
+        return True
+
+    def parse_pages(self):
+        """Parse every selected page without records for the current rules, returning the count"""
+        stats = self.rules.new_extraction_stats()
+        records = {}
+        parsed = 0
+        for document in self.documents:
+            boilerplate = self.learn_boilerplate(document)
+            pages = self.page_categories(document)
+            for page_num, category in pages:
+                text = document.texts[page_num]
+                key = (boilerplate, category, text)
+                if key in records:
+                    continue
+                if key in self.records:
+                    records[key] = self.records[key]
+                    continue
+                records[key] = list(self.rules.iter_page_medications([text], prefilter=self.prefilter, stats=stats,
+                                                                     boilerplate=boilerplate, category=category))
+                parsed += 1
+            document.boilerplate = boilerplate
+            document.pages = pages
+        # Pages no longer in any document are dropped
+        self.records = records
+        return parsed
+
+    def learn_boilerplate(self, document):
+        """Boilerplate of a document from the same page sample a normal run reads"""
+        share = self.rules.DEFAULT_SHARE if self.boilerplate_share is None else self.boilerplate_share
+        if share <= 0:
+            return frozenset()
+        page_numbers = self.rules.sample_pages(len(document.texts))
+        return self.rules.learn_boilerplate((document.texts[i] for i in page_numbers), share)
+
+    def page_categories(self, document):
+        """(page number, chapter category) of the document's selected pages, in page order"""
+        index = ChapterIndex(document.toc, len(document.texts))
+        classify = self.rules.chapter_category if self.chapter_categories else lambda title: None
+        try:
+            segments = index.segments(classify, self.chapters)
+        except ValueError as e:
+            # The chapters were there at startup; an edited PDF may have lost them
+            print(f"  Skipping {document.path.name}: {e}")
+            return []
+        return [(page_num, category) for start, stop, category in segments for page_num in range(start, stop)]
+
+    def iter_records(self):
+        """Records of every selected page in document and page order, tagged in batch mode"""
+        for document in self.documents:
+            for page_num, category in document.pages:
+                key = (document.boilerplate, category, document.texts[page_num])
+                if not self.batch:
+                    yield from self.records[key]
+                    continue
+                for med in self.records[key]:
+                    yield med.replace(source_document=document.document, edition=document.edition)
+
+    def write_output(self):
+        medications = self.iter_records()
+        canonicalizer = None
+        if self.canonicalize:
+            # Rebuilt per write, so it follows reloaded name lists
+            canonicalizer = NameCanonicalizer(self.rules.canonical_vocabulary(self.vocabulary))
+            medications = iter_canonicalized(medications, canonicalizer)
+        medications = self.rules.iter_unique_medications(medications)
+        if self.near_dedup:
+            medications, clusters = merge_near_duplicates(list(medications), self.similarity)
+            write_cluster_report(clusters, self.output_path)
+        strengths = StrengthIndexBuilder()
+        count = write_medications(iter_indexed(medications, strengths), self.output_path)
+        write_strength_index(strengths.build(), self.output_path)
+        if canonicalizer is not None:
+            canonicalizer.report()
+        return count
+
+    def report_integration_diff(self):
+        """Print what integrate-medications.py would change in the generated module"""
+        medications = iter_medication_records(self.output_path)
+        stats, added, changed, removed = self.integrator.preview_integration(medications, self.module_path, self.index)
+        print(f"  Integration diff: {stats['added']} added, {stats['changed']} changed, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged "
+              f"({stats['duplicate']} duplicate, {stats['conflicting']} conflicting with curated entries)")
+        for sign, entries in (('+', added), ('~', changed)):
+            for entry in entries[:DIFF_SAMPLE]:
+                print(f"    {sign} {entry['genericName']} {entry['strength']} {entry['form']} ({entry['category']})")
+            if len(entries) > DIFF_SAMPLE:
+                print(f"    {sign} ... {len(entries) - DIFF_SAMPLE} more")
+        for med_id in removed[:DIFF_SAMPLE]:
+            print(f"    - {med_id}")
+        if len(removed) > DIFF_SAMPLE:
+            print(f"    - ... {len(removed) - DIFF_SAMPLE} more")
+
+    def rebuild(self):
+        """One poll: re-read what changed, re-parse affected pages and re-emit; True if anything ran"""
+        started = time.perf_counter()
+        first_build = self.rules is None
+        rules_changed = self.refresh_rules()
+        changed_documents = [document for document in self.documents if document.refresh()]
+        if self.rules is None or not (rules_changed or changed_documents):
+            return False
+
+        if rules_changed and not first_build:
+            print("Rules changed, re-parsing pages in memory")
+        for document in changed_documents:
+            print(f"Read {len(document.texts)} pages of {document.path.name}")
+
+        parsed = self.parse_pages()
+        count = self.write_output()
+        print(f"  Parsed {parsed} pages, wrote {count} medications to {self.output_path} "
+              f"in {time.perf_counter() - started:.2f}s")
+        self.report_integration_diff()
+        return True
+
+    def run(self, interval=POLL_INTERVAL):
+        """Poll until interrupted"""
+        self.rebuild()
+        print(f"Watching {len(self.documents)} PDF(s) and the extraction rules (Ctrl-C to stop)")
+        try:
+            while True:
+                time.sleep(interval)
+                self.rebuild()
+        except KeyboardInterrupt:
+            print("\nStopped watching")
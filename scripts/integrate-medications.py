@@ -1,49 +1,90 @@
 #!/usr/bin/env python3
 """
 Integrate extracted medications into the TypeScript formulary service
+
+The 2024 entries live in their own generated module (saFormulary2024.generated.ts)
+that SA_MEDICATIONS spreads in. Entry IDs are derived from a hash of each entry's
+identity, so re-running keeps IDs stable, only added/changed/removed entries are
+rewritten and an unchanged extraction leaves the file byte-identical.
+
+With --format shards the entries and the search index move out of the bundle
+into JSON shards under public/formulary; the generated module is then an empty
+stub that tells the app to load them (see formularyShards.ts).
 """
 
+import argparse
+import hashlib
 import json
+import os
+import re
+import sys
 from pathlib import Path
 
-def convert_to_typescript_medication(med, index):
-    """Convert JSON medication to TypeScript format"""
-    # Generate unique ID
-    med_id = f'med-2024-{index:04d}'
-    
+from formulary_merge import FormularyIndex, add_to_merge_report, new_merge_report, write_merge_report
+from formulary_shards import HAS_BROTLI, SHARDS_DIR, write_shards
+from formulary_ts import load_formulary
+from medication_io import iter_medication_records
+from search_index import SEARCH_INDEX_PATH, write_search_index
+
+GENERATED_HEADER = """// 2024 Formulary Medications
+// Generated by scripts/integrate-medications.py from the extracted 2024 EML.
+// Do not edit by hand: IDs are content-derived and the integrator rewrites
+// only entries that were added, changed or removed.
+import type { SAMedication } from './southAfricanFormulary';
+
+export const SA_MEDICATIONS_2024: SAMedication[] = ["""
+
+GENERATED_FOOTER = """];
+
+// true when the entries are loaded from public/formulary shards instead
+export const SA_FORMULARY_2024_SHARDED: boolean = {sharded};
+"""
+
+ENTRY_PATTERN = re.compile(r"^  \{\n    id: '([^']+)',.*?^  \}", re.MULTILINE | re.DOTALL)
+
+def medication_id(med):
+    """Stable ID from the fields that identify an entry (not its classification)"""
+    identity = '|'.join(str(med.get(field, '')).strip().lower()
+                        for field in ('genericName', 'strength', 'form'))
+    return 'med-2024-' + hashlib.sha1(identity.encode('utf-8')).hexdigest()[:10]
+
+def formulary_entry(med, med_id):
+    """Extracted medication as a SAMedication-shaped dict with defaults filled in"""
+    return {
+        'id': med_id,
+        'brandName': med.get('brandName', 'Generic'),
+        'genericName': med.get('genericName'),
+        'category': med.get('category', 'Other'),
+        'strength': med.get('strength', 'N/A'),
+        'form': med.get('form', 'tablet'),
+        'schedule': med.get('schedule', 'Schedule 2'),
+        'description': med.get('description', ''),
+        'commonDosage': med.get('commonDosage', med.get('strength', 'N/A')),
+        'commonFrequency': med.get('commonFrequency', 'As prescribed'),
+    }
+
+def convert_to_typescript_medication(entry):
+    """Convert a formulary entry to TypeScript format"""
     # Format the medication object
     ts_object = f"""  {{
-    id: '{med_id}',
-    brandName: {json.dumps(med.get('brandName', 'Generic'))},
-    genericName: {json.dumps(med.get('genericName'))},
-    category: {json.dumps(med.get('category', 'Other'))},
-    strength: {json.dumps(med.get('strength', 'N/A'))},
-    form: '{med.get('form', 'tablet')}',
-    schedule: {json.dumps(med.get('schedule', 'Schedule 2'))},
-    description: {json.dumps(med.get('description', ''))},
-    commonDosage: {json.dumps(med.get('commonDosage', med.get('strength', 'N/A')))},
-    commonFrequency: {json.dumps(med.get('commonFrequency', 'As prescribed'))}
+    id: '{entry['id']}',
+    brandName: {json.dumps(entry['brandName'])},
+    genericName: {json.dumps(entry['genericName'])},
+    category: {json.dumps(entry['category'])},
+    strength: {json.dumps(entry['strength'])},
+    form: '{entry['form']}',
+    schedule: {json.dumps(entry['schedule'])},
+    description: {json.dumps(entry['description'])},
+    commonDosage: {json.dumps(entry['commonDosage'])},
+    commonFrequency: {json.dumps(entry['commonFrequency'])}
   }}"""
     
     return ts_object
 
-def main():
-    # Load extracted medications
-    extracted_path = Path(__file__).parent.parent / 'extracted-medications-2024.json'
-    
-    if not extracted_path.exists():
-        print(f"Error: Extracted medications file not found: {extracted_path}")
-        print("Please run extract-formulary-medications.py first")
-        sys.exit(1)
-    
-    with open(extracted_path, 'r', encoding='utf-8') as f:
-        medications = json.load(f)
-    
-    print(f"Found {len(medications)} medications to integrate")
-    
-    # Filter out obviously invalid entries
-    valid_medications = []
+def iter_valid_medications(medications, stats):
+    """Filter out obviously invalid entries, counting what passes through"""
     for med in medications:
+        stats['found'] += 1
         generic = med.get('genericName', '').strip()
         # Skip if generic name is too short, contains URLs, or is clearly not a medication
         if (len(generic) >= 3 and 
@@ -52,27 +93,11 @@ def main():
             'health.gov' not in generic.lower() and
             not generic.lower().startswith('right to') and
             not generic.lower().startswith('usaid')):
-            valid_medications.append(med)
-    
-    print(f"Filtered to {len(valid_medications)} valid medications")
-    
-    # Generate TypeScript code
-    ts_medications = []
-    for i, med in enumerate(valid_medications):
-        ts_medications.append(convert_to_typescript_medication(med, i))
-    
-    # Read existing formulary file
-    formulary_path = Path(__file__).parent.parent / 'src' / 'services' / 'southAfricanFormulary.ts'
-    
-    with open(formulary_path, 'r', encoding='utf-8') as f:
-        formulary_content = f.read()
-    
-    # Find where SA_MEDICATIONS array ends
-    # Look for the closing bracket of the array
-    lines = formulary_content.split('\n')
-    
-    # Find the line with the closing bracket of SA_MEDICATIONS array
-    array_end_idx = -1
+            stats['valid'] += 1
+            yield med
+
+def find_array_end(lines):
+    """Find the line with the closing bracket of the SA_MEDICATIONS array"""
     bracket_count = 0
     in_array = False
     
@@ -82,33 +107,242 @@ def main():
         if in_array:
             bracket_count += line.count('[') - line.count(']')
             if bracket_count == 0 and '];' in line:
-                array_end_idx = i
-                break
+                return i
     
-    if array_end_idx == -1:
-        print("Error: Could not find end of SA_MEDICATIONS array")
-        sys.exit(1)
+    return -1
+
+def read_generated_entries(module_path):
+    """Map id -> entry text for every entry in the generated module, in file order"""
+    if not module_path.exists():
+        return None, {}
     
-    # Insert new medications before the closing bracket
-    new_lines = lines[:array_end_idx]
-    new_lines.append('')  # Empty line
-    new_lines.append('  // 2024 Formulary Medications')
-    new_lines.extend([ts_med + ',' for ts_med in ts_medications[:-1]])  # All but last with comma
-    new_lines.append(ts_medications[-1])  # Last without comma
-    new_lines.extend(lines[array_end_idx:])  # Rest of file
+    with open(module_path, 'r', encoding='utf-8') as f:
+        content = f.read()
     
-    # Write updated file
+    return content, {match.group(1): match.group(0) for match in ENTRY_PATTERN.finditer(content)}
+
+def remove_legacy_block(formulary_path):
+    """Strip a 2024 block appended inline by older versions of this script"""
+    with open(formulary_path, 'r', encoding='utf-8') as f:
+        lines = f.read().split('\n')
+    
+    if '  // 2024 Formulary Medications' not in lines:
+        return False
+    
+    marker_idx = lines.index('  // 2024 Formulary Medications')
+    array_end_idx = find_array_end(lines)
+    if array_end_idx < marker_idx or not re.search(r"id: 'med-2024-\d{4}'", '\n'.join(lines[marker_idx:array_end_idx])):
+        return False
+    
+    # The old block was inserted as a blank line, the marker and the entries
+    start = marker_idx - 1 if lines[marker_idx - 1] == '' else marker_idx
     with open(formulary_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(new_lines))
+        f.write('\n'.join(lines[:start] + lines[array_end_idx:]))
+    return True
+
+def collect_formulary_entries(medications, stats, index=None, merge_report=None):
+    """Turn extracted records into formulary entries keyed by content ID (first occurrence wins)
+
+    With a FormularyIndex of the curated entries, only records it classifies as
+    new are kept; duplicates and conflicts are counted and added to merge_report.
+    """
+    entries = {}
+    seen = set()
+    for med in iter_valid_medications(medications, stats):
+        med_id = medication_id(med)
+        if med_id in seen:
+            continue
+        seen.add(med_id)
+        if index is not None:
+            status, curated, differences = index.classify(med)
+            stats[status] += 1
+            if merge_report is not None:
+                add_to_merge_report(merge_report, status, med, curated, differences)
+            if status != 'new':
+                continue
+        entries[med_id] = formulary_entry(med, med_id)
+    return entries
+
+def render_generated_module(entries, sharded=False):
+    """Module text for rendered entries; a sharded module holds none and flags the shards"""
+    body = ',\n'.join(entries) + '\n' if entries else ''
+    return GENERATED_HEADER + '\n' + body + GENERATED_FOOTER.format(sharded='true' if sharded else 'false')
+
+def write_generated_module(module_path, content):
+    temp_path = module_path.with_name(module_path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, module_path)
+
+def new_stats():
+    return {'found': 0, 'valid': 0, 'new': 0, 'duplicate': 0, 'conflicting': 0,
+            'added': 0, 'changed': 0, 'removed': 0, 'unchanged': 0}
+
+def integrate_medications(medications, module_path, index=None, merge_report=None):
+    """Sync the generated 2024 module with extracted records: (counts per change type, module entries)
+
+    The entries are the module's formulary entries in file order. Without any
+    valid record the module is emptied, so no stale entries stay behind.
+    """
+    existing_content, existing = read_generated_entries(module_path)
     
-    print(f"Successfully integrated {len(valid_medications)} medications into {formulary_path}")
+    stats = new_stats()
+    incoming = collect_formulary_entries(medications, stats, index, merge_report)
+    rendered = {med_id: convert_to_typescript_medication(entry) for med_id, entry in incoming.items()}
+    
+    # Existing entries keep their position, new ones are appended in extraction order
+    order = []
+    for med_id, entry in existing.items():
+        if med_id not in incoming:
+            stats['removed'] += 1
+        elif rendered[med_id] == entry:
+            stats['unchanged'] += 1
+            order.append(med_id)
+        else:
+            stats['changed'] += 1
+            order.append(med_id)
+    for med_id in incoming:
+        if med_id not in existing:
+            stats['added'] += 1
+            order.append(med_id)
+    entries = [rendered[med_id] for med_id in order]
+    
+    content = render_generated_module(entries)
+    if content != existing_content:
+        write_generated_module(module_path, content)
+    
+    return stats, [incoming[med_id] for med_id in order]
 
-if __name__ == '__main__':
-    import sys
-    main()
+def preview_integration(medications, module_path, index=None):
+    """What integrate_medications would change, without writing: (stats, added, changed, removed)
 
+    added and changed are formulary entries, removed are IDs of generated entries.
+    """
+    _, existing = read_generated_entries(module_path)
+    stats = new_stats()
+    incoming = collect_formulary_entries(medications, stats, index)
+    added = []
+    changed = []
+    for med_id, entry in incoming.items():
+        if med_id not in existing:
+            added.append(entry)
+        elif convert_to_typescript_medication(entry) != existing[med_id]:
+            changed.append(entry)
+    removed = [med_id for med_id in existing if med_id not in incoming]
+    stats['added'] = len(added)
+    stats['changed'] = len(changed)
+    stats['removed'] = len(removed)
+    stats['unchanged'] = len(incoming) - len(added) - len(changed)
+    return stats, added, changed, removed
 
+def report_merge(stats, index, merge_report, extracted_path):
+    if index is None:
+        return
+    print(f"Merged against {len(index.by_identity)} distinct curated entries: {stats['new']} new, "
+          f"{stats['duplicate']} duplicate, {stats['conflicting']} conflicting")
+    if stats['duplicate'] or stats['conflicting']:
+        print(f"  Duplicates and conflicts skipped, see {write_merge_report(merge_report, extracted_path)}")
 
+def run_integration(medications, curated, module_path, index=None, report_path=None, output_format='ts',
+                    shard_by='category', shards_dir=SHARDS_DIR):
+    """Integrate extracted records and write the requested outputs (see --format)
 
+    curated are the SA_MEDICATIONS entries of southAfricanFormulary.ts; the merge
+    report is written next to report_path (the extraction file).
+    """
+    merge_report = new_merge_report()
+    if output_format == 'shards':
+        # The 2024 entries and the search index leave the bundle: the shards
+        # carry them and the generated modules become stubs
+        stats = new_stats()
+        generated = list(collect_formulary_entries(medications, stats, index, merge_report).values())
+        print(f"Found {stats['found']} medications to integrate")
+        print(f"Filtered to {stats['valid']} valid medications")
+        report_merge(stats, index, merge_report, report_path)
+        
+        content = render_generated_module([], sharded=True)
+        if not module_path.exists() or module_path.read_text(encoding='utf-8') != content:
+            write_generated_module(module_path, content)
+            print(f"Emptied {module_path}: the app loads the 2024 entries from shards")
+        if write_search_index(None):
+            print(f"Emptied search index: {SEARCH_INDEX_PATH} (written with the shards)")
+    else:
+        stats, generated = integrate_medications(medications, module_path, index, merge_report)
+        
+        print(f"Found {stats['found']} medications to integrate")
+        print(f"Filtered to {stats['valid']} valid medications")
+        report_merge(stats, index, merge_report, report_path)
+        
+        if not stats['valid'] and not stats['removed']:
+            print("Nothing to integrate")
+        elif not stats['valid']:
+            print(f"Emptied {module_path}: no valid medications, {stats['removed']} removed")
+        elif not (stats['added'] or stats['changed'] or stats['removed']):
+            print(f"No changes: {module_path} is up to date ({stats['unchanged']} entries)")
+        else:
+            print(f"Updated {module_path}: {stats['added']} added, {stats['changed']} changed, "
+                  f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+        
+        # The search index covers curated and generated entries alike, so it is
+        # rebuilt from both (and left untouched when nothing changed)
+        if write_search_index(curated + generated):
+            print(f"Updated search index: {SEARCH_INDEX_PATH}")
+    
+    if output_format in ('shards', 'both'):
+        # Only sharded output moves the search index into the shards; with
+        # both, the bundle keeps the entries and their index
+        manifest, written = write_shards(generated, shards_dir, shard_by,
+                                         curated if output_format == 'shards' else None)
+        total_bytes = sum(shard['bytes'] for shard in manifest['shards'])
+        gzip_bytes = sum(shard['gzipBytes'] for shard in manifest['shards'])
+        print(f"Wrote {len(manifest['shards'])} shards ({manifest['total']} medications, "
+              f"{total_bytes / 1024:.0f} KB, {gzip_bytes / 1024:.0f} KB gzipped) to {shards_dir}, "
+              f"{written} files changed")
+        if not HAS_BROTLI:
+            print("  Brotli copies skipped (pip install Brotli to enable)")
+    return stats
 
+def parse_args():
+    parser = argparse.ArgumentParser(description='Integrate extracted 2024 medications into the formulary')
+    parser.add_argument('--format', choices=['ts', 'shards', 'both'], default='ts',
+                        help='ts: generated TypeScript module and search index (bundled); shards: the 2024 '
+                             'entries and search index as lazily loaded JSON shards under public/formulary, with '
+                             'stub modules; both: the bundled module plus shards of it')
+    parser.add_argument('--shard-by', choices=['category', 'letter'], default='category',
+                        help='Split shards per category or per first letter of the generic name')
+    parser.add_argument('--shards-dir', type=Path, default=SHARDS_DIR,
+                        help='Where to write shards and manifest.json (default: public/formulary)')
+    parser.add_argument('--no-merge', action='store_true',
+                        help='Integrate every extracted record without checking it against the curated SA_MEDICATIONS')
+    return parser.parse_args()
 
+def main():
+    args = parse_args()
+    
+    # Load extracted medications (JSON Lines, or the legacy JSON array)
+    project_root = Path(__file__).parent.parent
+    extracted_path = project_root / 'extracted-medications-2024.jsonl'
+    if not extracted_path.exists() and extracted_path.with_suffix('.json').exists():
+        extracted_path = extracted_path.with_suffix('.json')
+    
+    if not extracted_path.exists():
+        print(f"Error: Extracted medications file not found: {extracted_path}")
+        print("Please run extract-formulary-medications.py first")
+        sys.exit(1)
+    
+    services_dir = project_root / 'src' / 'services'
+    formulary_path = services_dir / 'southAfricanFormulary.ts'
+    if remove_legacy_block(formulary_path):
+        print("Removed legacy inline 2024 block from southAfricanFormulary.ts")
+    
+    module_path = services_dir / 'saFormulary2024.generated.ts'
+    
+    # The curated entries are parsed once; every extracted record is checked
+    # against their hash index before it is integrated
+    curated = load_formulary(formulary_path, generated_path=None)
+    index = None if args.no_merge else FormularyIndex(curated)
+    run_integration(iter_medication_records(extracted_path), curated, module_path, index, extracted_path,
+                    args.format, args.shard_by, args.shards_dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Shared keyword classification engine for the medication extractor scripts
+
+All keyword lists (known medications, categories, schedules, forms, ...) are
+compiled once into a single regex. One pass over a line finds every keyword it
+contains, and each rule is then resolved from that hit set by priority rank.
+"""
+
+import re
+
+def _build_trie(keywords):
+    """Build a character trie where the '' key marks the end of a keyword"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+def _trie_to_regex(node):
+    """Turn a trie into a prefix-factored regex that prefers the longest keyword"""
+    is_end = '' in node
+    branches = [re.escape(char) + _trie_to_regex(child)
+                for char, child in sorted(node.items()) if char]
+
+    if not branches:
+        return ''
+
+    if len(branches) == 1:
+        body = branches[0]
+        grouped = body if len(body) == 1 else f'(?:{body})'
+    else:
+        grouped = '(?:' + '|'.join(branches) + ')'
+
+    # Greedy optional group: longer keywords are tried before their prefixes
+    return grouped + '?' if is_end else grouped
+
+class KeywordClassifier:
+    """Resolves several first-match keyword rules from one scan of a line
+
+    `rules` maps a rule name to an ordered list of (label, keywords) pairs.
+    Earlier pairs win, exactly like a chain of `any(kw in text ...)` checks.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self._ranks = {}
+        keywords = set()
+
+        for name, groups in rules.items():
+            ranks = {}
+            for rank, (label, group_keywords) in enumerate(groups):
+                for keyword in group_keywords:
+                    ranks.setdefault(keyword, (rank, label))
+                    keywords.add(keyword)
+            self._ranks[name] = ranks
+
+        # A regex match at a position reports only the longest keyword there,
+        # so shorter keywords that are prefixes of it are added back from here
+        self._prefixes = {
+            keyword: frozenset(other for other in keywords if keyword.startswith(other))
+            for keyword in keywords
+        }
+
+        pattern = _trie_to_regex(_build_trie(keywords)) if keywords else '(?!)'
+        self._pattern = re.compile(f'(?=({pattern}))')
+
+    def scan(self, text):
+        """Return every keyword contained in text (case-insensitive)"""
+        return self.scan_lowered(text.lower())
+
+    def scan_lowered(self, lowered):
+        """scan() for text the caller has already lowercased"""
+        hits = set()
+        for match in self._pattern.finditer(lowered):
+            hits.update(self._prefixes[match.group(1)])
+        return hits
+
+    def first_match(self, rule, hits, default=None):
+        """Label of the highest-priority group of `rule` with a keyword in hits"""
+        ranks = self._ranks[rule]
+        best = None
+        for keyword in hits:
+            entry = ranks.get(keyword)
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+        return best[1] if best else default
+
+    def matches(self, rule, hits):
+        """True if any keyword of `rule` is in hits"""
+        ranks = self._ranks[rule]
+        return any(keyword in ranks for keyword in hits)
@@ -0,0 +1,207 @@
+"""
+Single-pass line tokenizer for the medication extractors
+
+One compiled pattern walks a line left to right and records the structure
+the field extractors need: dose spans (with en-dash ranges such as
+"10–20 mg/kg" kept whole), bare numbers, parenthesised spans and the
+separators between name parts. Extractors read fields from this record instead
+of running their own regex searches over the line.
+
+Fields are computed on first use. The full scan runs only when a whole token
+list is asked for; the first amount and the name parts, which is all
+extract-medications-from-pdf.py needs, come from a couple of regex searches,
+and capitalised runs are only searched for by the extractor that uses them.
+"""
+
+import re
+
+# A dose is a number with a unit tail (group 1), so digits are tried once
+# rather than as a dose and then again as a bare number; the other groups
+# are the separators. The leading lookahead lets the scan skip letters and
+# spaces without trying every alternative at each position.
+AMOUNT = r"\d+(?:\.\d+)?((?:\s*[–-]\s*\d+(?:\.\d+)?)?\s*(?:mcg|mg|g|ml|%|units?)\b(?:/(?:kg|m2|dose))?)?"
+TOKEN_PATTERN = re.compile(rf"(?=[\d()–-])(?:{AMOUNT}|(\()|(\))|([–-]))", re.IGNORECASE)
+AMOUNT_PATTERN = re.compile(AMOUNT, re.IGNORECASE)
+DOSE, OPEN, CLOSE = 1, 2, 3
+
+SEPARATOR_PATTERN = re.compile(r'[()–-]')
+
+# Where a medication name ends: a bracket or dash, the comma before a route
+# ("Amoxicillin, oral, 500 mg") or the first digit of a dose. Dashes inside
+# ranges such as "4–6 hourly" come after a digit, so they never end a name.
+ROUTES = (r'oral|PO|IV|IM|SC|intravenous|intramuscular|subcutaneous|subcut|rectal|topical|inhaled|'
+          r'nebulised|nebulized|sublingual|buccal|vaginal|nasal|intranasal|ophthalmic|transdermal|slow IV')
+NAME_END_PATTERN = re.compile(rf'[()–-]|,\s*(?:{ROUTES})\b|\d', re.IGNORECASE)
+
+CAPS_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+class LineFeatures:
+    """Token spans of one line, computed on demand
+
+    Spans are (start, end) offsets into text: doses, numbers, parens (the
+    parenthesised contents) and caps (capitalised runs outside doses).
+    separators are the offsets of dashes and brackets outside dose ranges.
+    """
+
+    __slots__ = ('text', '_doses', '_numbers', '_parens', '_separators', '_caps')
+
+    def __init__(self, text):
+        self.text = text
+        self._doses = None
+        self._numbers = None
+        self._parens = None
+        self._separators = None
+        self._caps = None
+
+    def _scan(self):
+        doses = []
+        numbers = []
+        parens = []
+        separators = []
+        open_at = None
+
+        for match in TOKEN_PATTERN.finditer(self.text):
+            kind = match.lastindex
+            if kind is None:
+                numbers.append(match.span())
+            elif kind == DOSE:
+                doses.append(match.span())
+            else:
+                start = match.start()
+                separators.append(start)
+                if kind == OPEN:
+                    if open_at is None:
+                        open_at = start + 1
+                elif kind == CLOSE and open_at is not None:
+                    if start > open_at:
+                        parens.append((open_at, start))
+                    open_at = None
+
+        self._doses = doses
+        self._numbers = numbers
+        self._parens = parens
+        self._separators = separators
+
+    @property
+    def doses(self):
+        if self._doses is None:
+            self._scan()
+        return self._doses
+
+    @property
+    def numbers(self):
+        if self._numbers is None:
+            self._scan()
+        return self._numbers
+
+    @property
+    def parens(self):
+        if self._parens is None:
+            self._scan()
+        return self._parens
+
+    @property
+    def separators(self):
+        if self._separators is None:
+            self._scan()
+        return self._separators
+
+    @property
+    def caps(self):
+        if self._caps is None:
+            self._caps = scan_caps(self.text, self.doses)
+        return self._caps
+
+    def first_amount(self):
+        """Span of the first dose or bare number, whichever comes first, or None"""
+        match = AMOUNT_PATTERN.search(self.text)
+        return match.span() if match else None
+
+def scan_caps(text, doses):
+    """Capitalised runs, resuming after any dose a run would start in ("10 Units")"""
+    caps = []
+    pos = 0
+    search = CAPS_PATTERN.search
+    while True:
+        match = search(text, pos)
+        if match is None:
+            return caps
+        start = match.start()
+        inside = next((end for first, end in doses if first <= start < end), None)
+        if inside is not None:
+            pos = inside
+            continue
+        caps.append(match.span())
+        pos = match.end()
+
+def tokenize_line(text):
+    """The LineFeatures record of a line; tokens are read as its fields are used"""
+    return LineFeatures(text)
+
+def first_span_text(features, spans):
+    return features.text[spans[0][0]:spans[0][1]] if spans else None
+
+def is_range_dash(text, pos):
+    """True if the dash at pos joins two numbers, as in a "10–20 mg/kg" or "4–6 hourly" range"""
+    return text[:pos].rstrip()[-1:].isdigit() and text[pos + 1:].lstrip()[:1].isdigit()
+
+def name_parts(features):
+    """(name, brand) of a line: the text before the first bracket, dash, route comma or number,
+    and after a bracket or dash the text up to the next one outside a range (None otherwise)"""
+    text = features.text
+    end = NAME_END_PATTERN.search(text)
+    if end is None:
+        return text, None
+    name = text[:end.start()]
+    if end.group() not in ('(', ')', '–', '-'):
+        return name, None
+    for separator in SEPARATOR_PATTERN.finditer(text, end.end()):
+        if separator.group() in '()' or not is_range_dash(text, separator.start()):
+            return name, text[end.end():separator.start()]
+    return name, text[end.end():]
+
+# Wrapped dose text: a range cut after its dash, a number whose unit or range
+# end moved to the next line, and a "Name, route," list continuing with a dose
+RANGE_CUT = re.compile(r'\d\s*[–-]\s*$')
+UNIT_OR_RANGE_START = re.compile(r'\s*(?:[–-]\s*\d|(?i:mcg|mg|g|ml|units?)\b|%)')
+DOSE_START = re.compile(r'\s*\d+(?:\.\d+)?\s*(?i:mcg|mg|g|ml|%|units?)\b')
+
+# Lines are never joined into more than this many physical lines
+MAX_JOINED_LINES = 3
+
+def join_wrapped_lines(lines):
+    """Yield logical lines, joining dose text that wraps onto the next line
+
+    "Amoxicillin, oral, 10–" + "20 mg/kg", "Paracetamol, oral, 500" + "mg" and
+    "Amoxicillin, oral," + "500 mg 8 hourly" each become one line. Other line
+    breaks are left alone, so narrative text is not merged into paragraphs.
+    """
+    current = None
+    count = 0
+    for line in lines:
+        if current is not None and count < MAX_JOINED_LINES and wraps_onto(current, line):
+            head = current.rstrip()
+            # Range breaks are joined without a space
+            current = head + ('' if head.endswith(('–', '-')) else ' ') + line.lstrip()
+            count += 1
+            continue
+        if current is not None:
+            yield current
+        current = line
+        count = 1
+
+    if current is not None:
+        yield current
+
+def wraps_onto(line, next_line):
+    """True if next_line is the continuation of the dose text at the end of line"""
+    tail = line.rstrip()
+    if not tail:
+        return False
+    if RANGE_CUT.search(tail):
+        return next_line.lstrip()[:1].isdigit()
+    if tail[-1].isdigit():
+        return UNIT_OR_RANGE_START.match(next_line) is not None
+    if tail[-1] == ',':
+        return DOSE_START.match(next_line) is not None
+    return False
@@ -0,0 +1,73 @@
+"""
+Streaming readers and writers for extracted medication records
+
+`.jsonl` files hold one JSON record per line and are read line by line.
+Plain `.json` files hold the legacy indented array, which is written
+incrementally but read with json.load, so the whole array is in memory.
+
+Output goes to a sibling temp file that replaces the target only once every
+record is written, so a failed run leaves any earlier output intact and
+reading and writing the same path is safe.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from medication_record import MedicationRecord, as_dict
+
+# Flush every N records so partial output is visible (in the temp file) while extraction runs
+FLUSH_EVERY = 100
+
+def write_medications(medications, output_path):
+    """Write records (MedicationRecords or dicts) from an iterable as they arrive and return the count"""
+    output_path = Path(output_path)
+    is_jsonl = output_path.suffix == '.jsonl'
+    temp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        count = _write_records(medications, temp_path, is_jsonl)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    os.replace(temp_path, output_path)
+    return count
+
+def _write_records(medications, path, is_jsonl):
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        if not is_jsonl:
+            f.write('[')
+
+        for med in medications:
+            # Records only become dicts here, at the output boundary
+            med = as_dict(med)
+            if is_jsonl:
+                f.write(json.dumps(med, ensure_ascii=False) + '\n')
+            else:
+                # Same layout as json.dump(..., indent=2) on the whole list
+                item = json.dumps(med, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                f.write((',\n  ' if count else '\n  ') + item)
+
+            count += 1
+            if count % FLUSH_EVERY == 0:
+                f.flush()
+
+        if not is_jsonl:
+            f.write('\n]' if count else ']')
+
+    return count
+
+def iter_medications(input_path):
+    """Yield records one at a time from a .jsonl file (or a legacy .json array)"""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        if str(input_path).endswith('.jsonl'):
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+def iter_medication_records(input_path):
+    """iter_medications, as compact MedicationRecords"""
+    return map(MedicationRecord.from_dict, iter_medications(input_path))
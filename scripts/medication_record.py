@@ -0,0 +1,153 @@
+"""
+Compact in-memory representation of an extracted medication
+
+A plain dict per record costs a hash table plus nine strings, most of them
+repeats: form, category, schedule, frequency and source document take a
+handful of values, and the default description and dosage only restate the
+name, strength and form. MedicationRecord keeps the fields in __slots__,
+interns the low-cardinality ones so every record points at one shared string,
+and derives the description and dosage when they are the defaults. The
+extractors pass those defaults in explicitly; a record read from JSON without
+a description or dosage keeps it missing rather than gaining one.
+
+The extractors, dedup and integrator work on these records; to_dict() is
+only called where JSON is written. Read access also works through the JSON
+keys (record['genericName'], record.get('strength')), so code that handles
+curated dict entries and extracted records alike needs no special case.
+"""
+
+import sys
+
+DEFAULT_FREQUENCY = 'As prescribed'
+
+# JSON key -> attribute, in output key order
+FIELDS = {
+    'genericName': 'generic_name',
+    'brandName': 'brand_name',
+    'strength': 'strength',
+    'form': 'form',
+    'category': 'category',
+    'schedule': 'schedule',
+    'description': 'description',
+    'commonDosage': 'common_dosage',
+    'commonFrequency': 'common_frequency',
+    'sourceDocument': 'source_document',
+    'edition': 'edition',
+}
+
+# Keys only written when set (batch runs)
+OPTIONAL_KEYS = ('sourceDocument', 'edition')
+
+# Stored in place of a description or dosage that equals its default, so it
+# is derived on access; None means the field is missing
+DERIVED = False
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+class MedicationRecord:
+    """One extracted medication; description and dosage are stored only when they differ from the defaults"""
+
+    __slots__ = ('generic_name', 'brand_name', 'strength', 'form', 'category', 'schedule',
+                 '_description', '_common_dosage', 'common_frequency', 'source_document', 'edition')
+
+    def __init__(self, generic_name, brand_name, strength, form, category, schedule, description=None,
+                 common_dosage=None, common_frequency=DEFAULT_FREQUENCY, source_document=None, edition=None):
+        self.generic_name = generic_name
+        self.brand_name = brand_name
+        self.strength = strength
+        self.form = _intern(form)
+        self.category = _intern(category)
+        self.schedule = _intern(schedule)
+        self._description = DERIVED if description == self.default_description() else description
+        self._common_dosage = DERIVED if common_dosage == strength else common_dosage
+        self.common_frequency = _intern(common_frequency)
+        self.source_document = _intern(source_document)
+        self.edition = _intern(edition)
+
+    def default_description(self):
+        return f'{self.generic_name} {self.strength} {self.form}'
+
+    @property
+    def description(self):
+        return self.default_description() if self._description is DERIVED else self._description
+
+    @property
+    def common_dosage(self):
+        return self.strength if self._common_dosage is DERIVED else self._common_dosage
+
+    def set_source(self, document, edition):
+        self.source_document = _intern(document)
+        self.edition = _intern(edition)
+
+    def replace(self, **fields):
+        """Copy with some attributes changed; the description and dosage keep their current text"""
+        values = {
+            'generic_name': self.generic_name, 'brand_name': self.brand_name, 'strength': self.strength,
+            'form': self.form, 'category': self.category, 'schedule': self.schedule,
+            'description': self.description, 'common_dosage': self.common_dosage,
+            'common_frequency': self.common_frequency, 'source_document': self.source_document,
+            'edition': self.edition,
+        }
+        values.update(fields)
+        return MedicationRecord(**values)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, FIELDS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        attribute = FIELDS.get(key)
+        value = getattr(self, attribute) if attribute else None
+        return default if value is None else value
+
+    def to_dict(self):
+        """JSON-ready dict with the same keys and key order as the extractors always wrote"""
+        med = {key: getattr(self, attribute) for key, attribute in FIELDS.items() if key not in OPTIONAL_KEYS}
+        if self._description is None:
+            del med['description']
+        if self._common_dosage is None:
+            del med['commonDosage']
+        if self.source_document is not None or self.edition is not None:
+            med['sourceDocument'] = self.source_document
+            med['edition'] = self.edition
+        return med
+
+    @classmethod
+    def from_dict(cls, med):
+        """Record from a JSON object (missing fields stay None, so get() falls back to its default)"""
+        get = med.get
+        return cls(get('genericName'), get('brandName'), get('strength'), get('form'), get('category'),
+                   get('schedule'), get('description'), get('commonDosage'), get('commonFrequency'),
+                   get('sourceDocument'), get('edition'))
+
+    def to_row(self):
+        """Compact tuple for the page cache and process pool transfers"""
+        return (self.generic_name, self.brand_name, self.strength, self.form, self.category, self.schedule,
+                self._description, self._common_dosage, self.common_frequency, self.source_document, self.edition)
+
+    @classmethod
+    def from_row(cls, row):
+        record = cls.__new__(cls)
+        (record.generic_name, record.brand_name, record.strength, form, category, schedule,
+         record._description, record._common_dosage, frequency, document, edition) = row
+        record.form = _intern(form)
+        record.category = _intern(category)
+        record.schedule = _intern(schedule)
+        record.common_frequency = _intern(frequency)
+        record.source_document = _intern(document)
+        record.edition = _intern(edition)
+        return record
+
+    def __reduce__(self):
+        # Unpickled records re-intern their shared strings
+        return MedicationRecord.from_row, (self.to_row(),)
+
+    def __repr__(self):
+        return f'MedicationRecord({self.to_dict()!r})'
+
+def as_dict(med):
+    """JSON-ready dict of a MedicationRecord, or the dict itself"""
+    return med.to_dict() if isinstance(med, MedicationRecord) else med
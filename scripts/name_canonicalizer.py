@@ -0,0 +1,238 @@
+"""
+Fuzzy canonicalisation of extracted generic names
+
+Extracted names are raw line prefixes ("Amoxicillin, oral, 10", "o Paracetmol
+tablets"). Each is reduced to its leading words (bullets, doses and route or
+form words removed) and matched against a reference vocabulary: the
+extractors' known medication and category lists, the curated SA_MEDICATIONS
+generic names and an optional user list.
+
+Matching uses a SymSpell-style deletion dictionary: every vocabulary term is
+stored under all strings reachable by deleting up to MAX_DISTANCE characters
+from its first PREFIX_LENGTH characters, so a lookup only generates the
+deletions of the query and verifies the few terms found under them. Cost per
+lookup does not depend on the vocabulary size. Results are memoised per
+distinct normalised name.
+
+Typos are tolerated per word, never across a whole multi-word name: a word
+may differ by allowed_distance() edits and must keep its first letter, while
+short words ("a" in "Vitamin A", "g" in "Penicillin G") must match exactly.
+A name is only shortened to a leading word run when the first dropped word is
+not a salt, letter, release form or anything that looks like a drug name, so
+"Codeine Phosphate", "Insulin isophane" and "Metformin extended release" never
+lose their second word. Combinations ('/', '+' or 'and' in the raw name, as in
+"Sulfamethoxazole/trimethoprim") are only matched whole.
+"""
+
+import re
+
+from formulary_ts import FORMULARY_PATH, load_formulary
+from near_dedup import QUALIFIER_WORDS, SALT_WORDS, edit_distance
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+# Longer names are truncated to this many words before lookups
+MAX_WORDS = 4
+
+# A standalone number starts the dose part of a line ("B12" is part of a name)
+DOSE_START = re.compile(r'(?<![a-z0-9])\d')
+BULLET = re.compile(r'^[\W_]*(?:o\s+)?')
+WORD = re.compile(r'[a-z][a-z0-9]*')
+
+# Salts, release forms, drug classes and other words that make a different
+# product, so a name is never shortened past them
+DISTINGUISHING_WORDS = SALT_WORDS | {
+    'benzathine', 'procaine', 'compound', 'forte', 'paediatric', 'retard', 'depot', 'plus',
+    'extended', 'modified', 'sustained', 'controlled', 'prolonged', 'delayed', 'release', 'biphasic',
+    'soluble', 'channel', 'blocker', 'inhibitor', 'antagonist', 'agonist',
+}
+
+# Endings of drug names ("lysine", "isophane", "trimethoprim"); words of at
+# least DRUG_WORD_LENGTH letters ending in one are treated as part of the name
+DRUG_SUFFIXES = (
+    'ine', 'ide', 'ate', 'ole', 'one', 'ane', 'cin', 'pril', 'sartan', 'olol', 'vir', 'mab', 'prim',
+    'pam', 'statin', 'cillin', 'parin', 'cycline',
+)
+DRUG_WORD_LENGTH = 6
+
+# Raw-name marks of a combination product, which normalize_term removes
+COMBINATION = re.compile(r'[/+&]|\band\b')
+
+def normalize_term(text):
+    """Lowercase leading name words, without bullets, doses and route or form words"""
+    lowered = BULLET.sub('', str(text or '').lower())
+    head = DOSE_START.split(lowered, maxsplit=1)[0]
+    return ' '.join(word for word in WORD.findall(head) if word not in QUALIFIER_WORDS)
+
+def allowed_distance(word):
+    """Edits tolerated in one word: none for short words, where one edit is another word"""
+    if len(word) < 5:
+        return 0
+    return 1 if len(word) < 10 else MAX_DISTANCE
+
+def term_distance(query, term):
+    """Sum of per-word edit distances, or None if any word differs by more than it may"""
+    query_words = query.split()
+    term_words = term.split()
+    if len(query_words) != len(term_words):
+        return None
+    total = 0
+    for query_word, term_word in zip(query_words, term_words):
+        if query_word == term_word:
+            continue
+        limit = allowed_distance(query_word)
+        # Misspellings rarely touch the first letter; a different one is usually another drug
+        if limit == 0 or query_word[0] != term_word[0]:
+            return None
+        distance = edit_distance(query_word, term_word, limit)
+        if distance > limit:
+            return None
+        total += distance
+    return total
+
+def lookup_distance(term):
+    """Edits the deletion dictionary must reach for a term, at most MAX_DISTANCE"""
+    return min(MAX_DISTANCE, sum(allowed_distance(word) for word in term.split()))
+
+def is_distinguishing(word):
+    """True for salts, qualifiers, drug-like words and letter or short tokens such as 'g' or 'b12'"""
+    return (word in DISTINGUISHING_WORDS or len(word) <= 2 or any(char.isdigit() for char in word)
+            or (len(word) >= DRUG_WORD_LENGTH and word.endswith(DRUG_SUFFIXES)))
+
+def is_combination(raw_name):
+    """True if the name part of a raw name joins drugs with '/', '+', '&' or 'and'"""
+    head = DOSE_START.split(str(raw_name or '').lower(), maxsplit=1)[0]
+    return COMBINATION.search(head) is not None
+
+def title_words(name):
+    """'vitamin d' -> 'Vitamin D'"""
+    return ' '.join(word[:1].upper() + word[1:] for word in name.split())
+
+def deletes(term, distance):
+    """The term and every string obtained by deleting up to `distance` characters"""
+    found = {term}
+    frontier = {term}
+    for _ in range(distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))} - found
+        found |= frontier
+    return found
+
+class SymSpellIndex:
+    """Deletion dictionary over normalised vocabulary terms"""
+
+    def __init__(self, terms=()):
+        self.terms = set()
+        self.deletes = {}
+        for term in terms:
+            self.add(term)
+
+    def add(self, term):
+        if term in self.terms:
+            return
+        self.terms.add(term)
+        for delete in deletes(term[:PREFIX_LENGTH], MAX_DISTANCE):
+            self.deletes.setdefault(delete, []).append(term)
+
+    def lookup(self, word, limit):
+        """(closest term, distance) within limit edits and term_distance() rules, ties alphabetical, or None"""
+        if word in self.terms:
+            return word, 0
+        if limit <= 0:
+            return None
+
+        best = None
+        checked = set()
+        for delete in deletes(word[:PREFIX_LENGTH], limit):
+            for term in self.deletes.get(delete, ()):
+                if term in checked:
+                    continue
+                checked.add(term)
+                distance = term_distance(word, term)
+                if distance is not None and (best is None or (distance, term) < best):
+                    best = (distance, term)
+        return (best[1], best[0]) if best else None
+
+class NameCanonicalizer:
+    """Maps raw extracted names to vocabulary names, memoised per normalised name"""
+
+    def __init__(self, names):
+        # The first cased spelling of a term wins, so curated names passed
+        # first keep their casing; lowercase list entries are title-cased
+        names = list(names)
+        self.display = {}
+        for name in names:
+            term = normalize_term(name)
+            if term and name != name.lower():
+                self.display.setdefault(term, name)
+        for name in names:
+            term = normalize_term(name)
+            if term and term not in self.display:
+                self.display[term] = title_words(name)
+        self.index = SymSpellIndex(self.display)
+        # Any vocabulary word is a drug name, however it ends
+        self.words = {word for term in self.display for word in term.split()}
+        self.memo = {}
+        self.stats = {'exact': 0, 'fuzzy': 0, 'unmatched': 0}
+
+    def __len__(self):
+        return len(self.display)
+
+    def match(self, raw_name):
+        """(canonical name, edit distance) for a raw name, or None"""
+        key = (normalize_term(raw_name), is_combination(raw_name))
+        if key not in self.memo:
+            self.memo[key] = self._match(*key)
+        return self.memo[key]
+
+    def _match(self, term, whole):
+        # Whole name first, then ever shorter leading word runs, but never
+        # dropping a word that makes it another product; combinations are
+        # only matched whole
+        words = term.split()
+        if whole and len(words) > MAX_WORDS:
+            return None
+        words = words[:MAX_WORDS]
+        for count in range(len(words), 0, -1):
+            if count < len(words) and (whole or is_distinguishing(words[count]) or words[count] in self.words):
+                return None
+            term = ' '.join(words[:count])
+            found = self.index.lookup(term, lookup_distance(term))
+            if found is not None:
+                return self.display[found[0]], found[1]
+        return None
+
+    def canonicalize(self, med):
+        """The record with its generic name replaced by the canonical one (the original stays in the description)"""
+        found = self.match(med.generic_name)
+        if found is None:
+            self.stats['unmatched'] += 1
+            return med
+        name, distance = found
+        self.stats['fuzzy' if distance else 'exact'] += 1
+        return med if name == med.generic_name else med.replace(generic_name=name)
+
+    def report(self):
+        print(f"  Canonical names: {self.stats['exact']} exact, {self.stats['fuzzy']} fuzzy, "
+              f"{self.stats['unmatched']} unmatched ({len(self.memo)} distinct names, "
+              f"{len(self)} vocabulary terms)")
+
+def iter_canonicalized(medications, canonicalizer):
+    for med in medications:
+        yield canonicalizer.canonicalize(med)
+
+def load_vocabulary_file(path):
+    """Names from a text file, one per line; blank lines and # comments are skipped"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+def reference_names(names, vocabulary_path=None):
+    """Curated generic names first, then the given names and those in the vocabulary file"""
+    curated = [med['genericName'] for med in load_formulary(FORMULARY_PATH, generated_path=None)
+               if med.get('genericName')]
+    extra = load_vocabulary_file(vocabulary_path) if vocabulary_path else []
+    return curated + list(names) + extra
+
+def vocabulary_files(vocabulary_path=None):
+    """Files reference_names reads, for checkpoint signatures"""
+    return [path for path in (FORMULARY_PATH, vocabulary_path) if path]
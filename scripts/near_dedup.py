@@ -0,0 +1,256 @@
+"""
+Near-duplicate clustering for extracted medications
+
+Exact dedup on (genericName, strength) leaves fragments like "Paracetamol, oral,
+10" and "Paracetamol, oral, 500 mg to 1" as separate entries. Here names are
+normalised, each distinct normalised name gets a MinHash signature over its
+character trigrams, and locality-sensitive hashing (banded signatures) proposes
+candidate pairs. Only candidates sharing a bucket are compared, so the cost
+grows with the number of records rather than with the number of pairs.
+
+Similar spelling is not enough to merge: single letters and salt words
+("Vitamin D", "Penicillin V", "sodium") must match exactly, and the first words
+may differ by one edit at most, so a typo merges but Prednisolone and
+Prednisone, at trigram Jaccard 0.71, stay apart.
+"""
+
+import json
+import re
+import zlib
+from pathlib import Path
+
+from strength import canonical_strength
+
+# 8 bands of 2 rows: names with trigram Jaccard 0.7 become candidates with
+# probability ~0.99, while verification below rejects the false positives
+NUM_PERM = 16
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+
+# Candidates must reach this trigram Jaccard similarity to be merged
+DEFAULT_THRESHOLD = 0.7
+
+# First words of merged names may differ by this many edits (a typo)
+MAX_HEAD_EDITS = 1
+
+# Each bucket member is verified against at most this many earlier members
+MAX_BUCKET_COMPARISONS = 8
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+
+# Route, form and dosing words that follow the drug name in EML lines
+QUALIFIER_WORDS = {
+    'oral', 'iv', 'im', 'sc', 'topical', 'rectal', 'sublingual', 'inhalation',
+    'inhaled', 'nebulised', 'slow', 'infusion', 'injection', 'tablet', 'tablets',
+    'capsule', 'capsules', 'syrup', 'suspension', 'solution', 'cream', 'ointment',
+    'drops', 'eye', 'ear', 'nasal', 'dose', 'single', 'stat', 'daily', 'hourly',
+}
+
+# Salt words: a name with a different salt is a different product
+SALT_WORDS = {
+    'acetate', 'besylate', 'bromide', 'carbonate', 'chloride', 'citrate', 'dipropionate', 'fumarate',
+    'gluconate', 'hydrobromide', 'hydrochloride', 'lactate', 'maleate', 'mesylate', 'nitrate', 'oxide',
+    'phosphate', 'potassium', 'propionate', 'sodium', 'succinate', 'sulfate', 'sulphate', 'tartrate',
+    'trisilicate', 'valerate',
+}
+
+def _permutations(count):
+    """Deterministic (a, b) coefficients for the universal hash family"""
+    coefficients = []
+    seed = 2024
+    for _ in range(count):
+        seed = (seed * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        a = (seed >> 3) % (_PRIME - 1) + 1
+        seed = (seed * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        b = (seed >> 3) % _PRIME
+        coefficients.append((a, b))
+    return coefficients
+
+_COEFFICIENTS = _permutations(NUM_PERM)
+
+def normalize_name(name):
+    """Lowercase drug name with dosing fragments, punctuation and route words removed"""
+    head = re.split(r'\d', name, maxsplit=1)[0].lower()
+    words = re.findall(r'[a-z]+', head)
+    # A leading single letter is a list bullet ("o Salbutamol"); later ones
+    # tell drugs apart ("Vitamin D", "Penicillin V") and are kept
+    if words and len(words[0]) == 1:
+        words = words[1:]
+    return ' '.join(word for word in words if word not in QUALIFIER_WORDS)
+
+def distinguishing_words(name):
+    """Single letters and salt words of a normalised name, which must match for a merge"""
+    return {word for word in name.split() if len(word) == 1 or word in SALT_WORDS}
+
+def same_drug(name, other):
+    """True if two similar normalised names can be spellings of one drug"""
+    if distinguishing_words(name) != distinguishing_words(other):
+        return False
+    head, other_head = name.split(' ', 1)[0], other.split(' ', 1)[0]
+    return edit_distance(head, other_head, MAX_HEAD_EDITS) <= MAX_HEAD_EDITS
+
+def display_name(name):
+    """Original-case name up to the first comma or digit, e.g. 'Amoxicillin'"""
+    head = re.split(r'[\d,]', name, maxsplit=1)[0]
+    head = re.sub(r'^[o•*\-–]\s+', '', head.strip())
+    return head.strip(' -–(:;.') or name.strip()
+
+def normalize_strength(strength):
+    """Canonical strength string (see strength.py), or None when the strength has no unit"""
+    return canonical_strength(strength)
+
+def trigrams(text):
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# Trigram vocabularies are small, so each shingle's permuted hashes are memoised
+_shingle_hashes = {}
+
+def _hash_shingle(shingle):
+    hashes = _shingle_hashes.get(shingle)
+    if hashes is None:
+        h = zlib.crc32(shingle.encode('utf-8'))
+        hashes = _shingle_hashes[shingle] = tuple(((a * h + b) % _PRIME) & _MASK for a, b in _COEFFICIENTS)
+    return hashes
+
+def minhash(shingles):
+    """MinHash signature of a shingle set"""
+    return tuple(map(min, zip(*map(_hash_shingle, shingles))))
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance, or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, item):
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the earliest name as the root so cluster order is stable
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+def cluster_names(names, threshold=DEFAULT_THRESHOLD):
+    """Group distinct normalised names, returning a cluster root index per name"""
+    shingles = [trigrams(name) for name in names]
+    union_find = _UnionFind(len(names))
+
+    buckets = {}
+    for index, name_shingles in enumerate(shingles):
+        signature = minhash(name_shingles)
+        for band in range(BANDS):
+            key = (band, signature[band * ROWS:(band + 1) * ROWS])
+            buckets.setdefault(key, []).append(index)
+
+    for members in buckets.values():
+        for position in range(1, len(members)):
+            current = members[position]
+            for earlier in members[max(0, position - MAX_BUCKET_COMPARISONS):position]:
+                if union_find.find(current) == union_find.find(earlier):
+                    break
+                if jaccard(shingles[current], shingles[earlier]) >= threshold and same_drug(names[current],
+                                                                                            names[earlier]):
+                    union_find.union(current, earlier)
+                    break
+
+    return [union_find.find(index) for index in range(len(names))]
+
+def merge_near_duplicates(medications, threshold=DEFAULT_THRESHOLD):
+    """Merge near-duplicate records
+
+    Records are grouped by name cluster and unit-normalised strength. Records
+    whose strength has no unit (dosing fragments like "10") fold into the first
+    record of their name cluster. Returns (merged records, cluster report).
+    """
+    name_ids = {}
+    record_names = []
+    for med in medications:
+        name = normalize_name(med.generic_name)
+        record_names.append(name_ids.setdefault(name, len(name_ids)))
+
+    names = list(name_ids)
+    roots = cluster_names(names, threshold)
+
+    merged = []
+    groups = {}
+    primary = {}
+    clusters = {}
+    for med, name_id in zip(medications, record_names):
+        raw_name = med.generic_name
+        if not names[name_id]:
+            # Nothing left to compare once qualifiers are removed
+            merged.append(med)
+            continue
+
+        root = roots[name_id]
+        cluster = clusters.get(root)
+        if cluster is None:
+            cluster = clusters[root] = {
+                'canonicalName': display_name(raw_name),
+                'normalizedName': names[root],
+                'records': 0,
+                'strengths': [],
+                'members': {},
+            }
+        cluster['records'] += 1
+        cluster['members'][raw_name] = cluster['members'].get(raw_name, 0) + 1
+
+        strength = normalize_strength(med.strength)
+        if strength is None:
+            if root in primary:
+                continue
+        elif (root, strength) in groups:
+            continue
+
+        record = med.replace(generic_name=cluster['canonicalName'])
+        merged.append(record)
+        primary.setdefault(root, record)
+        if strength is not None:
+            groups[(root, strength)] = record
+            cluster['strengths'].append(strength)
+
+    report = [
+        {
+            'canonicalName': cluster['canonicalName'],
+            'normalizedName': cluster['normalizedName'],
+            'records': cluster['records'],
+            'strengths': cluster['strengths'],
+            'members': [{'name': name, 'count': count} for name, count in cluster['members'].items()],
+        }
+        for cluster in clusters.values()
+        if cluster['records'] > 1
+    ]
+    return merged, report
+
+def write_cluster_report(report, output_path):
+    """Write the cluster report next to the merged output, returning its path"""
+    output_path = Path(output_path)
+    report_path = output_path.with_name(output_path.name.split('.')[0] + '.clusters.json')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return report_path
@@ -0,0 +1,113 @@
+"""
+On-disk cache of parsed records per PDF page
+
+Entries are keyed by a hash of the page text plus a version of the parsing
+rules, so unchanged pages are not re-parsed on re-runs and any change to the
+rules invalidates the cache. The cache is a single SQLite file capped in size,
+evicting least recently used pages first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def fingerprint_files(paths):
+    """Hash the contents of the files that define the parsing rules"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+class PageCache:
+    """SQLite-backed page -> parsed records cache, safe to share between worker processes"""
+
+    def __init__(self, path, rules_version, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.rules_version = rules_version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._used = []
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=60)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            ' key TEXT PRIMARY KEY, rules_version TEXT, records TEXT,'
+            ' size INTEGER, last_used REAL)'
+        )
+        # Entries written by other versions of the rules can never be hit again
+        self._db.execute('DELETE FROM pages WHERE rules_version != ?', (rules_version,))
+        self._db.commit()
+
+    def _key(self, text, context=None):
+        if context is not None:
+            text = f'{context}\0{text}'
+        return hashlib.sha256(f'{self.rules_version}\0{text}'.encode('utf-8')).hexdigest()
+
+    def get(self, text, context=None):
+        """Return cached records for this page text, or None
+
+        context is anything besides the text that shaped the records (e.g. the
+        category of the page's chapter); pages are cached per context.
+        """
+        key = self._key(text, context)
+        row = self._db.execute('SELECT records FROM pages WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._used.append(key)
+        return json.loads(row[0])
+
+    def put(self, text, records, context=None):
+        """Store the records parsed from this page text"""
+        payload = json.dumps(records, ensure_ascii=False)
+        self._db.execute(
+            'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)',
+            (self._key(text, context), self.rules_version, payload, len(payload), time.time()),
+        )
+        # Commit per page so concurrent workers never wait on a long write lock
+        self._db.commit()
+
+    def flush(self):
+        """Record access times for pages served from the cache"""
+        if self._used:
+            now = time.time()
+            self._db.executemany('UPDATE pages SET last_used = ? WHERE key = ?',
+                                 [(now, key) for key in self._used])
+            self._db.commit()
+            self._used = []
+
+    def evict(self):
+        """Drop least recently used pages until the cache fits in max_bytes"""
+        self.flush()
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM pages').fetchone()[0]
+        evicted = 0
+        if total > self.max_bytes:
+            rows = self._db.execute('SELECT key, size FROM pages ORDER BY last_used').fetchall()
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._db.execute('DELETE FROM pages WHERE key = ?', (key,))
+                total -= size
+                evicted += 1
+        self._db.commit()
+        return evicted
+
+    def clear(self):
+        """Remove every cached page"""
+        self._db.execute('DELETE FROM pages')
+        self._db.commit()
+        self._db.execute('VACUUM')
+
+    def close(self):
+        self.flush()
+        self._db.close()
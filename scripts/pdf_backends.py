@@ -0,0 +1,122 @@
+"""
+Unified PDF text backends for the medication extractors
+
+Every backend yields TextLine records (page number, line text and bounding box)
+already segmented by the PDF library, so parsers never re-split page strings.
+"""
+
+import time
+from collections import namedtuple
+
+try:
+    import fitz  # PyMuPDF
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
+
+try:
+    import pdfplumber
+    HAS_PDFPLUMBER = True
+except ImportError:
+    HAS_PDFPLUMBER = False
+
+try:
+    import PyPDF2
+    HAS_PYPDF2 = True
+except ImportError:
+    HAS_PYPDF2 = False
+
+# bbox is (x0, y0, x1, y1) in PDF points, or None when the backend has no layout
+TextLine = namedtuple('TextLine', ['page', 'text', 'bbox'])
+
+# Pages sampled per backend by the auto probe
+PROBE_PAGES = 3
+
+def iter_pymupdf_lines(pdf_path, pages=None):
+    """Yield lines from PyMuPDF's block/line structure"""
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in pages if pages is not None else range(len(doc)):
+            page_dict = doc[page_num].get_text('dict', flags=fitz.TEXTFLAGS_TEXT)
+            for block in page_dict['blocks']:
+                for line in block['lines']:
+                    text = ''.join(span['text'] for span in line['spans'])
+                    yield TextLine(page_num, text, tuple(line['bbox']))
+    finally:
+        doc.close()
+
+def iter_pdfplumber_lines(pdf_path, pages=None):
+    """Yield lines clustered by pdfplumber from its character layout"""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in pages if pages is not None else range(len(pdf.pages)):
+            for line in pdf.pages[page_num].extract_text_lines():
+                yield TextLine(page_num, line['text'], (line['x0'], line['top'], line['x1'], line['bottom']))
+
+def iter_pypdf2_lines(pdf_path, pages=None):
+    """Yield lines from PyPDF2 (no layout information, so bbox is None)"""
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_num in pages if pages is not None else range(len(pdf_reader.pages)):
+            text = pdf_reader.pages[page_num].extract_text() or ''
+            for line in text.splitlines():
+                yield TextLine(page_num, line, None)
+
+def _pymupdf_page_count(pdf_path):
+    with fitz.open(pdf_path) as doc:
+        return len(doc)
+
+def _pdfplumber_page_count(pdf_path):
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+def _pypdf2_page_count(pdf_path):
+    with open(pdf_path, 'rb') as file:
+        return len(PyPDF2.PdfReader(file).pages)
+
+# name -> (installed, line iterator, page counter), in order of preference
+BACKENDS = {
+    'pymupdf': (HAS_PYMUPDF, iter_pymupdf_lines, _pymupdf_page_count),
+    'pdfplumber': (HAS_PDFPLUMBER, iter_pdfplumber_lines, _pdfplumber_page_count),
+    'pypdf2': (HAS_PYPDF2, iter_pypdf2_lines, _pypdf2_page_count),
+}
+
+def available_backends():
+    """Names of the installed backends, most preferred first"""
+    return [name for name, (installed, _, _) in BACKENDS.items() if installed]
+
+def page_count(pdf_path, backend):
+    return BACKENDS[backend][2](pdf_path)
+
+def iter_text_lines(pdf_path, backend, pages=None):
+    """Yield TextLine records for the given pages (all pages by default)"""
+    return BACKENDS[backend][1](pdf_path, pages)
+
+def probe_fastest_backend(pdf_path, sample_pages=PROBE_PAGES):
+    """Time each installed backend on a few evenly spaced pages and return the fastest
+
+    Returns (backend name, {backend: seconds}). With a single backend installed
+    no probing is done.
+    """
+    candidates = available_backends()
+    if len(candidates) <= 1:
+        return (candidates[0] if candidates else None), {}
+
+    total = page_count(pdf_path, candidates[0])
+    step = max(1, total // (sample_pages + 1))
+    pages = list(range(step, total, step))[:sample_pages] or list(range(min(total, sample_pages)))
+
+    timings = {}
+    for name in candidates:
+        start = time.perf_counter()
+        try:
+            for _ in iter_text_lines(pdf_path, name, pages):
+                pass
+        except Exception as e:
+            # A backend that cannot read this PDF is simply not a candidate
+            print(f"  Backend {name} failed during probe: {e}")
+            continue
+        timings[name] = time.perf_counter() - start
+
+    if not timings:
+        return candidates[0], timings
+    return min(timings, key=timings.get), timings
@@ -0,0 +1,65 @@
+"""
+Document lists for batch extraction
+
+A batch is either a directory or a JSON manifest listing PDFs in priority
+order (earlier documents win when duplicates are merged). A directory's PDFs
+are ordered newest edition first, by the year and then the edition number in
+the file name, with undated files last and ties by file name. A manifest
+keeps its own order:
+
+    [
+      {"path": "PHC-STG-EML-8th-Edition-2024.pdf", "document": "PHC STG/EML", "edition": "8th Edition 2024"},
+      {"path": "older/PHC-STG-EML-7th-Edition-2020.pdf"}
+    ]
+
+Relative paths are resolved against the manifest's folder. Missing document
+names and editions are derived from the file name.
+"""
+
+import json
+import re
+from pathlib import Path
+
+EDITION_PATTERN = re.compile(r'(\d+(?:st|nd|rd|th)[-_ ]+edition(?:[-_ ]+(?:19|20)\d{2})?|(?:19|20)\d{2})$', re.IGNORECASE)
+
+def describe_pdf(pdf_path):
+    """(document, edition) from a file name like 'Hospital-Level-Paediatrics-STG-4th-Edition-2017.pdf'"""
+    stem = Path(pdf_path).stem
+    match = EDITION_PATTERN.search(stem)
+    if not match:
+        return re.sub(r'[-_ ]+', ' ', stem).strip(), None
+    edition = ' '.join(word.capitalize() if word.isalpha() else word
+                       for word in re.split(r'[-_ ]+', match.group(1)))
+    document = re.sub(r'[-_ ]+', ' ', stem[:match.start()]).strip() or stem
+    return document, edition
+
+def edition_key(edition):
+    """(year, edition number) of an edition like '8th Edition 2024', zero where absent"""
+    year = re.search(r'(?:19|20)\d{2}', edition or '')
+    number = re.match(r'(\d+)(?:st|nd|rd|th)\b', edition or '', re.IGNORECASE)
+    return int(year.group()) if year else 0, int(number.group(1)) if number else 0
+
+def load_batch(batch_path):
+    """List of {'path', 'document', 'edition'} dicts for a directory or JSON manifest"""
+    batch_path = Path(batch_path)
+    by_edition = batch_path.is_dir()
+    if by_edition:
+        entries = [{'path': pdf_path} for pdf_path in sorted(batch_path.glob('*.pdf'))]
+    else:
+        with open(batch_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        for entry in entries:
+            entry['path'] = batch_path.parent / entry['path']
+
+    documents = []
+    for entry in entries:
+        document, edition = describe_pdf(entry['path'])
+        documents.append({
+            'path': Path(entry['path']),
+            'document': entry.get('document') or document,
+            'edition': entry.get('edition') or edition,
+        })
+    if by_edition:
+        # Newest first; the sort is stable, so equal editions stay in file name order
+        documents.sort(key=lambda document: edition_key(document['edition']), reverse=True)
+    return documents
@@ -0,0 +1,113 @@
+"""
+Page -> chapter/section index from a PDF's outline
+
+The EML is organised in chapters (Cardiovascular, Respiratory, Infections,
+...) and the PDF's bookmarks (`doc.get_toc()` in PyMuPDF) say where each one
+starts. ChapterIndex turns the top two outline levels into sorted start-page
+arrays, so the chapter or section of any page is one binary search, and
+splits the document into page segments that each lie in a single chapter.
+A segment carries the category its chapter (or first section) title maps to,
+which the extractor then uses for every record on those pages instead of
+scanning each line for category keywords.
+"""
+
+from bisect import bisect_right
+
+FRONT_MATTER = 'Front matter'
+
+class ChapterIndex:
+    """Chapters (outline level 1) and sections (level 2) as sorted (start page, title) arrays"""
+
+    def __init__(self, toc, page_count):
+        self.page_count = page_count
+        self.chapters = []
+        self.sections = []
+        for level, title, page in toc:
+            # Bookmark pages are 1-based; -1 marks a bookmark without a target
+            if level > 2 or not 1 <= page <= page_count:
+                continue
+            entries = self.chapters if level == 1 else self.sections
+            start = page - 1
+            if entries and start <= entries[-1][0]:
+                # Several bookmarks on one page: the first one names it
+                continue
+            entries.append((start, ' '.join(title.split())))
+        self._chapter_starts = [start for start, _ in self.chapters]
+        self._section_starts = [start for start, _ in self.sections]
+
+    def __bool__(self):
+        return bool(self.chapters)
+
+    def chapter_at(self, page):
+        """Title of the chapter containing page (0-based), or None before the first one"""
+        i = bisect_right(self._chapter_starts, page) - 1
+        return self.chapters[i][1] if i >= 0 else None
+
+    def section_at(self, page):
+        """Title of the section containing page within its chapter, or None"""
+        i = bisect_right(self._section_starts, page) - 1
+        if i < 0:
+            return None
+        chapter = bisect_right(self._chapter_starts, page) - 1
+        # A section from an earlier chapter does not carry over
+        if chapter >= 0 and self.sections[i][0] < self._chapter_starts[chapter]:
+            return None
+        return self.sections[i][1]
+
+    def chapter_ranges(self):
+        """[(number, title, start, stop)], numbered from 1 in outline order; front matter is number 0"""
+        ranges = []
+        if self.chapters and self.chapters[0][0] > 0:
+            ranges.append((0, FRONT_MATTER, 0, self.chapters[0][0]))
+        for i, (start, title) in enumerate(self.chapters):
+            stop = self.chapters[i + 1][0] if i + 1 < len(self.chapters) else self.page_count
+            ranges.append((i + 1, title, start, stop))
+        return ranges
+
+    def select(self, selectors):
+        """Chapter ranges matching any selector: a chapter number or part of a title (case-insensitive)
+
+        Raises ValueError naming a selector that matches no chapter.
+        """
+        ranges = self.chapter_ranges()
+        selected = set()
+        for selector in selectors:
+            selector = str(selector).strip()
+            if selector.isdigit():
+                matches = [chapter for chapter in ranges if chapter[0] == int(selector)]
+            else:
+                matches = [chapter for chapter in ranges if selector.lower() in chapter[1].lower()]
+            if not matches:
+                raise ValueError(f'no chapter matches {selector!r}')
+            selected.update(matches)
+        return sorted(selected, key=lambda chapter: chapter[2])
+
+    def segments(self, classify, selectors=None):
+        """[(start, stop, category)] page segments in page order, each within one chapter and section
+
+        classify(title) maps a chapter or section title to a category or None.
+        A section's own category wins over its chapter's. Without an outline the
+        whole document is one segment without a category.
+        """
+        if not self.chapters:
+            if selectors:
+                raise ValueError('the PDF has no outline to select chapters from')
+            return [(0, self.page_count, None)] if self.page_count else []
+
+        chapters = self.select(selectors) if selectors else self.chapter_ranges()
+        segments = []
+        for _, title, start, stop in chapters:
+            chapter_category = classify(title) if title != FRONT_MATTER else None
+            cuts = [start] + [section for section in self._section_starts if start < section < stop] + [stop]
+            for first, last in zip(cuts, cuts[1:]):
+                section = self.section_at(first)
+                category = (classify(section) if section else None) or chapter_category
+                if segments and segments[-1][1] == first and segments[-1][2] == category:
+                    segments[-1] = (segments[-1][0], last, category)
+                else:
+                    segments.append((first, last, category))
+        return segments
+
+def read_chapter_index(doc):
+    """ChapterIndex of an open PyMuPDF document"""
+    return ChapterIndex(doc.get_toc(), len(doc))
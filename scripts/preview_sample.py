@@ -0,0 +1,183 @@
+"""
+Stratified page samples and estimates for preview runs (`--preview`)
+
+A preview parses a few pages per chapter instead of the whole PDF. Chapters
+(the strata) come from the PDF's outline (see pdf_chapters.py); PDFs without
+one are cut into FALLBACK_STRATUM_PAGES blocks. Within each stratum, pages
+are drawn with a random generator seeded from --seed and the stratum's first
+page, so the same seed and PDF always give the same sample.
+
+From the sampled pages, stratified estimators give the records the full run
+would parse (sum over strata of pages x mean records per page) and the share
+of each category and schedule among them (a ratio estimator), both with 95%
+confidence bounds from the within-stratum variance. Strata sampled with a
+single page are collapsed into one group for their variance. Share bounds
+also allow for the full run's dedup, which the sample only partly sees (see
+PreviewSample.shares).
+"""
+
+import math
+import random
+from collections import Counter
+
+FALLBACK_STRATUM_PAGES = 20
+
+# Two-sided 95% normal quantile
+Z_95 = 1.96
+
+def page_strata(chapters, selected=None):
+    """[(label, first page, stop page)] for the chapters of a ChapterIndex, or fixed blocks without any
+
+    selected are (number, title, start, stop) chapter ranges from chapters.select().
+    """
+    if chapters:
+        return [(title, start, stop) for _, title, start, stop in selected or chapters.chapter_ranges()]
+    page_count = chapters.page_count
+    return [(f'Pages {start + 1}-{min(start + FALLBACK_STRATUM_PAGES, page_count)}', start,
+             min(start + FALLBACK_STRATUM_PAGES, page_count))
+            for start in range(0, page_count, FALLBACK_STRATUM_PAGES)]
+
+def stratified_sample(strata, per_stratum, seed):
+    """Sorted sampled page numbers of each stratum, all of them for strata up to per_stratum pages"""
+    samples = []
+    for label, start, stop in strata:
+        pages = list(range(start, stop))
+        if len(pages) > per_stratum:
+            pages = sorted(random.Random(f'{seed}:{start}').sample(pages, per_stratum))
+        samples.append(pages)
+    return samples
+
+def _variance(values):
+    if len(values) < 2:
+        return 0.0
+    mean = sum(values) / len(values)
+    return sum((value - mean) ** 2 for value in values) / (len(values) - 1)
+
+def estimate_total(strata, values):
+    """(estimate, 95% half-width) of a per-page total; values are the sampled pages' figures per stratum"""
+    total = 0.0
+    variance = 0.0
+    singles = []
+    for (_, start, stop), sample in zip(strata, values):
+        if not sample:
+            continue
+        size = stop - start
+        n = len(sample)
+        total += size * sum(sample) / n
+        variance += size * size * (1 - n / size) * _variance(sample) / n
+        if n == 1 and size > 1:
+            singles.append((size, size * sample[0]))
+    # A stratum sampled with one page has no variance of its own; such strata
+    # are collapsed into one group, whose spread around its size-weighted
+    # mean stands in for it
+    if len(singles) > 1:
+        sizes = sum(size for size, _ in singles)
+        mean = sum(value for _, value in singles) / sizes
+        variance += (len(singles) / (len(singles) - 1)
+                     * sum((value - size * mean) ** 2 for size, value in singles))
+    return total, Z_95 * math.sqrt(variance)
+
+def estimate_share(strata, numerators, denominators):
+    """(share, 95% half-width) of a ratio of per-page totals, e.g. Antibiotics records / all records"""
+    total, _ = estimate_total(strata, denominators)
+    if not total:
+        return 0.0, 0.0
+    share = estimate_total(strata, numerators)[0] / total
+    # Linearised variance: the total of residuals y - share * x, scaled by the denominator
+    residuals = [[y - share * x for y, x in zip(ys, xs)] for ys, xs in zip(numerators, denominators)]
+    _, half_width = estimate_total(strata, residuals)
+    return share, half_width / total
+
+class PreviewSample:
+    """Per sampled page: records parsed and the dedup key, category and schedule of each"""
+
+    def __init__(self, strata, samples):
+        self.strata = strata
+        self.samples = samples
+        self.records = [[] for _ in strata]
+        self.pages = [[] for _ in strata]
+
+    def add_page(self, stratum, records, keys):
+        """Figures of one sampled page; keys are the records' dedup keys, None for records the output drops"""
+        self.records[stratum].append(len(records))
+        self.pages[stratum].append([(key, {'category': med.category, 'schedule': med.schedule})
+                                    for med, key in zip(records, keys) if key is not None])
+
+    @property
+    def page_count(self):
+        return sum(len(pages) for pages in self.samples)
+
+    @property
+    def unique_count(self):
+        return len({key for pages in self.pages for page in pages for key, _ in page})
+
+    def shares(self, field):
+        """{value: (share, half-width)} of the full run's unique records
+
+        Shares are estimated over all parsed records, before dedup, which a
+        stratified sample estimates without bias. Dedup shifts them: the full
+        run keeps only the first record of each key. The sample shows that
+        shift for the repeats it caught (its shares after dropping the repeats
+        within the sample); a full run drops the repeats of all pages, about
+        1 / (sampled share of pages) times as many, so that much is added to
+        the bounds.
+        """
+        parsed = [[Counter(fields[field] for _, fields in page) for page in pages] for pages in self.pages]
+        unique = [[Counter() for _ in pages] for pages in self.pages]
+        seen = set()
+        for pages, counters in zip(self.pages, unique):
+            for page, counts in zip(pages, counters):
+                for key, fields in page:
+                    if key not in seen:
+                        seen.add(key)
+                        counts[fields[field]] += 1
+        parsed_totals = [[sum(counts.values()) for counts in pages] for pages in parsed]
+        unique_totals = [[sum(counts.values()) for counts in pages] for pages in unique]
+        sampled = self.page_count / sum(stop - start for _, start, stop in self.strata)
+        shares = {}
+        for value in sorted({value for pages in parsed for counts in pages for value in counts}, key=str):
+            share, half_width = estimate_share(self.strata, [[counts[value] for counts in pages] for pages in parsed],
+                                               parsed_totals)
+            unique_share, _ = estimate_share(self.strata, [[counts[value] for counts in pages] for pages in unique],
+                                             unique_totals)
+            shares[value] = share, half_width + abs(unique_share - share) / sampled
+        return shares
+
+def full_run_shares(medications, field):
+    """(record count, {value: share}) of a previous full run's output"""
+    counts = Counter(med.get(field) for med in medications)
+    total = sum(counts.values())
+    return total, {value: count / total for value, count in counts.items()} if total else {}
+
+def report_preview(sample, full=None):
+    """Print the yield and distributions, next to a previous full run's {'records', 'category', 'schedule'}"""
+    pages_total = sum(stop - start for _, start, stop in sample.strata)
+    records, records_bound = estimate_total(sample.strata, sample.records)
+    sampled_records = sum(map(sum, sample.records))
+    sampled_unique = sample.unique_count
+    print(f"\nPreview of {sample.page_count}/{pages_total} pages in {len(sample.strata)} strata "
+          f"({sample.page_count / pages_total:.1%}):")
+    print(f"  Records parsed (before dedup): {records:.0f} ± {records_bound:.0f}")
+    if sampled_records:
+        # Pages repeat each other less within a sample than across the whole PDF,
+        # so this over-estimates the unique records of a full run
+        unique = records * sampled_unique / sampled_records
+        line = f"  Unique records: at most ~{unique:.0f} ({sampled_unique}/{sampled_records} unique in the sample)"
+        if full is not None:
+            line += f", previous full run {full['records']}"
+        print(line)
+
+    for field in ('category', 'schedule'):
+        shares = sample.shares(field)
+        previous = full[field] if full is not None else {}
+        print(f"  {field.capitalize()} shares (95% bounds){', vs previous full run' if full is not None else ''}:")
+        for value in sorted(set(shares) | set(previous), key=lambda value: -shares.get(value, (0, 0))[0]):
+            share, bound = shares.get(value, (0.0, 0.0))
+            line = f"    {str(value):22} {share:6.1%} ± {bound:5.1%}"
+            if full is not None:
+                old = previous.get(value, 0.0)
+                outside = abs(old - share) > bound
+                line += f"   full {old:6.1%} ({old - share:+.1%}){'  *' if outside else ''}"
+            print(line)
+    if full is not None:
+        print("  * previous full run lies outside the preview's bounds")
@@ -0,0 +1,23 @@
+"""
+Import of the hyphenated scripts in this folder
+
+Scripts like integrate-medications.py have no importable module name, so the
+build driver, the lookup server, the benchmark and watch mode load them from
+their file with load_script().
+"""
+
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+
+def load_script(filename, name=None):
+    """Import a script in this folder (or at an absolute path) as a fresh module object
+
+    The module name defaults to the file name with '-' replaced by '_'.
+    """
+    path = SCRIPTS_DIR / filename
+    spec = importlib.util.spec_from_file_location(name or path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,83 @@
+"""
+Precomputed search index for SA_MEDICATIONS
+
+searchMedications matches a query as a substring of brandName, genericName,
+category, description or nappiCode. The index stores those fields lowercased
+once per entry plus a trigram -> entry postings list, so a query of three or
+more characters is answered by intersecting the postings of its trigrams and
+verifying the few remaining candidates, instead of scanning every entry.
+
+When the 2024 entries are sharded (integrate-medications.py --format shards)
+the index covers entries the bundle does not hold, so it is written next to
+the shards instead and the bundled module only holds null.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from formulary_ts import SERVICES_DIR
+
+SEARCH_INDEX_PATH = SERVICES_DIR / 'saFormularySearchIndex.generated.ts'
+
+SEARCH_FIELDS = ('brandName', 'genericName', 'category', 'description')
+
+MODULE_TEMPLATE = """// Search index for SA_MEDICATIONS
+// Generated by scripts/integrate-medications.py - do not edit by hand.
+// Entry i describes SA_MEDICATIONS[i]: its id, its searchable fields lowercased
+// and joined by newlines, and trigram -> entry postings (ascending).
+// null when the index is loaded with the formulary shards instead.
+
+export interface FormularySearchIndex {{
+  ids: string[];
+  haystacks: string[];
+  trigrams: Record<string, number[]>;
+}}
+
+export const SA_FORMULARY_SEARCH_INDEX: FormularySearchIndex | null = {payload};
+"""
+
+def search_fields(med):
+    """Lowercased searchable fields (NAPPI codes are digits and matched as-is)"""
+    fields = [str(med.get(field, '')).lower() for field in SEARCH_FIELDS]
+    if med.get('nappiCode'):
+        fields.append(str(med['nappiCode']))
+    return fields
+
+def build_search_index(medications):
+    """Build the index for medications in SA_MEDICATIONS order"""
+    ids = []
+    haystacks = []
+    postings = {}
+
+    for position, med in enumerate(medications):
+        fields = search_fields(med)
+        ids.append(med.get('id', ''))
+        haystacks.append('\n'.join(fields))
+
+        # Trigrams never span two fields, since a match must lie within one
+        grams = {field[i:i + 3] for field in fields for i in range(len(field) - 2)}
+        for gram in grams:
+            postings.setdefault(gram, []).append(position)
+
+    return {'ids': ids, 'haystacks': haystacks, 'trigrams': dict(sorted(postings.items()))}
+
+def render_search_index_module(index):
+    """TypeScript module embedding the index as a JSON.parse string (cheaper to parse than an object literal)"""
+    if index is None:
+        return MODULE_TEMPLATE.format(payload='null')
+    payload = json.dumps(json.dumps(index, ensure_ascii=False, separators=(',', ':')), ensure_ascii=False)
+    return MODULE_TEMPLATE.format(payload=f'JSON.parse({payload})')
+
+def write_search_index(medications, index_path=SEARCH_INDEX_PATH):
+    """Regenerate the index module (a null stub for medications=None), returning True if its content changed"""
+    content = render_search_index_module(None if medications is None else build_search_index(medications))
+    index_path = Path(index_path)
+    if index_path.exists() and index_path.read_text(encoding='utf-8') == content:
+        return False
+
+    temp_path = index_path.with_name(index_path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, index_path)
+    return True
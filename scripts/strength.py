@@ -0,0 +1,78 @@
+"""
+Structured, unit-normalised medication strengths
+
+Extracted strengths are free text ("500 mg", "0.5 g", "500mg", "10–20 mg/kg",
+"125 mg/5 ml"). parse_strength turns the first dose in such a string into a
+Strength: a numeric low/high range in a canonical unit plus an optional
+per-kg / per-m2 / per-dose / per-volume qualifier. Mass units become mg and
+international units become units, so equal doses written differently compare
+equal.
+"""
+
+import re
+from collections import namedtuple
+from decimal import Decimal
+from functools import lru_cache
+
+# low == high for a single dose; per is None, 'kg', 'm2', 'dose' or a volume
+# such as '5 ml'
+Strength = namedtuple('Strength', ['low', 'high', 'unit', 'per'])
+
+# Thousands may be space-separated ("1 000 units", "2 400 000 units") when the
+# number ends in 000, so "day 10 500 mg" stays 500 mg; "%" is not a word
+# character, so units end at a non-letter instead of \b
+STRENGTH_PATTERN = re.compile(r"""
+    (\d{1,3}(?:\ \d{3})*\ 000(?!\d)|\d+(?:\.\d+)?)
+    (?:\s*(?:[–-]|to)\s*(\d+(?:\.\d+)?))?
+    \s*(micrograms?|mcg|mg|g|ml|mmol|%|units?|iu)(?![a-z])
+    (?:\s*/\s*(\d+(?:\.\d+)?\s*)?(kg|m2|dose|ml)(?![a-z]))?
+""", re.IGNORECASE | re.VERBOSE)
+
+# Conversions to a canonical unit so "0.5 g" and "500mg" compare equal
+UNIT_SCALE = {
+    'microgram': ('mg', 0.001), 'micrograms': ('mg', 0.001), 'mcg': ('mg', 0.001),
+    'mg': ('mg', 1), 'g': ('mg', 1000), 'ml': ('ml', 1), 'mmol': ('mmol', 1), '%': ('%', 1),
+    'unit': ('units', 1), 'units': ('units', 1), 'iu': ('units', 1),
+}
+
+# Strings repeat heavily across pages and documents; the caches are bounded
+# so long batch and watch runs do not grow them without limit
+CACHE_SIZE = 65536
+
+def format_number(value):
+    """Plain decimal text of a number, without exponent or trailing zeros: 1000000, 0.0005, 2.5"""
+    return format(Decimal(repr(float(value))).normalize(), 'f')
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_strength(text):
+    """Strength of the first dose in text, or None when it has no unit"""
+    strength = None
+    match = STRENGTH_PATTERN.search(text or '')
+    if match:
+        low, high, unit, per_amount, per = match.groups()
+        unit, scale = UNIT_SCALE[unit.lower()]
+        low = round(float(low.replace(' ', '')) * scale, 6)
+        high = round(float(high) * scale, 6) if high else low
+        if per:
+            per = per.lower()
+            if per_amount:
+                per = f'{format_number(per_amount)} {per}'
+        strength = Strength(min(low, high), max(low, high), unit, per)
+    return strength
+
+def format_strength(strength):
+    """Canonical text of a Strength, e.g. '500 mg', '10–20 mg/kg' or '125 mg/5 ml'"""
+    low = format_number(strength.low)
+    value = low if strength.low == strength.high else f'{low}–{format_number(strength.high)}'
+    text = f'{value} {strength.unit}'
+    return f'{text}/{strength.per}' if strength.per else text
+
+def canonical_strength(text):
+    """Canonical text of the first dose in text, or None when it has no unit"""
+    strength = parse_strength(text)
+    return format_strength(strength) if strength is not None else None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def strength_key(text):
+    """Comparison key: the canonical strength, or the lowercased text without spaces when it has no unit"""
+    return canonical_strength(text) or re.sub(r'\s+', '', str(text or '').lower())
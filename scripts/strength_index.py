@@ -0,0 +1,154 @@
+"""
+Sorted, columnar strength index for extracted medications
+
+Each record with a parseable strength becomes one row of parallel arrays:
+name, unit and per codes (indexes into sorted value tables), low and high in
+the canonical unit, and the record's position in the output file. Rows are
+sorted by (name, unit, per, low, high), so every column is sorted within the
+block of rows that share the columns before it and lookups are nested binary
+searches:
+
+    index = load_strength_index('extracted-medications-2024.strengths.json')
+    index.range_query('amoxicillin', 'mg', high=250)    # all amoxicillin <= 250 mg
+    index.contains('Paracetamol', '0.5 g')               # same as '500 mg'
+
+Names are normalised with name_canonicalizer.normalize_term, so "Amoxicillin,
+oral," and "amoxicillin" share a block while letters and vitamin numbers are
+kept ("Vitamin B12" and "Vitamin B6" are separate blocks).
+"""
+
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from name_canonicalizer import normalize_term
+from strength import parse_strength
+
+COLUMNS = ('name', 'unit', 'per', 'low', 'high', 'record')
+
+class StrengthIndexBuilder:
+    """Collects rows while records stream past, then sorts them into a StrengthIndex"""
+
+    def __init__(self):
+        self.rows = []
+        self.skipped = 0
+
+    def add(self, record_number, med):
+        strength = parse_strength(med.strength)
+        name = normalize_term(med.generic_name)
+        if strength is None or not name:
+            self.skipped += 1
+            return
+        self.rows.append((name, strength.unit, strength.per or '', strength.low, strength.high, record_number))
+
+    def build(self):
+        self.rows.sort()
+        names = sorted({row[0] for row in self.rows})
+        units = sorted({row[1] for row in self.rows})
+        pers = sorted({row[2] for row in self.rows})
+        name_ids = {name: i for i, name in enumerate(names)}
+        unit_ids = {unit: i for i, unit in enumerate(units)}
+        per_ids = {per: i for i, per in enumerate(pers)}
+
+        columns = {
+            'name': array('I', (name_ids[row[0]] for row in self.rows)),
+            'unit': array('B', (unit_ids[row[1]] for row in self.rows)),
+            'per': array('H', (per_ids[row[2]] for row in self.rows)),
+            'low': array('d', (row[3] for row in self.rows)),
+            'high': array('d', (row[4] for row in self.rows)),
+            'record': array('I', (row[5] for row in self.rows)),
+        }
+        return StrengthIndex(names, units, pers, columns)
+
+class StrengthIndex:
+    """Read-only view over the sorted columns"""
+
+    def __init__(self, names, units, pers, columns):
+        self.names = names
+        self.units = units
+        self.pers = pers
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns['record'])
+
+    def _block(self, column, code, lo, hi):
+        values = self.columns[column]
+        return bisect_left(values, code, lo, hi), bisect_right(values, code, lo, hi)
+
+    def _code(self, table, value):
+        i = bisect_left(table, value)
+        return i if i < len(table) and table[i] == value else None
+
+    def _dose_block(self, name, unit, per=None):
+        """Row range of one (name, unit, per) block, or (0, 0)"""
+        codes = (self._code(self.names, normalize_term(name)), self._code(self.units, unit),
+                 self._code(self.pers, per or ''))
+        if None in codes:
+            return 0, 0
+        lo, hi = 0, len(self)
+        for column, code in zip(('name', 'unit', 'per'), codes):
+            lo, hi = self._block(column, code, lo, hi)
+        return lo, hi
+
+    def range_query(self, name, unit, low=None, high=None, per=None):
+        """Output record numbers of name whose dose lies within [low, high] (in the canonical unit)"""
+        lo, hi = self._dose_block(name, unit, per)
+        lows = self.columns['low']
+        if low is not None:
+            lo = bisect_left(lows, low, lo, hi)
+        if high is not None:
+            hi = bisect_right(lows, high, lo, hi)
+        highs = self.columns['high']
+        records = self.columns['record']
+        # Ranges ("10–20 mg") must end within the bound too
+        return [records[i] for i in range(lo, hi) if high is None or highs[i] <= high]
+
+    def contains(self, name, strength):
+        """True if a record of name has exactly this strength, e.g. '0.5 g' for a '500 mg' row"""
+        parsed = parse_strength(strength)
+        if parsed is None:
+            return False
+        lo, hi = self._dose_block(name, parsed.unit, parsed.per)
+        lo = bisect_left(self.columns['low'], parsed.low, lo, hi)
+        hi = bisect_right(self.columns['low'], parsed.low, lo, hi)
+        return any(self.columns['high'][i] == parsed.high for i in range(lo, hi))
+
+    def to_dict(self):
+        return {
+            'names': self.names,
+            'units': self.units,
+            'per': self.pers,
+            'columns': {column: self.columns[column].tolist() for column in COLUMNS},
+        }
+
+def iter_indexed(medications, builder):
+    """Pass records through, adding each one to the builder with its output position"""
+    for record_number, med in enumerate(medications):
+        builder.add(record_number, med)
+        yield med
+
+def strength_index_path(output_path):
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name.split('.')[0] + '.strengths.json')
+
+def write_strength_index(index, output_path):
+    """Write the index next to the output, returning its path"""
+    index_path = strength_index_path(output_path)
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_dict(), f, separators=(',', ':'))
+    return index_path
+
+def load_strength_index(index_path):
+    with open(index_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    columns = data['columns']
+    return StrengthIndex(data['names'], data['units'], data['per'], {
+        'name': array('I', columns['name']),
+        'unit': array('B', columns['unit']),
+        'per': array('H', columns['per']),
+        'low': array('d', columns['low']),
+        'high': array('d', columns['high']),
+        'record': array('I', columns['record']),
+    })
@@ -0,0 +1,44 @@
+"""
+Regression cases for the line parser of extract-medications-from-pdf.py
+
+Run from the scripts folder: python -m unittest test_extract_medications_from_pdf
+"""
+
+import unittest
+
+from script_loader import load_script
+
+EXTRACTOR = load_script('extract-medications-from-pdf.py')
+
+class ParseMedicationLineTest(unittest.TestCase):
+
+    def parse(self, line):
+        record = EXTRACTOR.try_parse_medication_line(line)
+        self.assertIsNotNone(record, line)
+        return record
+
+    def test_dosing_lines_are_accepted(self):
+        for line, name, strength in [
+            ('Amoxicillin, oral, 10–20 mg/kg 8 hourly for 5 days.', 'Amoxicillin', '10–20 mg/kg'),
+            ('Amoxicillin, oral, 500 mg 8 hourly', 'Amoxicillin', '500 mg'),
+            ('Paracetamol, oral, 500 mg to 1 g 6 hourly', 'Paracetamol', '500 mg'),
+        ]:
+            record = self.parse(line)
+            self.assertEqual(record.generic_name, name)
+            self.assertEqual(record.brand_name, name)
+            self.assertEqual(record.strength, strength)
+
+    def test_ranges_are_not_split(self):
+        record = self.parse('Morphine, oral, 0.2–0.4 mg/kg/dose 4–6 hourly')
+        self.assertEqual(record.generic_name, 'Morphine')
+        self.assertTrue(record.strength.startswith('0.2–0.4 mg'))
+
+    def test_bracketed_brand(self):
+        record = self.parse('Amoxicillin (Amoxil) 500 mg capsule')
+        self.assertEqual((record.generic_name, record.brand_name, record.form), ('Amoxicillin', 'Amoxil', 'capsule'))
+
+    def test_lines_without_a_name_are_rejected(self):
+        self.assertIsNone(EXTRACTOR.try_parse_medication_line('10 mg (5 tablets)'))
+
+if __name__ == '__main__':
+    unittest.main()
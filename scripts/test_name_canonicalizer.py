@@ -0,0 +1,65 @@
+"""
+Regression cases for name_canonicalizer.py
+
+Run from the scripts folder: python -m unittest test_name_canonicalizer
+"""
+
+import unittest
+
+from name_canonicalizer import NameCanonicalizer
+
+VOCABULARY = [
+    'Paracetamol', 'Amoxicillin', 'Miconazole', 'Penicillin', 'Calcium', 'Codeine', 'Metformin',
+    'vitamin d', 'b-complex vitamins', 'Sulfamethoxazole/Trimethoprim', 'Enalapril', 'Insulin',
+    'Ibuprofen',
+]
+
+class NameCanonicalizerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.canonicalizer = NameCanonicalizer(VOCABULARY)
+
+    def canonical(self, raw_name):
+        found = self.canonicalizer.match(raw_name)
+        return found[0] if found else None
+
+    def test_typos_are_corrected(self):
+        self.assertEqual(self.canonical('o Paracetmol tablets'), 'Paracetamol')
+        self.assertEqual(self.canonical('Amoxicilin, oral, 10'), 'Amoxicillin')
+        self.assertEqual(self.canonical('Metformn'), 'Metformin')
+
+    def test_letters_are_not_edits(self):
+        for raw_name in ('Vitamin A', 'Vitamin K', 'Vitamin B'):
+            self.assertIsNone(self.canonical(raw_name), raw_name)
+
+    def test_first_letter_must_match(self):
+        self.assertIsNone(self.canonical('Econazole'))
+        self.assertEqual(self.canonical('Miconazol'), 'Miconazole')
+
+    def test_salts_and_letters_are_not_dropped(self):
+        for raw_name in ('Penicillin G', 'Calcium Gluconate', 'Codeine Phosphate'):
+            self.assertIsNone(self.canonical(raw_name), raw_name)
+
+    def test_combinations_are_matched_whole(self):
+        for raw_name in ('Paracetamol and codeine', 'Enalapril/hydrochlorothiazide', 'Paracetamol + codeine'):
+            self.assertIsNone(self.canonical(raw_name), raw_name)
+        self.assertEqual(self.canonical('Sulfamethoxazole/trimethoprim'), 'Sulfamethoxazole/Trimethoprim')
+        self.assertEqual(self.canonical('Sulfamethoxazol/trimethoprim, oral, 800/160 mg'),
+                         'Sulfamethoxazole/Trimethoprim')
+
+    def test_qualified_names_are_not_shortened(self):
+        for raw_name in ('Calcium channel blocker', 'Insulin isophane', 'Metformin extended release',
+                         'Ibuprofen lysine'):
+            self.assertIsNone(self.canonical(raw_name), raw_name)
+        self.assertEqual(self.canonical('Metformin tablets 500 mg'), 'Metformin')
+
+    def test_lowercase_vocabulary_is_title_cased(self):
+        self.assertEqual(self.canonical('vitamin d'), 'Vitamin D')
+        self.assertEqual(self.canonical('B-complex vitamins'), 'B-complex Vitamins')
+
+    def test_curated_casing_wins(self):
+        canonicalizer = NameCanonicalizer(['vitamin d', 'Vitamin D3', 'Vitamin D'])
+        self.assertEqual(canonicalizer.match('vitamin d')[0], 'Vitamin D')
+
+if __name__ == '__main__':
+    unittest.main()
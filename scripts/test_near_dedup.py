@@ -0,0 +1,40 @@
+"""
+Regression cases for near_dedup.py
+
+Run from the scripts folder: python -m unittest test_near_dedup
+"""
+
+import unittest
+
+from medication_record import MedicationRecord
+from near_dedup import merge_near_duplicates, normalize_name
+
+def record(name, strength):
+    return MedicationRecord(name, name, strength, 'tablet', 'Other', 'Schedule 2',
+                            description=f'{name} {strength} tablet', common_dosage=strength)
+
+class NearDedupTest(unittest.TestCase):
+
+    def merged_names(self, *names, strength='1 mg'):
+        merged, _ = merge_near_duplicates([record(name, strength) for name in names])
+        return [med.generic_name for med in merged]
+
+    def test_vitamin_letters_stay_apart(self):
+        self.assertEqual(self.merged_names('Vitamin A', 'Vitamin D', 'Vitamin K'),
+                         ['Vitamin A', 'Vitamin D', 'Vitamin K'])
+        self.assertEqual(normalize_name('Vitamin K 1 mg'), 'vitamin k')
+
+    def test_penicillin_v_is_not_penicillin_g(self):
+        self.assertEqual(self.merged_names('Penicillin G', 'Penicillin V', strength='250 mg'),
+                         ['Penicillin G', 'Penicillin V'])
+
+    def test_prednisolone_is_not_prednisone(self):
+        self.assertEqual(self.merged_names('Prednisone', 'Prednisolone', strength='5 mg'),
+                         ['Prednisone', 'Prednisolone'])
+
+    def test_typos_and_fragments_still_merge(self):
+        self.assertEqual(self.merged_names('Amoxicillin, oral,', 'Amoxicilin', strength='500 mg'), ['Amoxicillin'])
+        self.assertEqual(normalize_name('o Salbutamol, inhaled'), 'salbutamol')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@ import {
   searchMedications,
   getMedicationsByCategory,
   getAllCategories,
+  loadFormulary,
   type SAMedication
 } from '../services/southAfricanFormulary';
 import { getApiUrl } from '../config/api-config';
@@ -79,6 +80,7 @@ const PrescriptionManagement: React.FC<PrescriptionManagementProps> = ({ user: p
   // Medication search state
   const [medSearchQuery, setMedSearchQuery] = useState('');
   const [medCategory, setMedCategory] = useState('all');
+  const [formularySize, setFormularySize] = useState(0);
   const [showMedSearch, setShowMedSearch] = useState(false);
   const [selectedMedForAdd, setSelectedMedForAdd] = useState<SAMedication | null>(null);
   
@@ -99,6 +101,13 @@ const PrescriptionManagement: React.FC<PrescriptionManagementProps> = ({ user: p
     loadPrescriptions();
   }, []);
 
+  // Sharded formulary entries are only fetched once this page is opened
+  useEffect(() => {
+    loadFormulary()
+      .then(medications => setFormularySize(medications.length))
+      .catch(error => console.error('Error loading formulary:', error));
+  }, []);
+
   // Optimized prescription loading with caching
   const loadPrescriptions = useCallback(async () => {
     if (loadingRef.current) return;
@@ -433,9 +442,9 @@ const PrescriptionManagement: React.FC<PrescriptionManagementProps> = ({ user: p
     }
 
     return medSearchQuery ? searchMedications(medSearchQuery).slice(0, 50) : [];
-  }, [medSearchQuery, medCategory]);
+  }, [medSearchQuery, medCategory, formularySize]);
 
-  const categories = useMemo(() => getAllCategories(), []);
+  const categories = useMemo(() => getAllCategories(), [formularySize]);
 
   // Fast PDF actions
   const handleViewPDF = useCallback(async (prescription: Prescription) => {
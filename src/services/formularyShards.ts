@@ -0,0 +1,84 @@
+// Lazy loader for the sharded formulary in public/formulary
+// Shards are written by `python scripts/integrate-medications.py --format shards`
+// and appended to SA_MEDICATIONS by loadFormulary() in southAfricanFormulary.ts.
+// The manifest is small and revalidated on every load; shard file names carry
+// a content hash, so the browser can cache them indefinitely.
+
+import type { SAMedication } from './southAfricanFormulary';
+import type { FormularySearchIndex } from './saFormularySearchIndex.generated';
+
+export interface FormularyFileInfo {
+  file: string;
+  bytes: number;
+  gzipBytes: number;
+  brotliBytes: number | null;
+}
+
+export interface FormularyShardInfo extends FormularyFileInfo {
+  key: string;
+  count: number;
+}
+
+export interface FormularyManifest {
+  version: string;
+  shardBy: 'category' | 'letter';
+  total: number;
+  shards: FormularyShardInfo[];
+  // Search index over the curated entries followed by every shard in order
+  searchIndex: FormularyFileInfo | null;
+}
+
+const FORMULARY_BASE_URL = '/formulary';
+
+let manifestPromise: Promise<FormularyManifest> | null = null;
+const shardPromises = new Map<string, Promise<SAMedication[]>>();
+
+async function fetchJson<T>(url: string): Promise<T> {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url}: ${response.status}`);
+  }
+  return response.json() as Promise<T>;
+}
+
+export function loadFormularyManifest(): Promise<FormularyManifest> {
+  if (!manifestPromise) {
+    manifestPromise = fetchJson<FormularyManifest>(`${FORMULARY_BASE_URL}/manifest.json`).catch(error => {
+      manifestPromise = null;
+      throw error;
+    });
+  }
+  return manifestPromise;
+}
+
+export async function loadFormularyShard(key: string): Promise<SAMedication[]> {
+  const manifest = await loadFormularyManifest();
+  const shard = manifest.shards.find(info => info.key === key);
+  if (!shard) {
+    return [];
+  }
+
+  let promise = shardPromises.get(shard.file);
+  if (!promise) {
+    promise = fetchJson<SAMedication[]>(`${FORMULARY_BASE_URL}/${shard.file}`).catch(error => {
+      shardPromises.delete(shard.file);
+      throw error;
+    });
+    shardPromises.set(shard.file, promise);
+  }
+  return promise;
+}
+
+export async function loadAllFormularyShards(): Promise<SAMedication[]> {
+  const manifest = await loadFormularyManifest();
+  const shards = await Promise.all(manifest.shards.map(shard => loadFormularyShard(shard.key)));
+  return shards.flat();
+}
+
+export async function loadFormularySearchIndex(): Promise<FormularySearchIndex | null> {
+  const manifest = await loadFormularyManifest();
+  if (!manifest.searchIndex) {
+    return null;
+  }
+  return fetchJson<FormularySearchIndex>(`${FORMULARY_BASE_URL}/${manifest.searchIndex.file}`);
+}
@@ -0,0 +1,11 @@
+// 2024 Formulary Medications
+// Generated by scripts/integrate-medications.py from the extracted 2024 EML.
+// Do not edit by hand: IDs are content-derived and the integrator rewrites
+// only entries that were added, changed or removed.
+import type { SAMedication } from './southAfricanFormulary';
+
+export const SA_MEDICATIONS_2024: SAMedication[] = [
+];
+
+// true when the entries are loaded from public/formulary shards instead
+export const SA_FORMULARY_2024_SHARDED: boolean = false;
@@ -0,0 +1,13 @@
+// Search index for SA_MEDICATIONS
+// Generated by scripts/integrate-medications.py - do not edit by hand.
+// Entry i describes SA_MEDICATIONS[i]: its id, its searchable fields lowercased
+// and joined by newlines, and trigram -> entry postings (ascending).
+// null when the index is loaded with the formulary shards instead.
+
+export interface FormularySearchIndex {
+  ids: string[];
+  haystacks: string[];
+  trigrams: Record<string, number[]>;
+}
+
+export const SA_FORMULARY_SEARCH_INDEX: FormularySearchIndex | null = JSON.parse("{\"ids\":[\"med-001\",\"med-002\",\"med-003\",\"med-004\",\"med-005\",\"med-006\",\"med-007\",\"med-008\",\"med-009\",\"med-010\",\"med-011\",\"med-012\",\"med-013\",\"med-014\",\"med-015\",\"med-016\",\"med-017\",\"med-018\",\"med-019\",\"med-020\",\"med-021\",\"med-022\",\"med-023\",\"med-024\",\"med-025\",\"med-026\",\"med-027\",\"med-028\",\"med-029\",\"med-030\",\"med-2024-001\",\"med-2024-002\",\"med-2024-003\",\"med-2024-004\",\"med-2024-005\",\"med-2024-006\",\"med-2024-007\",\"med-2024-008\",\"med-2024-009\",\"med-2024-010\",\"med-2024-011\",\"med-2024-012\",\"med-2024-013\",\"med-2024-014\",\"med-2024-015\",\"med-2024-016\",\"med-2024-017\",\"med-2024-018\",\"med-2024-019\",\"med-2024-020\",\"med-2024-021\",\"med-2024-022\",\"med-2024-023\",\"med-2024-024\",\"med-2024-025\",\"med-2024-026\",\"med-2024-027\",\"med-2024-028\",\"med-2024-029\",\"med-2024-030\",\"med-2024-031\",\"med-2024-032\",\"med-2024-033\",\"med-2024-034\",\"med-2024-035\",\"med-2024-036\",\"med-2024-037\",\"med-2024-038\",\"med-2024-039\",\"med-2024-040\",\"med-2024-041\",\"med-2024-042\",\"med-2024-043\",\"med-2024-044\",\"med-2024-045\",\"med-eml-001\",\"med-eml-002\",\"med-eml-003\",\"med-eml-004\",\"med-eml-005\",\"med-eml-006\",\"med-eml-007\",\"med-eml-008\",\"med-eml-009\",\"med-eml-010\",\"med-eml-011\",\"med-eml-012\",\"med-eml-013\",\"med-eml-014\",\"med-eml-015\",\"med-eml-016\",\"med-eml-017\",\"med-eml-018\",\"med-eml-019\",\"med-eml-020\",\"med-eml-021\",\"med-eml-022\",\"med-eml-023\",\"med-eml-024\",\"med-eml-025\",\"med-eml-026\",\"med-eml-027\",\"med-eml-028\",\"med-eml-029\",\"med-eml-030\",\"med-eml-031\",\"med-eml-032\",\"med-eml-033\",\"med-eml-034\",\"med-eml-035\",\"med-eml-036\",\"med-eml-037\",\"med-eml-038\",\"med-eml-039\",\"med-eml-040\",\"med-eml-041\",\"med-eml-042\",\"med-eml-043\",\"med-eml-044\",\"med-eml-045\",\"med-eml-046\",\"med-eml-047\",\"med-eml-048\",\"med-eml-049\",\"med-eml-050\",\"med-eml-051\",\"med-eml-052\",\"med-eml-053\",\"med-eml-054\",\"med-eml-055\",\"med-eml-056\",\"med-eml-057\",\"med-eml-058\",\"med-eml-059\",\"med-eml-060\",\"med-eml-061\",\"med-eml-062\",\"med-eml-063\",\"med-eml-064\",\"med-eml-065\",\"med-eml-066\",\"med-eml-067\",\"med-eml-068\",\"med-eml-069\",\"med-eml-070\",\"med-eml-071\",\"med-eml-072\",\"med-eml-073\",\"med-eml-074\",\"med-eml-075\",\"med-eml-076\",\"med-eml-077\",\"med-eml-078\",\"med-eml-079\",\"med-eml-080\",\"med-eml-081\",\"med-eml-082\",\"med-eml-083\",\"med-eml-084\",\"med-eml-085\",\"med-eml-086\",\"med-eml-087\",\"med-eml-088\",\"med-eml-089\",\"med-eml-090\",\"med-eml-091\",\"med-eml-092\",\"med-eml-093\",\"med-eml-094\",\"med-eml-095\",\"med-eml-096\",\"med-eml-097\",\"med-eml-098\",\"med-eml-099\",\"med-eml-100\",\"med-eml-101\",\"med-eml-102\",\"med-eml-103\",\"med-eml-104\",\"med-eml-105\",\"med-eml-106\",\"med-eml-107\",\"med-eml-108\",\"med-eml-109\",\"med-eml-110\",\"med-eml-111\",\"med-eml-112\",\"med-eml-113\",\"med-eml-114\",\"med-eml-115\",\"med-eml-116\",\"med-eml-117\",\"med-eml-118\",\"med-eml-119\",\"med-eml-120\",\"med-eml-121\",\"med-eml-122\",\"med-eml-123\",\"med-eml-124\",\"med-eml-125\"],\"haystacks\":[\"panado\\nparacetamol\\nanalgesics\\npain relief and fever reducer\\n690171\",\"disprin\\naspirin\\nanalgesics\\npain relief, anti-inflammatory, blood thinner\\n777439\",\"brufen\\nibuprofen\\nanalgesics\\nanti-inflammatory pain relief\\n703188\",\"myprodol\\nibuprofen/paracetamol\\nanalgesics\\ncombination pain relief\\n711234\",\"amoxil\\namoxicillin\\nantibiotics\\nbroad-spectrum antibiotic\\n793647\",\"augmentin\\namoxicillin/clavulanic acid\\nantibiotics\\nenhanced broad-spectrum antibiotic\\n793825\",\"ciprobay\\nciprofloxacin\\nantibiotics\\nfluoroquinolone antibiotic\\n701363\",\"zithromax\\nazithromycin\\nantibiotics\\nmacrolide antibiotic\\n703287\",\"pharmapress\\nenalapril\\ncardiovascular\\nace inhibitor for hypertension\\n708812\",\"cozaar\\nlosartan\\ncardiovascular\\narb for hypertension\\n707468\",\"lipitor\\natorvastatin\\ncardiovascular\\nstatin for cholesterol\\n709469\",\"glucophage\\nmetformin\\ndiabetes\\ntype 2 diabetes medication\\n711234\",\"amaryl\\nglimepiride\\ndiabetes\\nsulfonylurea for type 2 diabetes\\n702856\",\"venteze\\nsalbutamol\\nrespiratory\\nbronchodilator for asthma\\n708123\",\"flixotide\\nfluticasone\\nrespiratory\\ncorticosteroid for asthma prevention\\n701234\",\"nexiam\\nesomeprazole\\ngastrointestinal\\nproton pump inhibitor for reflux\\n709876\",\"imodium\\nloperamide\\ngastrointestinal\\nanti-diarrheal\\n777234\",\"cipramil\\ncitalopram\\nmental health\\nssri for depression and anxiety\\n707123\",\"urbanol\\nclobazam\\nmental health\\nbenzodiazepine for anxiety\\n708456\",\"allergex\\nchlorphenamine\\nallergy\\nantihistamine for allergies\\n693456\",\"telfast\\nfexofenadine\\nallergy\\nnon-drowsy antihistamine\\n708234\",\"elocon\\nmometasone\\ndermatology\\ntopical corticosteroid\\n701567\",\"betaderm\\nbetamethasone\\ndermatology\\ntopical corticosteroid for skin inflammation\\n698765\",\"vitamin b complex\\nb-complex vitamins\\nvitamins\\nb vitamin supplement\\n685432\",\"ferro-gradumet\\nferrous sulfate\\nvitamins\\niron supplement for anemia\\n701234\",\"adco-dol\\nparacetamol/codeine\\nanalgesics\\npain relief with codeine\\n695678\",\"stopayne\\nibuprofen/paracetamol/codeine\\nanalgesics\\ntriple combination pain relief\\n707890\",\"prexum\\nperindopril\\ncardiovascular\\nace inhibitor for hypertension\\n708123\",\"adco-napamol\\nparacetamol\\nanalgesics\\npain and fever relief\\n691234\",\"doxitar\\ndoxycycline\\nantibiotics\\ntetracycline antibiotic\\n703456\",\"panado\\nparacetamol\\nanalgesics\\npain relief and fever reducer\",\"aspirin\\nacetylsalicylic acid\\nanalgesics\\npain relief, anti-inflammatory, blood thinner\",\"amoxicillin\\namoxicillin\\nantibiotics\\nbroad-spectrum penicillin antibiotic\",\"amoxicillin\\namoxicillin\\nantibiotics\\nbroad-spectrum penicillin antibiotic\",\"penicillin v\\nphenoxymethylpenicillin\\nantibiotics\\npenicillin antibiotic for bacterial infections\",\"erythromycin\\nerythromycin\\nantibiotics\\nmacrolide antibiotic\",\"cephalexin\\ncephalexin\\nantibiotics\\ncephalosporin antibiotic\",\"metronidazole\\nmetronidazole\\nantibiotics\\nantibiotic for anaerobic infections\",\"co-trimoxazole\\ntrimethoprim/sulfamethoxazole\\nantibiotics\\ncombination antibiotic\",\"metformin\\nmetformin\\ndiabetes\\ntype 2 diabetes medication\",\"metformin\\nmetformin\\ndiabetes\\ntype 2 diabetes medication\",\"glibenclamide\\nglibenclamide\\ndiabetes\\nsulfonylurea for type 2 diabetes\",\"gliclazide\\ngliclazide\\ndiabetes\\nsulfonylurea for type 2 diabetes\",\"enalapril\\nenalapril\\ncardiovascular\\nace inhibitor for hypertension\",\"enalapril\\nenalapril\\ncardiovascular\\nace inhibitor for hypertension\",\"losartan\\nlosartan\\ncardiovascular\\narb for hypertension\",\"atenolol\\natenolol\\ncardiovascular\\nbeta-blocker for hypertension\",\"amlodipine\\namlodipine\\ncardiovascular\\ncalcium channel blocker for hypertension\",\"furosemide\\nfurosemide\\ncardiovascular\\nloop diuretic\",\"hydrochlorothiazide\\nhydrochlorothiazide\\ncardiovascular\\nthiazide diuretic\",\"salbutamol\\nsalbutamol\\nrespiratory\\nbronchodilator for asthma\",\"beclomethasone\\nbeclomethasone\\nrespiratory\\ncorticosteroid inhaler for asthma\",\"omeprazole\\nomeprazole\\ngastrointestinal\\nproton pump inhibitor for reflux\",\"ranitidine\\nranitidine\\ngastrointestinal\\nh2 receptor antagonist\",\"loperamide\\nloperamide\\ngastrointestinal\\nanti-diarrheal\",\"metoclopramide\\nmetoclopramide\\ngastrointestinal\\nanti-emetic and prokinetic\",\"fluoxetine\\nfluoxetine\\nmental health\\nssri for depression\",\"sertraline\\nsertraline\\nmental health\\nssri for depression and anxiety\",\"amitriptyline\\namitriptyline\\nmental health\\ntricyclic antidepressant\",\"diazepam\\ndiazepam\\nmental health\\nbenzodiazepine for anxiety\",\"loratadine\\nloratadine\\nallergy\\nnon-drowsy antihistamine\",\"cetirizine\\ncetirizine\\nallergy\\nantihistamine for allergies\",\"chlorpheniramine\\nchlorpheniramine\\nallergy\\nantihistamine for allergies\",\"prednisone\\nprednisone\\nother\\ncorticosteroid\",\"ferrous sulfate\\nferrous sulfate\\nvitamins\\niron supplement for anemia\",\"folic acid\\nfolic acid\\nvitamins\\nfolate supplement\",\"warfarin\\nwarfarin\\ncardiovascular\\nanticoagulant\",\"warfarin\\nwarfarin\\ncardiovascular\\nanticoagulant\",\"digoxin\\ndigoxin\\ncardiovascular\\ncardiac glycoside\",\"morphine\\nmorphine\\nanalgesics\\nopioid analgesic\",\"codeine\\ncodeine\\nanalgesics\\nopioid analgesic\",\"tramadol\\ntramadol\\nanalgesics\\nopioid analgesic\",\"betamethasone\\nbetamethasone\\ndermatology\\ntopical corticosteroid\",\"hydrocortisone\\nhydrocortisone\\ndermatology\\ntopical corticosteroid\",\"clotrimazole\\nclotrimazole\\ndermatology\\nantifungal cream\",\"cloxacillin\\ncloxacillin\\nantibiotics\\npenicillinase-resistant penicillin\",\"benzylpenicillin\\nbenzylpenicillin\\nantibiotics\\npenicillin injection\",\"ceftriaxone\\nceftriaxone\\nantibiotics\\nthird-generation cephalosporin\",\"cefuroxime\\ncefuroxime\\nantibiotics\\nsecond-generation cephalosporin\",\"clindamycin\\nclindamycin\\nantibiotics\\nlincosamide antibiotic\",\"gentamicin\\ngentamicin\\nantibiotics\\naminoglycoside antibiotic\",\"vancomycin\\nvancomycin\\nantibiotics\\nglycopeptide antibiotic\",\"rifampicin\\nrifampicin\\nantibiotics\\nantituberculosis medication\",\"isoniazid\\nisoniazid\\nantibiotics\\nantituberculosis medication\",\"ethambutol\\nethambutol\\nantibiotics\\nantituberculosis medication\",\"pyrazinamide\\npyrazinamide\\nantibiotics\\nantituberculosis medication\",\"nitrofurantoin\\nnitrofurantoin\\nantibiotics\\nurinary tract antibiotic\",\"trimethoprim\\ntrimethoprim\\nantibiotics\\nantibiotic for uti\",\"captopril\\ncaptopril\\ncardiovascular\\nace inhibitor\",\"lisinopril\\nlisinopril\\ncardiovascular\\nace inhibitor\",\"ramipril\\nramipril\\ncardiovascular\\nace inhibitor\",\"valsartan\\nvalsartan\\ncardiovascular\\narb for hypertension\",\"irbesartan\\nirbesartan\\ncardiovascular\\narb for hypertension\",\"propranolol\\npropranolol\\ncardiovascular\\nbeta-blocker\",\"metoprolol\\nmetoprolol\\ncardiovascular\\nbeta-blocker\",\"bisoprolol\\nbisoprolol\\ncardiovascular\\nbeta-blocker\",\"nifedipine\\nnifedipine\\ncardiovascular\\ncalcium channel blocker\",\"verapamil\\nverapamil\\ncardiovascular\\ncalcium channel blocker\",\"diltiazem\\ndiltiazem\\ncardiovascular\\ncalcium channel blocker\",\"spironolactone\\nspironolactone\\ncardiovascular\\npotassium-sparing diuretic\",\"amiloride\\namiloride\\ncardiovascular\\npotassium-sparing diuretic\",\"simvastatin\\nsimvastatin\\ncardiovascular\\nstatin for cholesterol\",\"rosuvastatin\\nrosuvastatin\\ncardiovascular\\nstatin for cholesterol\",\"pravastatin\\npravastatin\\ncardiovascular\\nstatin for cholesterol\",\"clopidogrel\\nclopidogrel\\ncardiovascular\\nantiplatelet agent\",\"aspirin\\nacetylsalicylic acid\\ncardiovascular\\nantiplatelet agent\",\"atenolol\\natenolol\\ncardiovascular\\nbeta-blocker\",\"glibenclamide\\nglibenclamide\\ndiabetes\\nsulfonylurea\",\"gliclazide\\ngliclazide\\ndiabetes\\nsulfonylurea\",\"glipizide\\nglipizide\\ndiabetes\\nsulfonylurea\",\"insulin glargine\\ninsulin glargine\\ndiabetes\\nlong-acting insulin\",\"insulin lispro\\ninsulin lispro\\ndiabetes\\nrapid-acting insulin\",\"insulin regular\\ninsulin regular\\ndiabetes\\nshort-acting insulin\",\"insulin nph\\ninsulin nph\\ndiabetes\\nintermediate-acting insulin\",\"ipratropium\\nipratropium\\nrespiratory\\nanticholinergic bronchodilator\",\"salbutamol/ipratropium\\nsalbutamol/ipratropium\\nrespiratory\\ncombination bronchodilator\",\"budesonide\\nbudesonide\\nrespiratory\\ncorticosteroid inhaler\",\"montelukast\\nmontelukast\\nrespiratory\\nleukotriene receptor antagonist\",\"theophylline\\ntheophylline\\nrespiratory\\nbronchodilator\",\"aminophylline\\naminophylline\\nrespiratory\\nbronchodilator\",\"pantoprazole\\npantoprazole\\ngastrointestinal\\nproton pump inhibitor\",\"lansoprazole\\nlansoprazole\\ngastrointestinal\\nproton pump inhibitor\",\"cimetidine\\ncimetidine\\ngastrointestinal\\nh2 receptor antagonist\",\"famotidine\\nfamotidine\\ngastrointestinal\\nh2 receptor antagonist\",\"domperidone\\ndomperidone\\ngastrointestinal\\nanti-emetic and prokinetic\",\"ondansetron\\nondansetron\\ngastrointestinal\\nanti-emetic\",\"hyoscine\\nhyoscine\\ngastrointestinal\\nantispasmodic\",\"dicyclomine\\ndicyclomine\\ngastrointestinal\\nantispasmodic\",\"senna\\nsenna\\ngastrointestinal\\nlaxative\",\"lactulose\\nlactulose\\ngastrointestinal\\nlaxative\",\"bisacodyl\\nbisacodyl\\ngastrointestinal\\nlaxative\",\"psyllium\\npsyllium\\ngastrointestinal\\nbulk-forming laxative\",\"paroxetine\\nparoxetine\\nmental health\\nssri for depression\",\"escitalopram\\nescitalopram\\nmental health\\nssri for depression\",\"venlafaxine\\nvenlafaxine\\nmental health\\nsnri for depression\",\"duloxetine\\nduloxetine\\nmental health\\nsnri for depression\",\"mirtazapine\\nmirtazapine\\nmental health\\natypical antidepressant\",\"trazodone\\ntrazodone\\nmental health\\nantidepressant\",\"haloperidol\\nhaloperidol\\nmental health\\nantipsychotic\",\"risperidone\\nrisperidone\\nmental health\\natypical antipsychotic\",\"olanzapine\\nolanzapine\\nmental health\\natypical antipsychotic\",\"quetiapine\\nquetiapine\\nmental health\\natypical antipsychotic\",\"lithium\\nlithium carbonate\\nmental health\\nmood stabilizer\",\"carbamazepine\\ncarbamazepine\\nmental health\\nmood stabilizer and anticonvulsant\",\"valproic acid\\nsodium valproate\\nmental health\\nmood stabilizer and anticonvulsant\",\"lorazepam\\nlorazepam\\nmental health\\nbenzodiazepine for anxiety\",\"alprazolam\\nalprazolam\\nmental health\\nbenzodiazepine for anxiety\",\"clonazepam\\nclonazepam\\nmental health\\nbenzodiazepine for anxiety and seizures\",\"naproxen\\nnaproxen\\nanalgesics\\nnsaid for pain and inflammation\",\"diclofenac\\ndiclofenac\\nanalgesics\\nnsaid for pain and inflammation\",\"indomethacin\\nindomethacin\\nanalgesics\\nnsaid for pain and inflammation\",\"celecoxib\\ncelecoxib\\nanalgesics\\ncox-2 inhibitor\",\"pethidine\\npethidine\\nanalgesics\\nopioid analgesic\",\"fentanyl\\nfentanyl\\nanalgesics\\nopioid analgesic patch\",\"oxycodone\\noxycodone\\nanalgesics\\nopioid analgesic\",\"gabapentin\\ngabapentin\\nanalgesics\\nneuropathic pain medication\",\"pregabalin\\npregabalin\\nanalgesics\\nneuropathic pain medication\",\"amitriptyline\\namitriptyline\\nanalgesics\\nneuropathic pain medication\",\"fexofenadine\\nfexofenadine\\nallergy\\nnon-drowsy antihistamine\",\"desloratadine\\ndesloratadine\\nallergy\\nnon-drowsy antihistamine\",\"promethazine\\npromethazine\\nallergy\\nantihistamine\",\"diphenhydramine\\ndiphenhydramine\\nallergy\\nantihistamine\",\"hydroxyzine\\nhydroxyzine\\nallergy\\nantihistamine\",\"mometasone\\nmometasone\\ndermatology\\ntopical corticosteroid\",\"triamcinolone\\ntriamcinolone\\ndermatology\\ntopical corticosteroid\",\"clobetasol\\nclobetasol\\ndermatology\\npotent topical corticosteroid\",\"miconazole\\nmiconazole\\ndermatology\\nantifungal cream\",\"ketoconazole\\nketoconazole\\ndermatology\\nantifungal cream\",\"terbinafine\\nterbinafine\\ndermatology\\nantifungal cream\",\"nystatin\\nnystatin\\ndermatology\\nantifungal cream\",\"benzoyl peroxide\\nbenzoyl peroxide\\ndermatology\\nacne treatment\",\"tretinoin\\ntretinoin\\ndermatology\\nacne treatment\",\"adapalene\\nadapalene\\ndermatology\\nacne treatment\",\"calamine\\ncalamine\\ndermatology\\nsoothing lotion for skin irritation\",\"calcium carbonate\\ncalcium carbonate\\nvitamins\\ncalcium supplement\",\"vitamin d3\\ncholecalciferol\\nvitamins\\nvitamin d supplement\",\"multivitamin\\nmultivitamin\\nvitamins\\nmultivitamin supplement\",\"zinc sulfate\\nzinc sulfate\\nvitamins\\nzinc supplement\",\"vitamin b12\\ncyanocobalamin\\nvitamins\\nvitamin b12 supplement\",\"vitamin c\\nascorbic acid\\nvitamins\\nvitamin c supplement\",\"hydrocortisone\\nhydrocortisone\\nother\\noral corticosteroid\",\"methylprednisolone\\nmethylprednisolone\\nother\\ncorticosteroid\",\"dexamethasone\\ndexamethasone\\nother\\ncorticosteroid\",\"betamethasone\\nbetamethasone\\nother\\ncorticosteroid\",\"phenytoin\\nphenytoin\\nother\\nanticonvulsant\",\"phenobarbital\\nphenobarbital\\nother\\nanticonvulsant\",\"lamotrigine\\nlamotrigine\\nother\\nanticonvulsant\",\"levetiracetam\\nlevetiracetam\\nother\\nanticonvulsant\",\"topiramate\\ntopiramate\\nother\\nanticonvulsant\",\"allopurinol\\nallopurinol\\nother\\ngout medication\",\"colchicine\\ncolchicine\\nother\\ngout medication\",\"methotrexate\\nmethotrexate\\nother\\nimmunosuppressant\",\"azathioprine\\nazathioprine\\nother\\nimmunosuppressant\",\"cyclophosphamide\\ncyclophosphamide\\nother\\nimmunosuppressant\",\"levothyroxine\\nlevothyroxine\\nother\\nthyroid hormone replacement\",\"propylthiouracil\\npropylthiouracil\\nother\\nantithyroid medication\",\"finasteride\\nfinasteride\\nother\\ntreatment for bph\",\"tamsulosin\\ntamsulosin\\nother\\nalpha-blocker for bph\",\"sildenafil\\nsildenafil\\nother\\ntreatment for ed\",\"tadalafil\\ntadalafil\\nother\\ntreatment for ed\"],\"trigrams\":{\" 2 \":[11,12,39,40,41,42],\" ac\":[5,31,65,105,144,179],\" ag\":[104,105],\" al\":[19,61,62],\" an\":[0,1,4,5,6,7,17,18,20,24,28,29,30,31,32,33,34,35,36,37,38,53,55,57,58,59,60,64,69,70,71,79,80,81,86,117,122,123,124,136,139,140,141,143,144,145,146,147,148,149,150,152,153,154,158,159],\" as\":[13,14,50,51],\" b \":[23],\" b1\":[178],\" ba\":[34],\" bl\":[1,31,47,96,97,98],\" bp\":[196,197],\" br\":[5,114,115],\" c \":[179],\" ca\":[142,174],\" ce\":[77,78],\" ch\":[10,47,96,97,98,101,102,103],\" co\":[21,22,23,25,26,72,73,163,164,165,180],\" cr\":[74,166,167,168,169],\" d \":[175],\" d3\":[175],\" de\":[17,56,57,132,133,134,135],\" di\":[11,12,39,40,41,42,48,49,99,100],\" ed\":[198,199],\" fe\":[0,28,30],\" fo\":[8,9,10,12,13,14,15,17,18,19,22,24,27,34,37,41,42,43,44,45,46,47,50,51,52,56,57,59,61,62,64,87,91,92,101,102,103,132,133,134,135,145,146,147,148,149,150,173,196,197,198,199],\" gl\":[68,110],\" he\":[17,18,56,57,58,59,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147],\" ho\":[194],\" hy\":[8,9,27,43,44,45,46,47,91,92],\" in\":[8,15,22,27,34,37,43,44,51,52,76,88,89,90,110,111,112,113,116,120,121,148,149,150,151],\" ir\":[173],\" la\":[131],\" li\":[111],\" lo\":[173],\" me\":[11,39,40,82,83,84,85,155,156,157,189,190,195],\" np\":[113],\" pa\":[2,3,26,148,149,150,153,155,156,157],\" pe\":[32,33,75,170],\" pr\":[14,55,124],\" pu\":[15,52,120,121],\" re\":[0,1,2,3,15,25,26,28,30,31,52,53,112,117,122,123,194],\" se\":[147],\" sk\":[22,173],\" st\":[142,143,144],\" su\":[23,24,64,65,174,175,176,177,178,179],\" th\":[1,31],\" to\":[165],\" tr\":[86,170,171,172],\" ty\":[12,41,42],\" ut\":[87],\" va\":[144],\" vi\":[23],\" wi\":[25],\", a\":[1,31],\", b\":[1,31],\"-2 \":[151],\"-ac\":[110,111,112,113],\"-bl\":[46,93,94,95,106,197],\"-co\":[23],\"-di\":[16,54],\"-do\":[25],\"-dr\":[20,60,158,159],\"-em\":[55,124,125],\"-fo\":[131],\"-ge\":[77,78],\"-gr\":[24],\"-in\":[1,2,31],\"-na\":[28],\"-re\":[75],\"-sp\":[4,5,32,33,99,100],\"-tr\":[38],\"/cl\":[5],\"/co\":[25,26],\"/ip\":[115],\"/pa\":[3,26],\"/su\":[38],\"012\":[14,24],\"013\":[6],\"015\":[21],\"017\":[0],\"028\":[12],\"031\":[2],\"032\":[7],\"034\":[29],\"071\":[17],\"074\":[9],\"078\":[26],\"081\":[13,27],\"082\":[20],\"084\":[18],\"088\":[8],\"094\":[10],\"098\":[15],\"112\":[3,11],\"12 \":[178],\"123\":[3,11,13,14,17,24,27,28],\"136\":[6],\"156\":[21],\"171\":[0],\"188\":[2],\"2 d\":[11,12,39,40,41,42],\"2 i\":[151],\"2 r\":[53,122,123],\"2 s\":[178],\"234\":[3,11,14,16,20,24,28],\"285\":[12],\"287\":[7],\"318\":[2],\"328\":[7],\"345\":[19,29],\"363\":[6],\"364\":[4],\"382\":[5],\"432\":[23],\"439\":[1],\"456\":[18,19,29],\"468\":[9],\"469\":[10],\"543\":[23],\"567\":[21,25],\"647\":[4],\"678\":[25],\"685\":[23],\"690\":[0],\"691\":[28],\"693\":[19],\"695\":[25],\"698\":[22],\"701\":[6,14,21,24],\"702\":[12],\"703\":[2,7,29],\"707\":[9,17,26],\"708\":[8,13,18,20,27],\"709\":[10,15],\"711\":[3,11],\"712\":[17],\"723\":[16],\"743\":[1],\"746\":[9],\"765\":[22],\"772\":[16],\"774\":[1],\"777\":[1,16],\"789\":[26],\"793\":[4,5],\"812\":[8,13,27],\"823\":[20],\"825\":[5],\"845\":[18],\"854\":[23],\"856\":[12],\"876\":[15,22],\"881\":[8],\"890\":[26],\"901\":[0],\"912\":[28],\"934\":[19],\"936\":[4],\"938\":[5],\"946\":[10],\"956\":[25],\"987\":[15,22],\"a f\":[12,41,42],\"a p\":[14],\"a-b\":[46,93,94,95,106,197],\"aar\":[9],\"aba\":[155,156],\"abe\":[11,12,39,40,41,42,107,108,109,110,111,112,113],\"abi\":[142,143,144],\"ac \":[68],\"ace\":[0,3,8,25,26,27,28,30,31,43,44,88,89,90,105,187,194],\"aci\":[5,6,31,65,75,105,144,150,179,195],\"acn\":[170,171,172],\"aco\":[130],\"acr\":[7,35],\"act\":[34,86,99,110,111,112,113,129],\"acy\":[29],\"ad-\":[4,5,32,33],\"ada\":[172,199],\"adc\":[25,28],\"ade\":[22],\"adi\":[20,60,158,159],\"ado\":[0,30,71],\"adu\":[24],\"aer\":[37],\"afa\":[134],\"afi\":[168,198,199],\"age\":[11,104,105],\"ago\":[53,117,122,123],\"agu\":[66,67],\"aid\":[148,149,150],\"ain\":[0,1,2,3,25,26,28,30,31,148,149,150,155,156,157],\"al \":[17,18,21,22,34,56,57,58,59,72,73,74,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,163,164,165,166,167,168,169,180],\"ala\":[8,43,44,173,178,199],\"alb\":[13,50,115],\"alc\":[47,96,97,98,174,175],\"ale\":[36,51,116,172],\"alg\":[0,1,2,3,25,26,28,30,31,69,70,71,148,149,150,151,152,153,154,155,156,157],\"ali\":[31,57,105,156],\"all\":[19,20,60,61,62,158,159,160,161,162,189],\"alo\":[17,36,77,78,133,138],\"alp\":[144,146,197],\"als\":[91],\"alt\":[17,18,56,57,58,59,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147],\"ama\":[12,71,143,188],\"amb\":[84],\"amc\":[164],\"ame\":[22,38,72,182,183],\"ami\":[16,17,19,20,23,24,41,54,55,58,60,61,62,64,65,79,80,85,90,97,100,107,119,157,158,159,160,161,162,173,174,175,176,177,178,179,193],\"aml\":[47],\"amm\":[1,2,22,31,148,149,150],\"amo\":[0,3,4,5,13,25,26,28,30,32,33,50,115,123,186],\"amp\":[82],\"ams\":[197],\"amy\":[79],\"ana\":[0,1,2,3,25,26,28,30,31,37,69,70,71,148,149,150,151,152,153,154,155,156,157],\"anc\":[5,81],\"and\":[0,17,28,30,55,57,124,143,144,147,148,149,150],\"ane\":[24,64],\"ani\":[5,53],\"ann\":[47,96,97,98],\"ano\":[18,93,178],\"ans\":[121,125],\"ant\":[1,2,4,5,6,7,16,19,20,29,31,32,33,34,35,36,37,38,53,54,55,58,60,61,62,66,67,74,75,76,77,78,79,80,81,82,83,84,85,86,87,104,105,114,117,120,122,123,124,125,126,127,136,137,138,139,140,141,143,144,158,159,160,161,162,166,167,168,169,184,185,186,187,188,191,192,193,195],\"anx\":[17,18,57,59,145,146,147],\"any\":[153],\"anz\":[140],\"apa\":[28,97,172],\"ape\":[155],\"api\":[111,136,140,141],\"apr\":[8,43,44,148],\"apt\":[88],\"ara\":[0,3,25,26,28,30],\"arb\":[9,45,91,92,142,143,174,185],\"ard\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"arf\":[66,67],\"arg\":[110],\"ari\":[66,67,99,100],\"arm\":[8],\"aro\":[132],\"arr\":[16,54],\"art\":[9,45,91,92],\"ary\":[12,86],\"asc\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,179],\"ase\":[75],\"asm\":[126,127],\"aso\":[14,21,22,51,72,163,165,182,183],\"asp\":[1,31,105],\"ass\":[99,100],\"ast\":[10,13,14,15,16,20,50,51,52,53,54,55,101,102,103,117,120,121,122,123,124,125,126,127,128,129,130,131,196],\"ata\":[60,159],\"atc\":[153],\"ate\":[24,46,64,65,104,105,106,113,142,144,174,177,188,191],\"ath\":[155,156,157,192],\"ati\":[3,10,11,22,26,38,39,40,77,78,82,83,84,85,101,102,103,115,128,129,130,131,148,149,150,155,156,157,169,173,189,190,195],\"atm\":[170,171,172,196,198,199],\"ato\":[1,2,10,13,14,21,22,31,50,51,72,73,74,114,115,116,117,118,119,163,164,165,166,167,168,169,170,171,172,173],\"atr\":[114,115],\"aty\":[136,139,140,141],\"aug\":[5],\"ava\":[103],\"avu\":[5],\"axa\":[128,129,130,131],\"axi\":[134],\"axo\":[77],\"ayn\":[26],\"aza\":[18,136,192],\"aze\":[18,59,98,143,145,146,147],\"azi\":[7,42,49,83,85,108,160],\"azo\":[15,37,38,52,74,120,121,137,146,166,167],\"b c\":[23],\"b f\":[9,45,91,92],\"b v\":[23],\"b-c\":[23],\"b12\":[178],\"bac\":[34],\"bal\":[156,178],\"bam\":[143],\"ban\":[18],\"bap\":[155],\"bar\":[185],\"bay\":[6],\"baz\":[18],\"bec\":[51],\"ben\":[18,41,59,76,107,145,146,147,170],\"ber\":[82,83,84,85],\"bes\":[92],\"bet\":[11,12,22,39,40,41,42,46,72,93,94,95,106,107,108,109,110,111,112,113,165,183],\"bic\":[37,179],\"bil\":[142,143,144],\"bin\":[3,26,38,115,168],\"bio\":[4,5,6,7,29,32,33,34,35,36,37,38,75,76,77,78,79,80,81,82,83,84,85,86,87],\"bis\":[95,130],\"bit\":[8,15,27,43,44,52,88,89,90,120,121,151,185],\"blo\":[1,31,46,47,93,94,95,96,97,98,106,197],\"bon\":[142,174],\"bph\":[196,197],\"bro\":[4,5,13,32,33,50,114,115,118,119],\"bru\":[2],\"bud\":[116],\"bul\":[131],\"bup\":[2,3,26],\"but\":[13,50,84,115],\"c a\":[5,31,55,58,65,105,124,144,179],\"c b\":[114],\"c f\":[34,37,87],\"c g\":[68],\"c i\":[37],\"c p\":[153,155,156,157],\"c s\":[177,179],\"cal\":[21,22,47,72,73,96,97,98,136,139,140,141,163,164,165,173,174,175],\"cap\":[88],\"car\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,142,143,174],\"cas\":[14],\"cat\":[11,39,40,82,83,84,85,155,156,157,189,190,195],\"ce \":[8,27,43,44,88,89,90],\"ced\":[5],\"cef\":[77,78],\"cel\":[151],\"cem\":[194],\"cep\":[36,53,77,78,117,122,123],\"cer\":[0,30],\"cet\":[0,3,25,26,28,30,31,61,105,187],\"cha\":[47,96,97,98],\"chi\":[190],\"chl\":[19,49,62],\"cho\":[10,13,50,101,102,103,114,115,118,119,138,139,140,141,175],\"cid\":[5,31,65,105,144,179],\"cif\":[175],\"cil\":[4,5,32,33,34,75,76,195],\"cim\":[122],\"cin\":[6,7,35,79,80,81,82,126,150,164,190],\"cip\":[6,17],\"cit\":[17,133],\"ciu\":[47,96,97,98,174],\"cke\":[46,47,93,94,95,96,97,98,106,197],\"cla\":[5,41,42,107,108],\"cli\":[29,58,79],\"clo\":[18,51,55,74,75,104,127,147,149,165,193],\"cne\":[170,171,172],\"co-\":[25,28,38],\"coa\":[66,67],\"cob\":[178],\"cod\":[25,26,70,130,154],\"col\":[190],\"com\":[3,23,26,38,81,115],\"con\":[21,78,143,144,166,167,184,185,186,187,188],\"cop\":[11,81],\"cor\":[14,21,22,51,63,72,73,116,163,164,165,179,180,181,182,183],\"cos\":[14,21,22,51,63,68,72,73,79,80,116,163,164,165,180,181,182,183],\"cox\":[151],\"coz\":[9],\"cre\":[74,166,167,168,169],\"cro\":[7,35],\"ct \":[86],\"cte\":[34],\"cti\":[34,37,76,110,111,112,113],\"cto\":[99],\"ctr\":[4,5,32,33],\"ctu\":[129],\"cul\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,82,83,84,85,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"cya\":[178],\"cyc\":[29,58,127,193],\"cyl\":[31,105],\"d a\":[17,57,69,70,71,143,144,152,153,154],\"d b\":[5],\"d f\":[0,14,22,28,30,148,149,150],\"d h\":[194],\"d i\":[51,116,148,149,150],\"d m\":[195],\"d p\":[55,124],\"d s\":[142,143,144,147,175],\"d t\":[1,31],\"d-a\":[111],\"d-g\":[77,78],\"d-s\":[4,5,32,33],\"dal\":[199],\"dam\":[79],\"dan\":[125],\"dap\":[172],\"daz\":[37],\"dco\":[25,28],\"de \":[7,35,49,79,80,81],\"dei\":[25,26,70],\"den\":[198],\"dep\":[17,56,57,58,132,133,134,135,136,137],\"der\":[21,22,72,73,74,163,164,165,166,167,168,169,170,171,172,173],\"des\":[116,159],\"dex\":[182],\"dia\":[11,12,16,18,39,40,41,42,54,59,68,107,108,109,110,111,112,113,145,146,147],\"dic\":[11,39,40,82,83,84,85,126,127,149,155,156,157,189,190,195],\"dig\":[68],\"dil\":[13,50,98,114,115,118,119],\"din\":[20,53,60,122,123,152,158,159],\"dio\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"dip\":[47,96,161],\"dis\":[1],\"diu\":[16,48,49,99,100,144],\"dni\":[63,181],\"dog\":[104],\"dol\":[3,25,71,138],\"dom\":[124,150],\"don\":[124,137,139,154],\"dop\":[27],\"dox\":[29],\"dra\":[161],\"dro\":[20,49,60,73,158,159,162,180],\"duc\":[0,30],\"dul\":[135],\"dum\":[24],\"dyl\":[130],\"e 2\":[11,12,39,40,41,42],\"e a\":[6,7,29,35,79,80,81],\"e c\":[26],\"e d\":[49],\"e f\":[18,19,59,61,62,145,146,147],\"e i\":[8,27,43,44,88,89,90],\"e r\":[117,194],\"e s\":[65],\"e t\":[170,171,172],\"e-a\":[113],\"e-r\":[75],\"ea \":[12,41,42],\"eal\":[16,17,18,54,56,57,58,59,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147],\"eam\":[74,166,167,168,169],\"eat\":[170,171,172,196,198,199],\"eca\":[175],\"ece\":[53,117,122,123],\"ecl\":[51],\"eco\":[78,151],\"ect\":[4,5,32,33,34,37,76],\"ed \":[5],\"edi\":[11,39,40,82,83,84,85,96,113,155,156,157,189,190,195],\"edn\":[63,181],\"edu\":[0,30],\"ef \":[0,25,30],\"ef,\":[1,31],\"efl\":[15,52],\"eft\":[77],\"efu\":[78],\"ega\":[156],\"egu\":[112],\"ein\":[25,26,70],\"eiz\":[147],\"el \":[47,96,97,98],\"ele\":[104,105,151],\"elf\":[20],\"eli\":[0,1,2,3,25,26,28,30,31],\"elo\":[21],\"elu\":[117],\"eme\":[23,24,55,64,65,124,125,174,175,176,177,178,179,194],\"emi\":[24,48,64],\"en/\":[3,26],\"ena\":[8,19,20,43,44,149,158,198],\"enc\":[41,107],\"ene\":[77,78,117,172],\"enh\":[5,161],\"eni\":[32,33,34,62,75,76],\"enl\":[134],\"enn\":[128],\"eno\":[34,46,106,185],\"ens\":[8,9,27,43,44,45,46,47,91,92],\"ent\":[5,13,14,17,18,23,24,56,57,58,59,64,65,80,104,105,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,153,155,165,170,171,172,174,175,176,177,178,179,194,196,198,199],\"eny\":[184],\"enz\":[18,59,76,145,146,147,170],\"eop\":[118],\"epa\":[59,145,147],\"eph\":[36,77,78],\"epi\":[12,18,59,143,145,146,147],\"epl\":[194],\"epr\":[15,17,52,56,57,58,132,133,134,135,136,137],\"ept\":[53,81,117,122,123],\"er \":[0,28,30,46,47,51,143,144,197],\"era\":[16,54,77,78,97],\"erb\":[168],\"erc\":[82,83,84,85],\"erg\":[19,20,60,61,62,114,158,159,160,161,162],\"eri\":[27,34,124,138,139,196],\"erm\":[21,22,72,73,74,113,163,164,165,166,167,168,169,170,171,172,173],\"ero\":[10,14,21,22,37,51,63,72,73,101,102,103,116,163,164,165,170,175,180,181,182,183],\"err\":[24,64],\"ert\":[8,9,27,43,44,45,46,47,57,91,92],\"ery\":[35],\"es \":[11,39,40],\"esa\":[92],\"esc\":[133],\"esi\":[0,1,2,3,25,26,28,30,31,69,70,71,75,148,149,150,151,152,153,154,155,156,157],\"esl\":[159],\"eso\":[15,116],\"esp\":[13,14,50,51,114,115,116,117,118,119],\"ess\":[8,17,56,57,58,132,133,134,135,136,137,191,192,193],\"est\":[10,15,16,52,53,54,55,101,102,103,120,121,122,123,124,125,126,127,128,129,130,131],\"et \":[104,105],\"eta\":[0,3,21,22,25,26,28,30,46,72,93,94,95,106,163,165,183,187],\"ete\":[11,12,39,40,41,42,107,108,109,110,111,112,113],\"etf\":[11,39,40],\"eth\":[22,34,38,51,72,84,87,150,152,160,181,182,183,191],\"eti\":[48,49,55,56,61,99,100,122,124,125,132,135,141,171,187],\"eto\":[55,94,167],\"etr\":[29,37,125],\"ety\":[17,18,31,57,59,105,145,146,147],\"euk\":[117],\"eur\":[155,156,157],\"eve\":[0,14,28,30,187],\"evo\":[194],\"ex \":[23],\"exa\":[182,191],\"exi\":[15,36],\"exo\":[20,158],\"exu\":[27],\"eze\":[13],\"f a\":[0,30],\"f w\":[25],\"f, \":[1,31],\"fam\":[38,82,123],\"far\":[66,67],\"fas\":[20],\"fat\":[24,64,177],\"fax\":[134],\"fec\":[34,37],\"fed\":[96],\"fen\":[2,3,20,26,149,153,158],\"fer\":[24,64,175],\"fev\":[0,28,30],\"fex\":[20,158],\"fil\":[198,199],\"fin\":[168,196],\"fla\":[1,2,22,31,148,149,150],\"fli\":[14],\"flo\":[6],\"flu\":[6,14,15,52,56],\"fol\":[65],\"fon\":[12,41,42,107,108,109],\"for\":[8,9,10,11,12,13,14,15,17,18,19,22,24,27,34,37,39,40,41,42,43,44,45,46,47,50,51,52,56,57,59,61,62,64,87,91,92,101,102,103,131,132,133,134,135,145,146,147,148,149,150,173,196,197,198,199],\"ftr\":[77],\"fun\":[74,166,167,168,169],\"fur\":[48,78,86],\"g d\":[99,100],\"g i\":[110,111,112,113],\"g l\":[131,173],\"g-a\":[110],\"gab\":[155,156],\"gal\":[74,166,167,168,169],\"gas\":[15,16,52,53,54,55,120,121,122,123,124,125,126,127,128,129,130,131],\"gen\":[77,78,80,104,105],\"ges\":[0,1,2,3,25,26,28,30,31,69,70,71,148,149,150,151,152,153,154,155,156,157],\"gex\":[19],\"gic\":[114],\"gie\":[19,61,62],\"gin\":[110,186],\"gla\":[110],\"gli\":[12,41,42,107,108,109],\"glu\":[11],\"gly\":[68,80,81],\"gme\":[5],\"gon\":[53,117,122,123],\"gou\":[189,190],\"gox\":[68],\"gra\":[24],\"gre\":[104],\"gul\":[66,67,112],\"h c\":[25],\"h2 \":[53,122,123],\"ha-\":[197],\"hac\":[150],\"hag\":[11],\"hal\":[36,51,77,78,116,138],\"ham\":[84,193],\"han\":[5,47,96,97,98],\"har\":[8],\"has\":[22,51,72,182,183],\"haz\":[160],\"hea\":[16,17,18,54,56,57,58,59,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147],\"hen\":[19,34,62,161,184,185],\"heo\":[118],\"her\":[63,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199],\"hia\":[49],\"hib\":[8,15,27,43,44,52,88,89,90,120,121,151],\"hic\":[155,156,157,190],\"hid\":[152],\"hin\":[1,31,69,173],\"hio\":[192,195],\"hir\":[77],\"his\":[19,20,60,61,62,158,159,160,161,162],\"hiu\":[142],\"hlo\":[19,49,62],\"hma\":[13,14,50,51],\"hod\":[13,50,114,115,118,119],\"hol\":[10,101,102,103,114,175],\"hop\":[38,87],\"hor\":[112,194],\"hos\":[193],\"hot\":[138,139,140,141,191],\"hox\":[38],\"hro\":[7,35],\"hyd\":[49,73,161,162,180],\"hyl\":[34,118,119,181],\"hyo\":[126],\"hyp\":[8,9,27,43,44,45,46,47,91,92],\"hyr\":[194,195],\"i f\":[17,56,57,132,133,134,135],\"i-d\":[16,54],\"i-e\":[55,124,125],\"i-i\":[1,2,31],\"iab\":[11,12,39,40,41,42,107,108,109,110,111,112,113],\"iac\":[68],\"ial\":[34],\"iam\":[15,164],\"iap\":[141],\"iar\":[16,54],\"iat\":[113],\"iax\":[77],\"iaz\":[18,49,59,83,98,145,146,147],\"ibe\":[41,107],\"ibi\":[4,5,6,7,8,15,27,29,32,33,34,35,36,37,38,43,44,52,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,120,121,151],\"ibu\":[2,3,26],\"ic \":[5,31,34,37,55,58,65,87,105,114,124,144,153,155,156,157,179],\"ica\":[11,14,21,22,39,40,72,73,82,83,84,85,136,139,140,141,155,156,157,163,164,165,189,190,195],\"ich\":[114],\"ici\":[4,5,32,33,34,75,76,80,82,190],\"icl\":[42,108,149],\"ico\":[14,21,22,51,63,66,67,72,73,116,143,144,163,164,165,166,180,181,182,183,184,185,186,187,188],\"ics\":[0,1,2,3,4,5,6,7,25,26,28,29,30,31,32,33,34,35,36,37,38,69,70,71,75,76,77,78,79,80,81,82,83,84,85,86,87,148,149,150,151,152,153,154,155,156,157],\"icy\":[31,58,105,127],\"id \":[14,22,51,69,70,71,116,148,149,150,152,153,154,194,195],\"id-\":[111],\"ida\":[37],\"ide\":[7,12,14,16,35,41,42,48,49,54,55,58,68,79,80,81,85,100,107,108,109,116,136,137,170,193,196],\"idi\":[53,122,123,152],\"ido\":[104,124,138,139],\"ief\":[0,1,2,3,25,26,28,30,31],\"ien\":[117],\"ies\":[19,61,62],\"iet\":[17,18,57,59,145,146,147],\"ifa\":[82],\"ife\":[96,175],\"ifu\":[74,166,167,168,169],\"igi\":[186],\"igo\":[68],\"ihi\":[19,20,60,61,62,158,159,160,161,162],\"ila\":[13,50,114,115,118,119],\"ild\":[198],\"ili\":[142,143,144],\"ill\":[4,5,32,33,34,75,76],\"ilo\":[100],\"ilt\":[98],\"im/\":[38],\"ima\":[74],\"ime\":[12,38,78,87,122],\"imm\":[191,192,193],\"imo\":[16,38],\"imv\":[101],\"in \":[0,1,2,3,10,22,23,25,26,28,30,31,32,33,34,36,76,101,102,103,110,111,112,113,148,149,150,155,156,157,173,175,176,178,179],\"in/\":[5],\"ina\":[3,15,16,26,38,52,53,54,55,75,85,86,115,120,121,122,123,124,125,126,127,128,129,130,131,168,196],\"inc\":[79,177],\"ind\":[27,79,150],\"ine\":[18,19,20,25,26,29,47,53,55,56,57,58,59,60,61,62,69,70,96,110,114,118,119,122,123,124,126,127,132,134,135,136,140,141,143,145,146,147,152,157,158,159,160,161,162,168,173,186,190,192,194],\"inf\":[1,2,22,31,34,37,148,149,150],\"ing\":[99,100,110,111,112,113,131,173],\"inh\":[8,15,27,43,44,51,52,88,89,90,116,120,121,151],\"inj\":[76],\"inn\":[1,31],\"ino\":[6,80,89,119,164,171,189],\"ins\":[23,24,64,65,110,111,112,113,174,175,176,177,178,179],\"int\":[15,16,52,53,54,55,113,120,121,122,123,124,125,126,127,128,129,130,131],\"ioi\":[69,70,71,152,153,154],\"ion\":[3,8,9,11,14,17,22,26,27,34,37,38,39,40,43,44,45,46,47,56,57,76,77,78,82,83,84,85,91,92,115,132,133,134,135,148,149,150,155,156,157,173,189,190,195],\"iop\":[192],\"iot\":[4,5,6,7,29,32,33,34,35,36,37,38,75,76,77,78,79,80,81,82,83,84,85,86,87],\"iou\":[195],\"iov\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"iph\":[161],\"ipi\":[10,47,96,109],\"ipl\":[26,104,105],\"ipr\":[6,17,90,114,115],\"ips\":[138,139,140,141],\"ipt\":[58,157],\"ira\":[13,14,50,51,62,114,115,116,117,118,119,187,188],\"irb\":[92],\"ird\":[77],\"iri\":[1,12,31,61,105],\"iro\":[24,64,99],\"irr\":[173],\"irt\":[136],\"is \":[82,83,84,85],\"isa\":[130],\"isi\":[89],\"iso\":[63,73,83,95,180,181],\"isp\":[1,111,126,127,139],\"ist\":[19,20,53,60,61,62,75,117,122,123,158,159,160,161,162],\"ita\":[17,23,24,29,64,65,133,173,174,175,176,177,178,179,185],\"ith\":[7,25,142,195],\"iti\":[53],\"ito\":[8,10,15,27,43,44,52,88,89,90,120,121,151],\"itr\":[58,86,157],\"itu\":[82,83,84,85],\"ium\":[16,47,96,97,98,99,100,114,115,131,142,144,174],\"iur\":[48,49,99,100],\"ive\":[128,129,130,131],\"ivi\":[176],\"ixo\":[14],\"ize\":[142,143,144],\"izi\":[61,109],\"izu\":[147],\"jec\":[76],\"k-f\":[131],\"kas\":[117],\"ker\":[46,47,93,94,95,96,97,98,106,197],\"ket\":[167],\"kin\":[22,55,124,173],\"kot\":[117],\"l a\":[136,139,140,141],\"l b\":[47,96,97,98],\"l c\":[21,22,72,73,74,163,164,165,166,167,168,169,180],\"l h\":[17,18,56,57,58,59,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147],\"l i\":[34],\"l p\":[170],\"l/c\":[25,26],\"l/i\":[115],\"lac\":[99,129,194],\"laf\":[134,199],\"lam\":[1,2,22,31,41,107,146,148,149,150,173,178,186],\"lan\":[5,66,67,121,140],\"lap\":[8,43,44],\"lar\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112],\"lat\":[13,50,65,104,105,114,115,118,119],\"lav\":[5],\"lax\":[128,129,130,131],\"laz\":[42,108],\"lbu\":[13,50,115],\"lch\":[190],\"lci\":[47,96,97,98,174,175],\"lde\":[198],\"le \":[26],\"lec\":[151,175],\"lem\":[23,24,64,65,174,175,176,177,178,179],\"len\":[172],\"ler\":[19,20,51,60,61,62,116,158,159,160,161,162],\"les\":[10,101,102,103],\"let\":[104,105],\"leu\":[117],\"lev\":[187,194],\"lex\":[23,36],\"lfa\":[20,24,38,64,177],\"lfo\":[12,41,42,107,108,109],\"lge\":[0,1,2,3,25,26,28,30,31,69,70,71,148,149,150,151,152,153,154,155,156,157],\"lib\":[41,107],\"lic\":[31,42,58,65,105,108],\"lid\":[7,35],\"lie\":[0,1,2,3,25,26,28,30,31],\"lim\":[12],\"lin\":[4,5,29,32,33,34,57,58,75,76,79,110,111,112,113,114,118,119,156,157],\"lip\":[10,109],\"lis\":[89,111],\"lit\":[142],\"liu\":[131],\"lix\":[14],\"liz\":[142,143,144],\"lk-\":[131],\"lle\":[19,20,60,61,62,158,159,160,161,162],\"lli\":[4,5,32,33,34,75,76,118,119,131],\"llo\":[189],\"lob\":[18,165],\"loc\":[21,46,47,93,94,95,96,97,98,106,197],\"lod\":[47],\"lof\":[149],\"log\":[21,22,72,73,74,163,164,165,166,167,168,169,170,171,172,173],\"lol\":[46,93,94,95,106],\"lom\":[51,127],\"lon\":[6,110,147,164,181],\"loo\":[1,31,48],\"lop\":[16,17,54,55,104,133,138,189,193],\"lor\":[19,49,60,62,100,145,159],\"los\":[9,36,45,77,78,82,83,84,85,129,197],\"lot\":[74,173],\"lox\":[6,75,135],\"lpe\":[34,76],\"lph\":[197],\"lpr\":[144,146,181],\"lsa\":[31,91,105,143,144,184,185,186,187,188],\"lth\":[17,18,56,57,58,59,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,195],\"lti\":[98,176],\"luc\":[11],\"luk\":[117],\"luo\":[6,56],\"lur\":[12,41,42,107,108,109],\"lut\":[14],\"lux\":[15,52],\"lyc\":[68,80,81],\"m a\":[4,5],\"m c\":[47,96,97,98,142,174],\"m p\":[32,33],\"m s\":[174],\"m v\":[144],\"m-s\":[99,100],\"m/s\":[38],\"ma \":[14],\"mac\":[7,35],\"mad\":[71],\"map\":[8],\"mar\":[12],\"mat\":[1,2,21,22,31,72,73,74,148,149,150,163,164,165,166,167,168,169,170,171,172,173,188],\"max\":[7],\"maz\":[74,143],\"mbi\":[3,26,38,115],\"mbu\":[84],\"mci\":[164],\"med\":[11,39,40,82,83,84,85,113,155,156,157,189,190,195],\"men\":[5,17,18,23,24,56,57,58,59,64,65,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,170,171,172,174,175,176,177,178,179,194,196,198,199],\"mep\":[12,15,52],\"met\":[11,21,22,24,34,37,38,39,40,51,55,72,87,94,122,124,125,150,160,163,181,182,183,191],\"mia\":[24,64],\"mic\":[80,166],\"mid\":[16,41,48,54,55,79,85,107,193],\"mil\":[17,97,100],\"min\":[11,19,20,23,24,39,40,60,61,62,64,65,80,119,127,131,158,159,160,161,162,173,174,175,176,177,178,179],\"mip\":[90],\"mir\":[136],\"mit\":[58,157],\"mlo\":[47],\"mma\":[1,2,22,31,148,149,150],\"mmu\":[191,192,193],\"mod\":[16,126,127],\"mol\":[0,3,13,25,26,28,30,50,115],\"mom\":[21,163],\"mon\":[117,194],\"moo\":[142,143,144],\"mor\":[69],\"mot\":[123,186],\"mox\":[4,5,32,33,38],\"mp \":[15,52,120,121],\"mpe\":[124],\"mpi\":[82],\"mpl\":[23],\"msu\":[197],\"mul\":[176],\"mun\":[191,192,193],\"mva\":[101],\"myc\":[7,35,79,81],\"myp\":[3],\"n a\":[17,28,32,33,34,36,38,57,148,149,150],\"n b\":[23,115,178],\"n c\":[77,78,179],\"n d\":[175],\"n f\":[10,101,102,103,173],\"n g\":[110],\"n i\":[22,76,173],\"n l\":[111],\"n m\":[155,156,157],\"n n\":[113],\"n p\":[3,15,26,52,120,121],\"n r\":[0,1,2,3,25,26,30,31,112],\"n s\":[23,24,64,176],\"n v\":[34],\"n-d\":[20,60,158,159],\"n/c\":[5],\"n/p\":[3,26],\"nac\":[149],\"nad\":[0,20,30,158],\"nae\":[37],\"naf\":[168,198],\"nal\":[0,1,2,3,8,15,16,25,26,28,30,31,43,44,52,53,54,55,69,70,71,120,121,122,123,124,125,126,127,128,129,130,131,148,149,150,151,152,153,154,155,156,157],\"nam\":[19,85],\"nap\":[28,148],\"nar\":[86],\"nas\":[75,196],\"nat\":[3,26,38,115,142,174],\"naz\":[147,166,167],\"nc \":[177],\"nce\":[5],\"nch\":[13,50,114,115,118,119],\"ncl\":[41,107],\"nco\":[79,81],\"nd \":[0,17,28,30,55,57,124,143,144,147,148,149,150],\"nd-\":[78],\"nda\":[79,125],\"ndo\":[27,150],\"ne \":[6,18,19,29,59,61,62,117,145,146,147,170,171,172,194],\"nel\":[47,96,97,98],\"nem\":[24,64],\"ner\":[1,31,77,78,114],\"net\":[55,124],\"neu\":[155,156,157],\"nex\":[15],\"nfe\":[34,37],\"nfl\":[1,2,22,31,148,149,150],\"ng \":[99,100,110,111,112,113,131,173],\"ng-\":[110],\"nga\":[74,166,167,168,169],\"nha\":[5,51,116],\"nhi\":[8,15,27,43,44,52,88,89,90,120,121,151],\"nhy\":[161],\"nia\":[83],\"nic\":[5,32,33,34,75,76],\"nid\":[37,116],\"nif\":[96],\"nir\":[62],\"nis\":[53,63,117,122,123,181],\"nit\":[53,86],\"nje\":[76],\"nla\":[134],\"nna\":[128],\"nne\":[1,31,47,96,97,98],\"nob\":[185],\"noc\":[178],\"nog\":[80],\"noi\":[171],\"nol\":[6,18,46,93,99,106,164,189],\"non\":[20,60,158,159],\"nop\":[89,119],\"nos\":[191,192,193],\"nox\":[34],\"nph\":[113],\"nri\":[134,135],\"nsa\":[148,149,150],\"nse\":[125],\"nsi\":[8,9,27,43,44,45,46,47,91,92],\"nso\":[121],\"nsu\":[110,111,112,113],\"nt \":[24,64,75,165,196,198,199],\"nta\":[17,18,53,56,57,58,59,80,117,122,123,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,153],\"nte\":[13,15,16,52,53,54,55,113,117,120,121,122,123,124,125,126,127,128,129,130,131],\"nti\":[1,2,4,5,6,7,14,16,19,20,29,31,32,33,34,35,36,37,38,54,55,58,60,61,62,66,67,74,75,76,77,78,79,80,81,82,83,84,85,86,87,104,105,114,124,125,126,127,136,137,138,139,140,141,143,144,155,158,159,160,161,162,166,167,168,169,184,185,186,187,188,195],\"nto\":[86,120],\"nvu\":[143,144,184,185,186,187,188],\"nxi\":[17,18,57,59,145,146,147],\"nyl\":[12,41,42,107,108,109,153],\"nys\":[169],\"nyt\":[184],\"nza\":[140],\"nzo\":[18,59,145,146,147,170],\"nzy\":[76],\"o-d\":[25],\"o-g\":[24],\"o-n\":[28],\"o-t\":[38],\"oad\":[4,5,32,33],\"oag\":[66,67],\"oat\":[144],\"oba\":[6,18,178,185],\"obe\":[165],\"obi\":[37],\"och\":[49],\"ock\":[46,47,93,94,95,96,97,98,106,197],\"ocl\":[55],\"oco\":[21,73,167,178,180],\"od \":[1,31,142,143,144],\"ode\":[25,26,70],\"odi\":[13,16,18,47,50,59,114,115,118,119,126,127,144,145,146,147],\"odo\":[3,137,154],\"ody\":[130],\"ofe\":[2,3,20,26,149,158],\"ofl\":[6],\"ofu\":[86],\"ogl\":[80],\"ogr\":[104],\"ogy\":[21,22,72,73,74,163,164,165,166,167,168,169,170,171,172,173],\"oic\":[144],\"oid\":[14,21,22,51,63,69,70,71,72,73,116,152,153,154,163,164,165,180,181,182,183,194,195],\"oin\":[15,16,52,53,54,55,86,120,121,122,123,124,125,126,127,128,129,130,131,171,184],\"oki\":[55,124],\"ol/\":[25,26,115],\"ola\":[65,99,140,146],\"olc\":[190],\"ole\":[10,15,37,38,52,74,101,102,103,120,121,166,167,175],\"oli\":[7,35,65,114],\"olo\":[6,21,22,46,72,73,74,93,94,95,106,163,164,165,166,167,168,169,170,171,172,173,181],\"oma\":[7],\"omb\":[3,26,38,115],\"ome\":[15,21,51,52,150,160,163],\"omi\":[127],\"omp\":[23,124],\"omy\":[7,35,81],\"on \":[3,15,17,24,26,38,52,57,64,77,78,115,120,121,173],\"on-\":[20,60,158,159],\"ona\":[142,147,166,167,174],\"onc\":[13,50,114,115,118,119],\"ond\":[78,125],\"one\":[6,14,21,22,51,63,72,73,77,99,124,137,139,154,163,164,180,181,182,183,194],\"ong\":[110],\"oni\":[37,53,83,116,117,122,123],\"ono\":[99],\"ons\":[34,37],\"ont\":[117],\"onv\":[143,144,184,185,186,187,188],\"ony\":[12,41,42,107,108,109],\"ood\":[1,31,142,143,144],\"oop\":[48],\"oot\":[173],\"op \":[48],\"opa\":[26,155,156,157],\"ope\":[16,54,81,138],\"oph\":[11,118,119,193],\"opi\":[21,22,69,70,71,72,73,104,114,115,152,153,154,163,164,165,188],\"opr\":[17,27,38,55,87,88,89,93,94,95,120,121,133,192],\"opu\":[189],\"opy\":[195],\"oqu\":[6],\"or \":[8,9,10,12,13,14,15,17,18,19,22,24,27,34,37,41,42,43,44,45,46,47,50,51,52,53,56,57,59,61,62,64,87,91,92,101,102,103,117,122,123,132,133,134,135,145,146,147,148,149,150,173,196,197,198,199],\"ora\":[60,145,159,180],\"orb\":[179],\"ori\":[36,77,78,100],\"orm\":[11,39,40,131,194],\"oro\":[6,49],\"orp\":[19,62,69],\"ort\":[14,21,22,51,63,72,73,112,116,163,164,165,180,181,182,183],\"orv\":[10],\"ory\":[1,2,13,14,31,50,51,114,115,116,117,118,119],\"osa\":[9,45,79],\"osc\":[126],\"ose\":[48,129],\"osi\":[68,80,82,83,84,85,197],\"osp\":[36,77,78,193],\"ost\":[14,21,22,51,63,72,73,116,163,164,165,180,181,182,183],\"osu\":[102,191,192,193],\"ota\":[99,100],\"ote\":[165],\"oth\":[49,63,173,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199],\"oti\":[4,5,6,7,14,29,32,33,34,35,36,37,38,75,76,77,78,79,80,81,82,83,84,85,86,87,123,138,139,140,141,173],\"oto\":[15,52,120,121],\"otr\":[74,117,186,191],\"our\":[195],\"ous\":[24,64],\"out\":[189,190],\"ova\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"ows\":[20,60,158,159],\"ox-\":[151],\"oxa\":[6,38,75],\"oxe\":[56,132,135,148],\"oxi\":[4,5,29,32,33,68,78,151,170,194],\"oxy\":[29,34,154,162],\"oyl\":[170],\"oza\":[9],\"p d\":[48],\"p i\":[15,52,120,121],\"pai\":[0,1,2,3,25,26,28,30,31,148,149,150,155,156,157],\"pal\":[172],\"pam\":[28,59,97,145,147],\"pan\":[0,30,120],\"par\":[0,3,25,26,28,30,99,100,132],\"pas\":[126,127],\"pat\":[153,155,156,157],\"pay\":[26],\"pe \":[11,12,39,40,41,42],\"pec\":[4,5,32,33],\"pen\":[32,33,34,75,76,155],\"pep\":[81],\"per\":[8,9,16,27,43,44,45,46,47,54,91,92,124,138,139,170],\"pet\":[152],\"pha\":[8,11,36,77,78,193,197],\"phe\":[19,34,62,161,184,185],\"phi\":[69],\"pho\":[193],\"phy\":[118,119],\"pic\":[21,22,72,73,82,136,139,140,141,163,164,165],\"pid\":[104,111],\"pin\":[18,47,59,96,136,140,141,143,145,146,147],\"pio\":[69,70,71,152,153,154],\"pir\":[1,12,13,14,31,50,51,99,105,114,115,116,117,118,119,188],\"pit\":[10],\"piu\":[114,115],\"piz\":[109],\"pla\":[104,105,194],\"ple\":[23,24,26,64,65,174,175,176,177,178,179],\"por\":[36,77,78],\"pot\":[99,100,165],\"ppl\":[23,24,64,65,174,175,176,177,178,179],\"ppr\":[191,192,193],\"pra\":[15,17,52,55,93,103,114,115,120,121,133,146],\"pre\":[8,14,17,27,56,57,58,63,132,133,134,135,136,137,156,181,191,192,193],\"pri\":[1,8,27,38,43,44,87,88,89,90,192],\"pro\":[2,3,6,15,26,52,55,93,94,95,111,120,121,124,144,148,160,195],\"psy\":[131,138,139,140,141],\"pti\":[81],\"pto\":[53,88,117,122,123],\"pty\":[58,157],\"pum\":[15,52,120,121],\"pur\":[189],\"pyl\":[195],\"pyr\":[85],\"que\":[141],\"qui\":[6],\"r a\":[13,14,18,19,24,37,50,51,53,59,61,62,64,117,122,123,143,144,145,146,147],\"r b\":[34,196,197],\"r c\":[10,101,102,103],\"r d\":[17,56,57,132,133,134,135],\"r e\":[198,199],\"r f\":[8,13,15,27,43,44,46,47,50,51,52,197],\"r h\":[8,9,27,43,44,45,46,47,91,92],\"r p\":[148,149,150],\"r r\":[0,15,28,30,52],\"r s\":[22,173],\"r t\":[12,41,42],\"r u\":[87],\"rac\":[0,3,25,26,28,29,30,86,187,195],\"rad\":[24],\"ral\":[57,180],\"ram\":[16,17,54,55,62,71,90,133,161,188],\"ran\":[53,86,93],\"rap\":[97,111],\"rat\":[13,14,50,51,60,77,78,114,115,116,117,118,119,159],\"rav\":[103],\"raz\":[15,52,85,120,121,137,145,146],\"rb \":[9,45,91,92],\"rba\":[18,143],\"rbe\":[92],\"rbi\":[168,179,185],\"rbo\":[142,174],\"rcu\":[82,83,84,85],\"rd-\":[77],\"rdi\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"rea\":[12,41,42,74,107,108,109,166,167,168,169,170,171,172,196,198,199],\"rec\":[53,117,122,123],\"red\":[0,30,63,181],\"ref\":[15,52],\"reg\":[112,156],\"rel\":[0,1,2,3,25,26,28,30,31,104],\"rep\":[194],\"res\":[8,13,14,17,50,51,56,57,58,75,114,115,116,117,118,119,132,133,134,135,136,137,147,191,192,193],\"ret\":[48,49,99,100,171],\"rev\":[14],\"rex\":[27,191],\"rfa\":[66,67],\"rge\":[19],\"rgi\":[19,61,62,110,114],\"rgy\":[19,20,60,61,62,158,159,160,161,162],\"rhe\":[16,54],\"ri \":[17,56,57,132,133,134,135],\"ria\":[34,77,164],\"ric\":[58],\"rid\":[12,100,124,138,139,196],\"rie\":[117],\"rif\":[82],\"rig\":[186],\"ril\":[8,27,43,44,88,89,90],\"rim\":[38,74,87],\"rin\":[1,27,31,36,66,67,77,78,86,99,100,105,189,192],\"rip\":[26,58,157],\"ris\":[139],\"rit\":[173],\"riz\":[61],\"rma\":[8,21,22,72,73,74,163,164,165,166,167,168,169,170,171,172,173],\"rme\":[113],\"rmi\":[11,39,40,131],\"rmo\":[194],\"ro-\":[24],\"roa\":[4,5,32,33,144],\"rob\":[6,37],\"roc\":[49,73,180],\"rod\":[3],\"rof\":[2,3,6,26,86],\"roi\":[14,15,16,21,22,51,52,53,54,55,63,72,73,116,120,121,122,123,124,125,126,127,128,129,130,131,144,163,164,165,180,181,182,183,194,195],\"rok\":[55,124],\"rol\":[7,10,35,94,95,101,102,103,175],\"rom\":[7,35,160],\"ron\":[13,24,37,50,64,99,114,115,118,119,125],\"rop\":[93,114,115,155,156,157,195],\"roq\":[6],\"ros\":[48,102],\"rot\":[15,49,52,120,121],\"rou\":[24,64],\"row\":[20,60,158,159],\"rox\":[78,132,148,162,170,194],\"rph\":[19,62,69],\"rrh\":[16,54],\"rri\":[173],\"rro\":[24,64],\"rt-\":[112],\"rta\":[9,45,91,92,136],\"rte\":[8,9,27,43,44,45,46,47,91,92],\"rti\":[14,21,22,51,63,72,73,116,163,164,165,180,181,182,183],\"rtr\":[57],\"ruf\":[2],\"rum\":[4,5,32,33],\"rva\":[10],\"ry \":[2,86],\"ry,\":[1,31],\"ryl\":[12],\"ryt\":[35],\"s m\":[11,39,40,82,83,84,85],\"s s\":[24,64],\"sac\":[130],\"sai\":[148,149,150],\"sal\":[13,31,50,105,115],\"sam\":[79],\"san\":[58,136,137,143,144,184,185,186,187,188,191,192,193],\"sar\":[9,45,91,92],\"sci\":[126,133],\"sco\":[179],\"scu\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"se-\":[75],\"sec\":[78],\"sei\":[147],\"sem\":[48],\"sen\":[128],\"ser\":[57],\"set\":[125],\"sho\":[112],\"sic\":[0,1,2,3,25,26,28,30,31,69,70,71,148,149,150,151,152,153,154,155,156,157],\"sid\":[68,80],\"sil\":[198],\"sim\":[101],\"sin\":[89,197],\"sio\":[8,9,17,27,43,44,45,46,47,56,57,91,92,132,133,134,135],\"sis\":[75,82,83,84,85],\"siu\":[99,100],\"ski\":[22,173],\"slo\":[159],\"smo\":[126,127],\"snr\":[134,135],\"sod\":[144],\"sol\":[165,181],\"som\":[15],\"son\":[14,21,22,51,63,72,73,83,116,163,180,182,183],\"soo\":[173],\"sop\":[95,121],\"spa\":[99,100,126,127],\"spe\":[4,5,32,33,139],\"sph\":[193],\"spi\":[1,13,14,31,50,51,99,105,114,115,116,117,118,119],\"spo\":[36,77,78],\"spr\":[1,111],\"sri\":[17,56,57,132,133],\"ssa\":[58,136,137,191,192,193],\"ssi\":[17,56,57,99,100,132,133,134,135],\"ssr\":[17,56,57,132,133],\"sta\":[10,19,20,60,61,62,75,101,102,103,142,143,144,158,159,160,161,162,169],\"ste\":[10,14,21,22,51,63,72,73,101,102,103,116,163,164,165,180,181,182,183,196],\"sth\":[13,14,50,51],\"sti\":[15,16,52,53,54,55,120,121,122,123,124,125,126,127,128,129,130,131],\"sto\":[26],\"str\":[15,16,52,53,54,55,120,121,122,123,124,125,126,127,128,129,130,131],\"sul\":[12,24,38,41,42,64,107,108,109,110,111,112,113,177,197],\"sup\":[23,24,64,65,174,175,176,177,178,179,191,192,193],\"suv\":[102],\"sy \":[20,60,158,159],\"syc\":[138,139,140,141],\"syl\":[131],\"t a\":[86,104,105],\"t f\":[24,64,196,198,199],\"t m\":[189,190],\"t p\":[75],\"t t\":[165],\"t-a\":[112],\"ta-\":[46,93,94,95,106],\"tab\":[142,143,144],\"tad\":[22,60,159,199],\"tag\":[53,117,122,123],\"tal\":[17,18,56,57,58,59,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,185],\"tam\":[0,3,13,19,20,22,23,24,25,26,28,30,50,60,61,62,64,65,72,80,115,158,159,160,161,162,174,175,176,177,178,179,183,187,197],\"tan\":[9,45,75,91,92,153],\"tar\":[29],\"tas\":[21,99,100,163,165],\"tat\":[10,101,102,103,169,173],\"taz\":[136],\"tch\":[153],\"te \":[65],\"te-\":[113],\"tel\":[20,104,105,117],\"ten\":[8,9,27,43,44,45,46,47,91,92,106,165],\"ter\":[10,14,21,22,34,51,63,72,73,101,102,103,113,116,163,164,165,168,180,181,182,183,196],\"tes\":[11,12,15,16,39,40,41,42,52,53,54,55,107,108,109,110,111,112,113,120,121,122,123,124,125,126,127,128,129,130,131],\"tet\":[29],\"tez\":[13],\"tfo\":[11,39,40],\"th \":[25],\"tha\":[22,51,72,84,150,160,182,183],\"the\":[63,118,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199],\"thi\":[1,31,49,77,142,152,155,156,157,173,192,195],\"thm\":[13,14,50,51],\"tho\":[38,87,191],\"thr\":[7,35],\"thy\":[34,181,194,195],\"ti-\":[1,2,16,31,54,55,124,125],\"tia\":[98,141],\"tib\":[4,5,6,7,29,32,33,34,35,36,37,38,75,76,77,78,79,80,81,82,83,84,85,86,87],\"tic\":[4,5,6,7,14,21,22,29,32,33,34,35,36,37,38,48,49,51,55,63,66,67,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,99,100,114,116,124,125,138,139,140,141,143,144,163,164,165,180,181,182,183,184,185,186,187,188],\"tid\":[14,53,58,81,122,123,136,137],\"tif\":[74,166,167,168,169],\"tih\":[19,20,60,61,62,158,159,160,161,162],\"tin\":[5,10,15,16,52,53,54,55,56,101,102,103,110,111,112,113,120,121,122,123,124,125,126,127,128,129,130,131,132,135,155,169,171],\"tio\":[3,11,14,22,26,34,37,38,39,40,76,77,78,82,83,84,85,115,148,149,150,155,156,157,173,189,190,195],\"tip\":[104,105,138,139,140,141],\"tir\":[61,187],\"tis\":[73,126,127,180],\"tit\":[82,83,84,85,195],\"tiv\":[128,129,130,131,176],\"tme\":[170,171,172,196,198,199],\"toc\":[55,167],\"toi\":[86,184],\"tol\":[21,22,72,73,74,84,163,164,165,166,167,168,169,170,171,172,173],\"ton\":[15,52,99,120,121],\"top\":[21,22,26,72,73,88,94,120,163,164,165,188],\"tor\":[1,2,8,10,13,14,15,27,31,43,44,50,51,52,53,88,89,90,114,115,116,117,118,119,120,121,122,123,151],\"tra\":[29,57,71,86,137],\"tre\":[170,171,172,191,196,198,199],\"tri\":[26,38,58,74,77,87,117,157,164,186],\"tro\":[15,16,37,52,53,54,55,86,114,115,120,121,122,123,124,125,126,127,128,129,130,131],\"tru\":[4,5,32,33],\"tub\":[82,83,84,85],\"tul\":[129],\"ty \":[147],\"tyl\":[31,58,105,157],\"typ\":[11,12,39,40,41,42,136,139,140,141],\"ube\":[82,83,84,85],\"uce\":[0,30],\"uco\":[11],\"ude\":[116],\"uet\":[141],\"ufe\":[2],\"ugm\":[5],\"uin\":[6],\"uka\":[117],\"uko\":[117],\"ula\":[5,8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112],\"ulf\":[12,24,38,41,42,64,107,108,109,177],\"uli\":[110,111,112,113],\"ulk\":[131],\"ulo\":[82,83,84,85,129,135,197],\"uls\":[143,144,184,185,186,187,188],\"ult\":[176],\"um \":[4,5,32,33,47,96,97,98,142,144,174],\"um-\":[99,100],\"ume\":[24],\"ump\":[15,52,120,121],\"ung\":[74,166,167,168,169],\"uno\":[191,192,193],\"uor\":[6],\"uox\":[56],\"upp\":[23,24,64,65,174,175,176,177,178,179,191,192,193],\"upr\":[2,3,26],\"ura\":[86,195],\"urb\":[18],\"ure\":[12,41,42,48,49,99,100,107,108,109,147],\"uri\":[86,189],\"uro\":[48,78,155,156,157],\"us \":[24,64],\"ut \":[189,190],\"uta\":[13,50,115],\"uti\":[14,87],\"uto\":[84],\"uva\":[102],\"val\":[91,144],\"van\":[81],\"vas\":[8,9,10,27,43,44,45,46,47,48,49,66,67,68,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106],\"ven\":[13,14,134],\"ver\":[0,28,30,97],\"vet\":[187],\"vit\":[23,24,64,65,174,175,176,177,178,179],\"vot\":[194],\"vul\":[5,143,144,184,185,186,187,188],\"war\":[66,67],\"wit\":[25],\"wsy\":[20,60,158,159],\"x v\":[23],\"x-2\":[151],\"xac\":[6,75],\"xam\":[182],\"xat\":[128,129,130,131,191],\"xaz\":[38],\"xen\":[148],\"xet\":[56,132,135],\"xia\":[15],\"xib\":[151],\"xic\":[4,5,32,33],\"xid\":[170],\"xie\":[17,18,57,59,145,146,147],\"xil\":[4],\"xim\":[78],\"xin\":[36,68,134,194],\"xit\":[29],\"xof\":[20,158],\"xon\":[77],\"xot\":[14],\"xum\":[27],\"xyc\":[29,154],\"xym\":[34],\"xyz\":[162],\"y a\":[20,60,147,158,159],\"y p\":[2],\"y t\":[86],\"y, \":[1,31],\"yan\":[178],\"ych\":[138,139,140,141],\"yci\":[7,35,79,81],\"ycl\":[29,58,127,193],\"yco\":[68,80,81,154],\"ycy\":[29],\"ydr\":[49,73,161,162,180],\"yl \":[170],\"yli\":[31,58,105,157],\"yll\":[118,119,131],\"ylp\":[34,76,181],\"yls\":[31,105],\"ylt\":[195],\"ylu\":[12,41,42,107,108,109],\"yme\":[34],\"yne\":[26],\"yos\":[126],\"ype\":[8,9,11,12,27,39,40,41,42,43,44,45,46,47,91,92],\"ypi\":[136,139,140,141],\"ypr\":[3],\"yra\":[85],\"yro\":[194,195],\"yst\":[169],\"yth\":[35],\"yto\":[184],\"yzi\":[162],\"zaa\":[9],\"zam\":[18],\"zap\":[136,140],\"zat\":[192],\"zem\":[98],\"zep\":[18,59,143,145,146,147],\"zer\":[142,143,144],\"zid\":[42,49,83,108,109],\"zin\":[61,85,160,162,177],\"zit\":[7],\"zod\":[18,59,137,145,146,147],\"zol\":[15,37,38,52,74,120,121,146,166,167],\"zoy\":[170],\"zur\":[147],\"zyl\":[76]}}");
@@ -1,6 +1,10 @@
 // South African Medication Formulary Service
 // Based on South African Essential Medicines List (EML) and common prescriptions
 
+import { SA_FORMULARY_2024_SHARDED, SA_MEDICATIONS_2024 } from './saFormulary2024.generated';
+import { SA_FORMULARY_SEARCH_INDEX, type FormularySearchIndex } from './saFormularySearchIndex.generated';
+import { loadAllFormularyShards, loadFormularySearchIndex } from './formularyShards';
+
 export interface SAMedication {
   id: string;
   brandName: string;
@@ -2525,26 +2529,129 @@ export const SA_MEDICATIONS: SAMedication[] = [
     description: 'Treatment for ED',
     commonDosage: '20mg',
     commonFrequency: 'As needed'
-  }
+  },
+
+  // 2024 Formulary Medications (generated by scripts/integrate-medications.py)
+  ...SA_MEDICATIONS_2024
 ];
 
 // Search and filter functions
-export function searchMedications(query: string): SAMedication[] {
-  const lowerQuery = query.toLowerCase().trim();
-  
-  if (!lowerQuery) {
-    return SA_MEDICATIONS;
+
+// The generated index is only used while it lines up entry for entry with
+// SA_MEDICATIONS; after a hand edit, search falls back to a full scan until
+// scripts/integrate-medications.py regenerates it.
+let searchIndex: FormularySearchIndex | null = null;
+
+function adoptSearchIndex(index: FormularySearchIndex | null): void {
+  searchIndex =
+    index !== null &&
+    index.ids.length === SA_MEDICATIONS.length &&
+    index.ids.every((id, i) => SA_MEDICATIONS[i].id === id)
+      ? index
+      : null;
+}
+
+adoptSearchIndex(SA_FORMULARY_SEARCH_INDEX);
+
+let formularyLoad: Promise<SAMedication[]> | null = null;
+
+// When the 2024 entries are sharded (integrate-medications.py --format shards)
+// the bundle only holds the curated entries; this fetches the shards and their
+// search index once and appends them. Resolves to the complete SA_MEDICATIONS.
+export function loadFormulary(): Promise<SAMedication[]> {
+  if (!SA_FORMULARY_2024_SHARDED) {
+    return Promise.resolve(SA_MEDICATIONS);
   }
-  
-  return SA_MEDICATIONS.filter(med => 
+  if (!formularyLoad) {
+    formularyLoad = Promise.all([loadAllFormularyShards(), loadFormularySearchIndex()])
+      .then(([medications, index]) => {
+        SA_MEDICATIONS.push(...medications);
+        adoptSearchIndex(index);
+        return SA_MEDICATIONS;
+      })
+      .catch(error => {
+        formularyLoad = null;
+        throw error;
+      });
+  }
+  return formularyLoad;
+}
+
+function matchesQuery(med: SAMedication, lowerQuery: string): boolean {
+  return (
     med.brandName.toLowerCase().includes(lowerQuery) ||
     med.genericName.toLowerCase().includes(lowerQuery) ||
     med.category.toLowerCase().includes(lowerQuery) ||
     med.description.toLowerCase().includes(lowerQuery) ||
-    (med.nappiCode && med.nappiCode.includes(lowerQuery))
+    (med.nappiCode !== undefined && med.nappiCode.includes(lowerQuery))
   );
 }
 
+// Elements of `small` also present in `large`; both ascending
+function intersectSorted(small: number[], large: number[]): number[] {
+  const result: number[] = [];
+  let low = 0;
+  for (const value of small) {
+    let high = large.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (large[mid] < value) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    if (low === large.length) {
+      break;
+    }
+    if (large[low] === value) {
+      result.push(value);
+    }
+  }
+  return result;
+}
+
+// Positions of entries containing every trigram of the query
+function indexCandidates(index: FormularySearchIndex, lowerQuery: string): number[] {
+  const grams = new Set<string>();
+  for (let i = 0; i + 3 <= lowerQuery.length; i++) {
+    grams.add(lowerQuery.slice(i, i + 3));
+  }
+
+  const postings = Array.from(grams, gram => index.trigrams[gram] ?? []);
+  postings.sort((a, b) => a.length - b.length);
+
+  let candidates = postings[0];
+  for (let i = 1; i < postings.length && candidates.length > 0; i++) {
+    candidates = intersectSorted(candidates, postings[i]);
+  }
+  return candidates;
+}
+
+export function searchMedications(query: string): SAMedication[] {
+  const lowerQuery = query.toLowerCase().trim();
+  
+  if (!lowerQuery) {
+    return SA_MEDICATIONS;
+  }
+
+  const index = searchIndex;
+  if (!index) {
+    return SA_MEDICATIONS.filter(med => matchesQuery(med, lowerQuery));
+  }
+
+  const { haystacks } = index;
+
+  // Queries shorter than a trigram scan the pre-lowercased fields
+  const positions = lowerQuery.length < 3
+    ? haystacks.map((_, i) => i)
+    : indexCandidates(index, lowerQuery);
+
+  return positions
+    .filter(i => haystacks[i].includes(lowerQuery))
+    .map(i => SA_MEDICATIONS[i]);
+}
+
 export function getMedicationsByCategory(category: string): SAMedication[] {
   if (!category || category === 'all') {
     return SA_MEDICATIONS;